@@ -0,0 +1,53 @@
+import io
+
+import streamlit as st
+
+# 종이 답안지 채점 (선생님용)
+#   streamlit run answer_sheets.py
+# (student, game, question, answer) 열이 있는 CSV/엑셀 파일을 올리면 engine.grading이
+# 청크 단위로 채점하고, 학생별 점수와 행별 채점 결과 파일을 돌려줍니다.
+# engine.grading은 pandas를 불러오므로 이 페이지를 열 때만 불러옵니다. (app.py 첫 화면에는 pandas가 없습니다)
+EXAMPLE = "student,game,question,answer\n민수,number-pattern,A1,13\n민수,weather,R3_맑구름반복,☀️\n지아,price,1,500\n"
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def grade_upload(data, filename):
+    """같은 파일을 다시 그릴 때는 채점하지 않습니다. (파일 내용이 캐시 키)"""
+    from engine.grading import grade_file
+    return grade_file(io.BytesIO(data), filename)
+
+
+def answer_sheets_page():
+    from engine.grading import COLUMNS, GAMES, to_csv_bytes
+
+    st.set_page_config(layout="centered")
+    st.title("📝 답안지 채점")
+    st.markdown(f"열: `{'`, `'.join(COLUMNS)}`  ·  게임: `{'`, `'.join(GAMES)}`")
+    st.caption("숫자 추론은 문제 ID(A1, F1, N123 …), 날씨 추론은 패턴 이름, 가격 추론은 단계 번호를 적어 주세요. "
+               "날씨 답은 이모지, 이름(맑음/비/구름), 코드(0/1/2) 모두 됩니다.")
+    st.download_button("예시 파일 받기", EXAMPLE.encode('utf-8-sig'), "answer_sheet_example.csv", "text/csv")
+
+    upload = st.file_uploader("답안지 (CSV 또는 엑셀)", type=['csv', 'xlsx', 'xls'])
+    if upload is None:
+        return
+    try:
+        with st.spinner("채점하는 중…"):
+            rows, scores = grade_upload(upload.getvalue(), upload.name)
+    except ValueError as error:
+        st.error(str(error))
+        return
+
+    unknown = int(rows['correct_answer'].isna().sum())
+    st.success(f"{len(rows):,}개 답안 중 {int(rows['is_correct'].sum()):,}개 정답")
+    if unknown:
+        st.warning(f"게임이나 문제를 찾을 수 없는 답안 {unknown:,}개는 오답으로 처리했어요.")
+
+    st.subheader("학생별 점수")
+    st.dataframe(scores, hide_index=True)
+    col1, col2 = st.columns(2)
+    col1.download_button("📥 학생별 점수", to_csv_bytes(scores), "scores.csv", "text/csv")
+    col2.download_button("📥 행별 채점 결과", to_csv_bytes(rows), "graded.csv", "text/csv")
+
+
+if __name__ == "__main__":
+    answer_sheets_page()
@@ -0,0 +1,46 @@
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+import streamlit as st
+
+# 세 게임을 하나의 Streamlit 프로세스에서 여러 페이지로 제공합니다.
+#   streamlit run app.py
+# 게임마다 세션 상태를 자기 키(number_pattern_state, weather_state, price_state)의
+# 상태 객체 하나에만 저장하므로 같은 세션에서 페이지를 옮겨 다녀도 점수가 섞이지 않습니다.
+APP_DIR = Path(__file__).resolve().parent
+
+
+def load_game(filename, module_name):
+    """하이픈이 들어간 파일도 불러올 수 있도록 경로로 게임 모듈을 한 번만 불러옵니다."""
+    if module_name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(module_name, APP_DIR / filename)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[module_name]
+
+
+number_game = load_game('number-pattern.py', 'number_pattern_page')
+weather_game = load_game('weather.py', 'weather_page')
+price_game = load_game('price.py', 'price_page')
+
+pages = [
+    st.Page(number_game.pattern_robot_web_game, title="숫자 추론 AI", icon="🤖",
+            url_path="pattern-number", default=True),
+    st.Page(weather_game.pattern_robot_web_game, title="날씨 트렌드 추론 AI", icon="☀️",
+            url_path="weather"),
+    st.Page(price_game.basket_game, title="가격 추론 훈련 AI", icon="💰",
+            url_path="price-predict"),
+]
+classroom_page = load_game('classroom.py', 'classroom_page')
+pages.append(st.Page(classroom_page.classroom_page, title="수업 모드", icon="🏫", url_path="classroom"))
+answer_sheets_page = load_game('answer_sheets.py', 'answer_sheets_page')
+pages.append(st.Page(answer_sheets_page.answer_sheets_page, title="답안지 채점", icon="📝", url_path="answer-sheets"))
+# 답안을 기록하고 있으면 문제별 난이도 통계 페이지도 보여줍니다.
+if os.environ.get('GAME_ANSWER_LOG'):
+    dashboard_page = load_game('dashboard.py', 'dashboard_page')
+    pages.append(st.Page(dashboard_page.dashboard, title="문제별 난이도", icon="📊", url_path="dashboard"))
+
+st.navigation(pages).run()
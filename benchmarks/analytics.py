@@ -0,0 +1,64 @@
+"""
+답안 기록 통계 갱신 벤치마크
+
+임시 DB에 가짜 답안 --rows개를 넣고 문제별 통계를 한 번 만든 뒤,
+답안 --tail개가 더 들어왔을 때 증분 갱신(update_aggregates)과
+원본 전체를 다시 읽는 GROUP BY 집계에 걸리는 시간을 비교합니다.
+
+    python benchmarks/analytics.py --rows 1000000
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.analytics import read_stats, update_aggregates
+from engine.answer_log import INSERT, connect
+
+QUESTIONS = [('number-pattern', f"A{i}") for i in range(1, 6)] + \
+            [('weather', f"P3_{i}") for i in range(20)] + [('price', str(i)) for i in range(1, 10)]
+
+
+def fake_answers(n, rng):
+    for _ in range(n):
+        game, question = rng.choice(QUESTIONS)
+        yield (time.time(), game, question, 0, int(rng.random() < 0.7), rng.lognormvariate(1.5, 0.8))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--tail', type=int, default=1_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    path = Path(tempfile.mkdtemp()) / 'answers.db'
+    conn = connect(str(path))
+    with conn:
+        conn.executemany(INSERT, fake_answers(args.rows, rng))
+
+    start = time.perf_counter()
+    update_aggregates(conn)
+    print(f"first aggregation of {args.rows:,} answers: {time.perf_counter() - start:.2f}s")
+
+    with conn:
+        conn.executemany(INSERT, fake_answers(args.tail, rng))
+    start = time.perf_counter()
+    update_aggregates(conn)
+    print(f"incremental update of {args.tail:,} answers: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    start = time.perf_counter()
+    conn.execute("SELECT game, question, COUNT(*), AVG(is_correct) FROM answers GROUP BY game, question").fetchall()
+    print(f"full rescan (GROUP BY):            {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    start = time.perf_counter()
+    read_stats(conn)
+    print(f"dashboard query:                   {(time.perf_counter() - start) * 1000:.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
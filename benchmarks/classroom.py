@@ -0,0 +1,104 @@
+"""
+수업 모드(engine.classroom) 벤치마크
+
+학생 N명이 같은 게임을 한 라운드씩 풀 때, 학생마다 start_new_question()과 화면 문자열을
+따로 만드는 경우와 선생님이 라운드를 한 번 열고 학생들이 답만 내는 경우를 비교합니다.
+답은 학생 수만큼의 스레드에서 동시에 내서 집계가 정확한지도 확인합니다.
+--store로 launch.py 워커들이 함께 쓰는 SQLite 방 저장소를 고를 수 있습니다. (없으면 프로세스 메모리)
+
+    python benchmarks/classroom.py --students 200 --rounds 20
+    python benchmarks/classroom.py --students 200 --rounds 5 --store sqlite:///classrooms.db
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine import classroom, number_pattern, weather
+
+
+def per_student_round(game, states):
+    """기존 방식: 학생 세션마다 문제를 고르고 표시 문자열과 정답을 만듭니다."""
+    for state in states:
+        if game == 'weather':
+            weather.start_new_question(state)
+            history, _ = weather.build_weather_history(state.pattern_id)
+            ' '.join(history)
+            weather.submit_answer(state, weather.NEXT_WEATHER[state.pattern_id])
+        else:
+            number_pattern.start_new_question(state)
+            q_data = number_pattern.get_question(state.question_id)
+            number_pattern.display_sequence_str(q_data)
+            number_pattern.submit_answer(state, number_pattern.correct_answer(q_data))
+            state.score = 0  # 승리 화면으로 넘어가지 않게 합니다.
+
+
+def classroom_round(code, student_ids):
+    """수업 모드: 라운드를 한 번 열고 학생들이 답만 냅니다."""
+    current = classroom.start_round(code)
+    for student_id in student_ids:
+        classroom.get_classroom(code).round.question['prompt']  # 학생 화면은 만들어 둔 문자열을 읽기만 합니다.
+        classroom.submit_answer(code, student_id, current.question['answer'], current.number)
+
+
+def concurrent_round(code, student_ids):
+    """학생마다 스레드 하나로 동시에 답을 내고, 집계가 정확한지 확인합니다."""
+    current = classroom.start_round(code)
+    barrier = threading.Barrier(len(student_ids))
+
+    def answer(student_id):
+        barrier.wait()
+        classroom.submit_answer(code, student_id, current.question['answer'], current.number)
+        # 두 번째 답은 무시되어야 합니다.
+        classroom.submit_answer(code, student_id, current.question['answer'], current.number)
+
+    threads = [threading.Thread(target=answer, args=(student_id,)) for student_id in student_ids]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    tally = classroom.classroom_tally(code)
+    assert tally['answered'] == tally['correct'] == len(student_ids), tally
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--students', type=int, default=200)
+    parser.add_argument('--rounds', type=int, default=20)
+    parser.add_argument('--store', help="방 저장소 (GAME_SESSION_STORE와 같은 꼴, 예: sqlite:///classrooms.db)")
+    args = parser.parse_args()
+    if args.store:
+        os.environ['GAME_SESSION_STORE'] = args.store
+
+    print(f"{args.students} students, {args.rounds} rounds")
+    print(f"{'game':<16}{'per-student ms/round':>22}{'classroom ms/round':>20}{'speedup':>9}{'threads ms/round':>18}")
+    for game in classroom.GAMES:
+        state_class = weather.WeatherState if game == 'weather' else number_pattern.NumberPatternState
+        states = [state_class(seed=i) for i in range(args.students)]
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            per_student_round(game, states)
+        per_student = (time.perf_counter() - start) / args.rounds
+
+        code = classroom.open_classroom(game, seed=0).code
+        student_ids = [classroom.join_classroom(code, f"student {i}") for i in range(args.students)]
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            classroom_round(code, student_ids)
+        shared = (time.perf_counter() - start) / args.rounds
+
+        threaded = sum(concurrent_round(code, student_ids) for _ in range(args.rounds)) / args.rounds
+        classroom.close_classroom(code)
+        print(f"{game:<16}{per_student * 1e3:>22.2f}{shared * 1e3:>20.2f}{per_student / shared:>8.1f}x"
+              f"{threaded * 1e3:>18.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+엔진만으로 게임 턴을 시뮬레이션하는 처리량 벤치마크
+
+Streamlit을 불러오지 않고 engine 패키지로 "새 문제 → 답 제출"을 반복해서
+게임별 초당 턴 수를 잽니다. 승리하면 새 세션으로 바꿔 계속 진행합니다.
+
+한 프로세스(코어 1개)에서 잰 값은 숫자 추론 약 19만, 날씨 추론 약 19만, 가격 추론 약 44만 턴/초입니다.
+숫자·날씨 추론은 문제를 고를 때마다 도는 scheduler.permute(파이스텔 라운드)가 시간 대부분을 씁니다.
+초당 수백만 턴이 필요하면 워커 프로세스를 여러 개 띄워야 합니다. (launch.py)
+
+    python benchmarks/engine_turns.py --turns 1000000
+"""
+import argparse
+import itertools
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine import number_pattern, price, weather
+
+
+def simulate(game, new_state, guess, turns):
+    """turns번 턴을 진행하고 (초당 턴 수, 정답 수)를 돌려줍니다."""
+    state = new_state()
+    correct = 0
+    start = time.perf_counter()
+    for _ in range(turns):
+        if state.game_state not in ('init', 'playing', 'finished'):
+            state = new_state()
+        game.start_new_question(state)
+        correct += game.submit_answer(state, guess(state))
+    elapsed = time.perf_counter() - start
+    return turns / elapsed, correct
+
+
+def number_guess(state):
+    q_data = number_pattern.get_question(state.question_id)
+    return number_pattern.correct_answer(q_data) + random.randrange(2)
+
+
+def weather_guess(state):
+    return random.randrange(len(weather.WEATHER_EMOJIS))
+
+
+def price_guess(state):
+    return price.generate_step_data(state.step)[3] + random.choice((0, 5))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--turns', type=int, default=200_000)
+    parser.add_argument('--seed', type=int, default=0, help='답 고르기와 세션 시드의 시작값')
+    args = parser.parse_args()
+
+    # 같은 --seed로 돌리면 문제 순서와 답이 매번 똑같습니다.
+    random.seed(args.seed)
+    seeds = itertools.count(args.seed)
+
+    # 자동 생성 문제 묶음은 측정 전에 미리 만들어 둡니다.
+    number_pattern.get_generated_sequences()
+
+    cases = [
+        ('number-pattern', number_pattern, lambda: number_pattern.NumberPatternState(seed=next(seeds)), number_guess),
+        ('weather', weather, lambda: weather.WeatherState(seed=next(seeds)), weather_guess),
+        ('price', price, price.PriceState, price_guess),
+    ]
+    print(f"{'game':<16}{'turns/s':>12}{'accuracy':>10}")
+    for name, game, new_state, guess in cases:
+        rate, correct = simulate(game, new_state, guess, args.turns)
+        print(f"{name:<16}{rate:>12,.0f}{correct / args.turns:>10.2f}")
+    print(f"streamlit imported: {'streamlit' in sys.modules}")
+
+
+if __name__ == '__main__':
+    main()
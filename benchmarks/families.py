@@ -0,0 +1,56 @@
+"""
+먼 항 계산 벤치마크
+
+engine.families의 수열마다 n번째 항 하나를 바로 구하는 시간(term)과
+앞에서부터 n개 항을 모두 만드는 시간(list)을 비교합니다.
+
+    python benchmarks/families.py --n 1000000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.families import (
+    Alternating, Arithmetic, Geometric, LinearRecurrence, Quadratic, format_term, lazy_display_terms,
+)
+
+FAMILIES = [
+    ('arithmetic', Arithmetic(3, 3)),
+    ('geometric', Geometric(3, 2)),
+    ('quadratic', Quadratic(1, 1, 1)),
+    ('fibonacci', LinearRecurrence((1, 1), (0, 1))),
+    ('alternating', Alternating(Arithmetic(1, 2), Arithmetic(10, 10))),
+]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--n', type=int, default=1_000_000)
+    parser.add_argument('--skip-list', action='store_true', help='n개 항을 모두 만드는 비교는 건너뜁니다.')
+    args = parser.parse_args()
+
+    print(f"{'family':<14}{'term (ms)':>12}{'list (ms)':>12}  value")
+    for name, family in FAMILIES:
+        value, term_time = timed(family.term, args.n - 1)
+        if args.skip_list:
+            list_time = float('nan')
+        else:
+            terms, list_time = timed(family.terms, 0, args.n)
+            assert terms[-1] == value
+        print(f"{name:<14}{term_time * 1000:>12.2f}{list_time * 1000:>12.1f}  {format_term(value)}")
+
+    _, render_time = timed(lazy_display_terms, FAMILIES[3][1], args.n - 1)
+    print(f"render fibonacci problem with blank at term {args.n:,}: {render_time * 1000:.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
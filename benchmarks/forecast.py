@@ -0,0 +1,97 @@
+"""
+날씨 예측기(engine.forecast) 벤치마크
+
+1. 이력 길이를 늘려 가며 NumPy 예측기와 파이썬 반복문 예측기(같은 규칙)의 시간을 비교합니다.
+2. 잡음 모드에서 예측 확률이 실제 적중률과 맞는지(보정) 확인합니다.
+
+    python benchmarks/forecast.py
+"""
+import argparse
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine import forecast, weather
+
+LENGTHS = [6, 100, 1_000, 10_000, 100_000]
+NOISE_LEVELS = [0.0, 0.1, 0.2, 0.3]
+
+
+def loop_forecast(history, tolerance=0.0, alpha=forecast.ALPHA, num_states=forecast.NUM_WEATHERS):
+    """engine.forecast.forecast와 같은 규칙을 파이썬 반복문으로 계산합니다. (비교용)"""
+    history = list(history)
+    n = len(history)
+    period = None
+    for p in range(1, min(forecast.MAX_ORDER, n // 2) + 1):
+        mismatches = sum(1 for i in range(p, n) if history[i] != history[i - p])
+        if mismatches / (n - p) <= tolerance:
+            period = p
+            break
+    counts = Counter()
+    if period is not None:
+        for i in range(n % period, n, period):
+            counts[history[i]] += 1
+    else:
+        for i in range(1, n):
+            if history[i - 1] == history[-1]:
+                counts[history[i]] += 1
+    total = sum(counts.values())
+    return [(counts[code] + alpha) / (total + alpha * num_states) for code in range(num_states)], period
+
+
+def time_call(func, *args, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(*args)
+    return (time.perf_counter() - start) / repeat
+
+
+def speed(args):
+    pattern_id = weather.PATTERN_IDS['R1_비비맑음반복']
+    print(f"{'days':>8}{'loop us':>12}{'numpy us':>12}{'speedup':>9}  same")
+    rng = np.random.default_rng(args.seed)
+    for length in LENGTHS:
+        history, _ = weather.long_history(pattern_id, length, noise=0.1, rng=rng)
+        repeat = max(3, args.repeat // max(1, length // 10))
+        loop = time_call(loop_forecast, history, 0.3, repeat=repeat)
+        vectorized = time_call(forecast.forecast, history, None, 0.3, repeat=repeat)
+        expected, expected_period = loop_forecast(history, 0.3)
+        probabilities, period = forecast.forecast(history, tolerance=0.3)
+        same = np.allclose(probabilities, expected) and period == expected_period
+        print(f"{length:>8,}{loop * 1e6:>12.1f}{vectorized * 1e6:>12.1f}{loop / vectorized:>8.1f}x  {same}")
+
+
+def calibration(args):
+    """잡음이 있는 이력에서 가장 높은 확률의 평균과 실제로 맞힌 비율 (가까울수록 보정이 잘 된 것)"""
+    rng = np.random.default_rng(args.seed)
+    print(f"\n{'noise':>6}{'mean p(top)':>13}{'hit rate':>10}  ({args.trials} histories x {args.length} days)")
+    for noise in NOISE_LEVELS:
+        confidences, hits = [], []
+        for _ in range(args.trials):
+            pattern_id = int(rng.integers(weather.PATTERN_COUNT))
+            history, next_weather = weather.long_history(pattern_id, args.length + 1, noise=noise, rng=rng)
+            history, actual = history[:-1], history[-1]  # 내일 날씨에도 잡음이 섞입니다.
+            probabilities, _ = forecast.forecast(history, tolerance=0.5)
+            confidences.append(probabilities.max())
+            hits.append(int(np.argmax(probabilities)) == actual)
+        print(f"{noise:>6.1f}{np.mean(confidences):>13.3f}{np.mean(hits):>10.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=2_000)
+    parser.add_argument('--trials', type=int, default=2_000)
+    parser.add_argument('--length', type=int, default=200, help='보정 확인에 쓰는 이력 길이')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    speed(args)
+    calibration(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+답안지 일괄 채점(engine.grading) 벤치마크
+
+세 게임의 문제를 섞은 가짜 답안지 CSV를 만들고(정답, 오답, 형식이 다른 답 포함)
+청크 단위로 채점하는 데 걸리는 시간과 채점 결과가 엔진의 submit_answer와 같은지 확인합니다.
+
+    python benchmarks/grading.py --rows 100000
+"""
+import argparse
+import io
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine import grading, number_pattern, price, weather
+
+
+def make_sheet(rows, students, seed):
+    """(student, game, question, answer) CSV 문자열과 행마다 기대하는 정답 여부"""
+    rng = random.Random(seed)
+    pool_size = len(number_pattern.get_generated_sequences()['type'])
+    number_ids = list(number_pattern.HANDMADE_IDS) + [f"N{rng.randrange(pool_size)}" for _ in range(2_000)]
+    weather_names = list(weather.PATTERN_IDS)
+    lines = ["student,game,question,answer"]
+    expected = []
+    for i in range(rows):
+        student = f"student{rng.randrange(students):03d}"
+        game = rng.choice(grading.GAMES)
+        if game == 'number-pattern':
+            question = rng.choice(number_ids)
+            answer = number_pattern.correct_answer(number_pattern.get_question(question))
+        elif game == 'weather':
+            question = rng.choice(weather_names)
+            answer = weather.NEXT_WEATHER[weather.PATTERN_IDS[question]]
+        else:
+            question = str(rng.randrange(1, price.TARGET_SCORE + 1))
+            answer = price.generate_step_data(int(question))[3]
+        is_correct = rng.random() < 0.7
+        if not is_correct:
+            answer = answer + 1 if game != 'weather' else (answer + 1) % len(weather.WEATHER_EMOJIS)
+        if game == 'weather' and rng.random() < 0.3:
+            answer = weather.WEATHER_EMOJIS[answer]  # 이모지로 쓴 답
+        elif game == 'price' and rng.random() < 0.3:
+            answer = f'"{answer:,}"'  # 천 단위 쉼표
+        lines.append(f"{student},{game},{question},{answer}")
+        expected.append(is_correct)
+    return "\n".join(lines), expected
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--students', type=int, default=300)
+    parser.add_argument('--chunk-size', type=int, default=grading.CHUNK_SIZE)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    sheet, expected = make_sheet(args.rows, args.students, args.seed)
+    start = time.perf_counter()
+    rows, scores = grading.grade_file(io.StringIO(sheet), 'answers.csv', args.chunk_size)
+    elapsed = time.perf_counter() - start
+
+    mismatches = int((rows['is_correct'].to_numpy() != expected).sum())
+    print(f"{len(rows):,} rows, {len(scores):,} student/game scores in {elapsed:.2f}s "
+          f"({len(rows) / elapsed:,.0f} rows/s), mismatches {mismatches}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+"""
+세 게임의 부하/지연 벤치마크 (오프라인)
+
+Streamlit의 AppTest로 세션을 여러 개 만들어 각 게임을 처음부터 승리, 다시 시작까지
+끝까지 플레이합니다. 게임마다 다음 값을 JSON으로 남겨서 커밋 사이의 변화를 비교할 수 있습니다.
+  - 턴(답 하나)당 스크립트 실행 횟수
+  - 스크립트 실행 한 번의 p50/p99 지연 시간
+  - 최대 RSS, 세션 상태 하나의 메모리
+
+    python benchmarks/load.py --sessions 50 --json load.json
+"""
+import argparse
+import json
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+from script_runs import count_runs, total_runs
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from engine import number_pattern, price, weather
+
+
+# ----- 게임별 플레이 방법: (세션 키, 정답 계산, 입력 위젯에 답 넣기) -----
+def number_answer(state):
+    return number_pattern.correct_answer(number_pattern.get_question(state.question_id))
+
+
+def weather_answer(state):
+    return weather.NEXT_WEATHER[state.pattern_id]
+
+
+def price_answer(state):
+    return price.generate_step_data(state.step)[3]
+
+
+GAMES = {
+    'number-pattern.py': ('number_pattern_state', number_answer,
+                          lambda at, guess: at.number_input[0].set_value(guess)),
+    'weather.py': ('weather_state', weather_answer,
+                   lambda at, guess: at.radio[0].set_value(guess % len(weather.WEATHER_EMOJIS))),
+    'price.py': ('price_state', price_answer,
+                 lambda at, guess: at.number_input[0].set_value(guess)),
+}
+
+
+def deep_sizeof(obj, seen=None):
+    """__slots__ 객체와 기본 컨테이너를 따라가며 전체 바이트 수를 셉니다."""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    for name in getattr(type(obj), '__slots__', ()):
+        if hasattr(obj, name):
+            size += deep_sizeof(getattr(obj, name), seen)
+    return size
+
+
+class Recorder:
+    """클릭 한 번마다 걸린 시간과 스크립트 실행 횟수를 모읍니다."""
+
+    def __init__(self):
+        self.latencies = []
+        self.runs = 0
+
+    def run(self, element_or_app):
+        start_runs = total_runs()
+        start = time.perf_counter()
+        at = element_or_app.run()
+        elapsed = time.perf_counter() - start
+        runs = total_runs() - start_runs
+        self.runs += runs
+        self.latencies.extend([elapsed / max(runs, 1)] * runs)
+        return at
+
+
+def play_session(filename, rng, accuracy, recorder):
+    """세션 하나를 처음 화면부터 승리 후 다시 시작까지 진행하고 (턴 수, 세션 상태 크기)를 돌려줍니다."""
+    state_key, answer, enter_guess = GAMES[filename]
+    at = recorder.run(AppTest.from_file(str(ROOT / filename), default_timeout=60))
+    turns = 0
+    while True:
+        state = at.session_state[state_key]
+        guess = answer(state)
+        if rng.random() >= accuracy:
+            guess += 5  # 일부러 틀리기 (price는 5원 단위)
+        enter_guess(at, guess)
+        recorder.run(at.button[0].click())  # 🚀 정답 제출
+        turns += 1
+        assert not at.exception, at.exception
+        if at.session_state[state_key].game_state == 'victory':
+            break
+        recorder.run(at.button[-1].click())  # 다음 문제
+    state_size = deep_sizeof(at.session_state[state_key])
+    recorder.run(at.button[0].click())  # 🔄 다시 시작
+    assert at.session_state[state_key].game_state == 'playing'
+    return turns, state_size
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def git_commit():
+    result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                            capture_output=True, text=True)
+    return result.stdout.strip() or None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=20, help='게임마다 플레이할 세션 수')
+    parser.add_argument('--accuracy', type=float, default=0.7, help='시뮬레이션 플레이어의 정답률')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help='결과를 저장할 JSON 파일 경로 (없으면 표준 출력)')
+    args = parser.parse_args()
+
+    count_runs()
+    rng = random.Random(args.seed)
+    results = []
+    for filename in GAMES:
+        recorder = Recorder()
+        turns, sizes = 0, []
+        start = time.perf_counter()
+        for _ in range(args.sessions):
+            session_turns, state_size = play_session(filename, rng, args.accuracy, recorder)
+            turns += session_turns
+            sizes.append(state_size)
+        results.append({
+            'app': filename,
+            'sessions': args.sessions,
+            'turns': turns,
+            'script_runs': recorder.runs,
+            'runs_per_turn': recorder.runs / turns,
+            'run_latency_p50_ms': percentile(recorder.latencies, 0.50) * 1000,
+            'run_latency_p99_ms': percentile(recorder.latencies, 0.99) * 1000,
+            'run_latency_mean_ms': statistics.fmean(recorder.latencies) * 1000,
+            'session_state_bytes': statistics.fmean(sizes),
+            'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+            'wall_s': time.perf_counter() - start,
+        })
+
+    report = {'commit': git_commit(), 'python': sys.version.split()[0], 'results': results}
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.json:
+        Path(args.json).write_text(text)
+    print(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+가격 추론 AI 훈련 모드(engine.regression) 벤치마크
+
+간식 종류 수를 바꿔 가며 예시 하나를 가르치는 시간을 재귀 최소제곱(RLS) 갱신과
+지금까지의 예시 전체로 다시 맞추는 np.linalg.lstsq와 비교합니다. 세션 상태 크기는
+예시 수와 상관없이 간식 종류 수로만 정해지는 것도 확인합니다.
+
+    python benchmarks/regression.py --examples 5000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.regression import RecursiveLeastSquares, TrainingState
+from engine.session_store import dump_state
+
+ITEM_COUNTS = [2, 10, 50, 200]
+
+
+def make_examples(count, num_items, rng):
+    features = np.empty((count, 1 + num_items))
+    features[:, 0] = rng.integers(1, 10, count)
+    features[:, 1:] = rng.random((count, num_items)) < 0.5
+    coefficients = np.concatenate([[100.0], rng.integers(1, 50, num_items)])
+    return features, features @ coefficients, coefficients
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--examples', type=int, default=5_000)
+    parser.add_argument('--refits', type=int, default=50, help='다시 맞추기 시간을 잴 때 쓰는 마지막 예시 수')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'items':>6}{'RLS us/example':>16}{'refit us/example':>18}{'max coef error':>16}{'state bytes':>13}")
+    for num_items in ITEM_COUNTS:
+        features, prices, coefficients = make_examples(args.examples, num_items, rng)
+        model = RecursiveLeastSquares(1 + num_items)
+        start = time.perf_counter()
+        for x, y in zip(features, prices):
+            model.update(x, y)
+        rls = (time.perf_counter() - start) / args.examples
+
+        # 예시가 하나 늘 때마다 전체를 다시 맞추는 방식 (마지막 refits개만 재서 평균)
+        start = time.perf_counter()
+        for end in range(args.examples - args.refits, args.examples):
+            np.linalg.lstsq(features[:end + 1], prices[:end + 1], rcond=None)
+        refit = (time.perf_counter() - start) / args.refits
+
+        state = TrainingState(item_names=[f"item{i}" for i in range(num_items)])
+        state.model = model
+        error = np.abs(model.weights - coefficients).max()
+        print(f"{num_items:>6}{rls * 1e6:>16.1f}{refit * 1e6:>18.1f}{error:>16.2e}{len(dump_state(state)):>13,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""
+문제 순서(engine.scheduler) 벤치마크
+
+문제 풀 크기를 바꿔 가며 다음 문제를 고르는 시간이 일정한지,
+문제를 많이 풀어도 세션이 저장하는 크기가 그대로인지 확인합니다.
+
+    python benchmarks/scheduler.py --draws 100000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.scheduler import QuestionOrder
+
+POOL_SIZES = [10, 1_000, 100_000, 10_000_000, 1_000_000_000]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--draws', type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'pool size':>14}{'us/question':>14}{'distinct':>10}{'state bytes':>13}")
+    for size in POOL_SIZES:
+        order = QuestionOrder(key=12345)
+        draws = min(args.draws, size)
+        start = time.perf_counter()
+        seen = {order.next(size) for _ in range(draws)}
+        elapsed = time.perf_counter() - start
+        state_bytes = sys.getsizeof(order) + sys.getsizeof(order.key) + sys.getsizeof(order.cursor)
+        print(f"{size:>14,}{elapsed / draws * 1e6:>14.2f}{len(seen) == draws!s:>10}{state_bytes:>13}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+정답 한 문제당 스크립트 실행 횟수 측정
+
+Streamlit의 AppTest로 세 게임을 실행하면서 ScriptRunner가 스크립트를 몇 번 실행하는지 셉니다.
+(st.rerun()이 호출되면 같은 클릭 안에서 실행이 한 번 더 일어납니다.)
+--ref를 주면 해당 git 커밋의 파일로도 측정해서 전/후를 비교합니다.
+작업 트리의 횟수가 한도(첫 화면 1번, 문제당 2번)를 넘으면 종료 코드 1로 끝나므로
+실행 횟수가 다시 늘어나는 것을 CI에서 잡을 수 있습니다. (같은 한도를 tests/test_script_runs.py가 pytest로 확인합니다)
+
+    python benchmarks/script_runs.py --ref HEAD~1
+"""
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from streamlit.runtime.scriptrunner import script_runner
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parent.parent
+APPS = ['number-pattern.py', 'weather.py', 'price.py']
+QUESTIONS = 2  # 목표 점수에 닿지 않도록 승리 전까지만 풉니다.
+MAX_INIT_RUNS = 1  # 첫 화면
+MAX_RUNS_PER_QUESTION = 2  # 정답 제출 1번 + 다음 문제 1번 (제출은 프래그먼트만 다시 실행)
+
+RUNS = {'full': 0, 'fragment': 0}
+
+
+def count_runs():
+    """모든 ScriptRunner의 SCRIPT_STARTED 이벤트를 받아 전체/프래그먼트 실행 횟수를 셉니다."""
+    original_init = script_runner.ScriptRunner.__init__
+
+    def on_event(sender, event, **kwargs):
+        if event == script_runner.ScriptRunnerEvent.SCRIPT_STARTED:
+            RUNS['fragment' if kwargs.get('fragment_ids_this_run') else 'full'] += 1
+
+    def init(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        self.on_event.connect(on_event, weak=False)
+
+    script_runner.ScriptRunner.__init__ = init
+
+
+def total_runs():
+    return RUNS['full'] + RUNS['fragment']
+
+
+def measure(app_dir, filename):
+    """첫 화면과 문제 QUESTIONS개(제출 + 다음 문제)의 실행 횟수를 돌려줍니다."""
+    sys.path.insert(0, str(app_dir))
+    try:
+        start = total_runs()
+        at = AppTest.from_file(str(app_dir / filename), default_timeout=60).run()
+        init_runs = total_runs() - start
+
+        start = total_runs()
+        for _ in range(QUESTIONS):
+            at.button[0].click().run()   # 🚀 정답 제출
+            at.button[-1].click().run()  # 다음 문제
+        assert not at.exception, at.exception
+        per_question = (total_runs() - start) / QUESTIONS
+    finally:
+        sys.path.remove(str(app_dir))
+        # 다른 트리의 같은 이름 모듈이 섞이지 않도록 이 트리에서 불러온 모듈을 모두 지웁니다.
+        for name, module in list(sys.modules.items()):
+            if Path(getattr(module, '__file__', None) or '/').resolve().is_relative_to(app_dir.resolve()):
+                del sys.modules[name]
+    return init_runs, per_question
+
+
+def checkout(ref, target):
+    """git ref의 파일들을 임시 폴더에 꺼냅니다."""
+    files = subprocess.run(['git', 'ls-tree', '-r', '--name-only', ref], cwd=ROOT,
+                           check=True, capture_output=True, text=True).stdout.split()
+    for name in files:
+        if name.endswith('.py'):
+            blob = subprocess.run(['git', 'show', f'{ref}:{name}'], cwd=ROOT,
+                                  check=True, capture_output=True).stdout
+            (target / name).parent.mkdir(parents=True, exist_ok=True)
+            (target / name).write_bytes(blob)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--ref', help='비교할 git 커밋 (예: HEAD~1)')
+    args = parser.parse_args()
+
+    count_runs()
+    trees = [('working tree', ROOT)]
+    if args.ref:
+        tmp = Path(tempfile.mkdtemp())
+        checkout(args.ref, tmp)
+        trees.insert(0, (args.ref, tmp))
+
+    failures = []
+    print(f"{'tree':<14}{'app':<20}{'init runs':>10}{'runs/answer':>13}")
+    for label, app_dir in trees:
+        for filename in APPS:
+            init_runs, per_question = measure(app_dir, filename)
+            print(f"{label:<14}{filename:<20}{init_runs:>10}{per_question:>13.1f}")
+            if app_dir == ROOT and (init_runs > MAX_INIT_RUNS or per_question > MAX_RUNS_PER_QUESTION):
+                failures.append(f"{filename}: init {init_runs} (max {MAX_INIT_RUNS}), "
+                                f"per answer {per_question:.1f} (max {MAX_RUNS_PER_QUESTION})")
+    for failure in failures:
+        print(f"too many script runs - {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""
+세션 상태 메모리 벤치마크
+
+예전 방식(st.session_state에 여러 키를 흩어 저장)과 게임별 __slots__ 상태 객체를
+동시 접속 세션 N개만큼 만들어 tracemalloc으로 세션당 메모리를 비교합니다.
+
+    python benchmarks/session_memory.py --sessions 5000
+"""
+import argparse
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine import number_pattern, price, weather
+
+
+# ----- 예전 방식: 세션마다 키 여러 개 + 문자열/리스트 사본 -----
+def legacy_number_session(app, question_ids):
+    q_data = app.FIXED_SEQUENCES[question_ids[-1]]
+    full_sequence = q_data['sequence']
+    display_sequence = list(map(str, full_sequence))
+    display_sequence[q_data['blank_index']] = '?'
+    return {
+        'game_state': 'finished',
+        'score': 1,
+        'target_score': 3,
+        'input_key': random.random(),
+        'used_questions': set(question_ids),
+        'correct_answer': full_sequence[q_data['blank_index']],
+        'pattern_type': q_data['type'],
+        'last_pattern_rule': {'type': q_data['type'], 'rule_value': q_data['diff_ratio']},
+        'display_sequence_str': " → ".join(display_sequence),
+        'full_sequence_str': " → ".join(map(str, full_sequence)),
+        'pattern_rule': q_data['rule_desc'],
+        'feedback': f"❌ **틀렸어요.** 정답은 **{full_sequence[q_data['blank_index']]}** 였어요.",
+        'feedback_type': 'error',
+        'feedback_display_text': "❌ **틀렸어요.** " + " → ".join(map(str, full_sequence)),
+    }
+
+
+def legacy_weather_session(app):
+    pattern_id = random.randrange(app.PATTERN_COUNT)
+    history, forecast = app.build_weather_history(pattern_id)
+    rule_name = app.pattern_name(pattern_id)
+    probabilities = {forecast: 1.0}
+    description = app.pattern_description(pattern_id)
+    return {
+        'game_state': 'playing',
+        'score': 1,
+        'target_score': 3,
+        'input_key': random.random(),
+        'last_rule_name': rule_name,
+        'correct_answer': forecast,
+        'weather_history': history,
+        'probabilities': probabilities,
+        'rule_description': description,
+        'feedback': "",
+    }
+
+
+def legacy_price_session(app):
+    examples, size, items, answer, hint = app.generate_step_data(3)
+    return {
+        'game_state': 'playing',
+        'step': 3,
+        'score': 2,
+        'examples': examples,
+        'problem_size': size,
+        'problem_items': items,
+        'correct_answer': answer,
+        'step_hint': hint,
+        'input_key': random.random(),
+    }
+
+
+# ----- 새 방식: 게임마다 상태 객체 하나 -----
+def slot_number_session(app, question_ids):
+    state = app.NumberPatternState()
+    state.game_state = 'finished'
+    state.score = 1
+    state.order.cursor = len(question_ids)
+    state.question_id = question_ids[-1]
+    state.input_key = 3
+    return {'state': state}
+
+
+def slot_weather_session(app):
+    state = app.WeatherState(app.TARGET_SCORE)
+    state.pattern_id = random.randrange(app.PATTERN_COUNT)
+    state.game_state = 'playing'
+    state.score = 1
+    state.input_key = 2
+    return {'state': state}
+
+
+def slot_price_session(app):
+    state = app.PriceState()
+    state.game_state = 'playing'
+    state.step = 3
+    state.score = 2
+    state.input_key = 3
+    return {'state': state}
+
+
+def measure(build, sessions):
+    """세션 N개를 만들고 세션당 평균 할당 바이트를 돌려줍니다."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = [build() for _ in range(sessions)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    # 세션 목록 자체(리스트 포인터)는 빼고 계산합니다.
+    total -= sys.getsizeof(kept)
+    return total / sessions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=5000)
+    args = parser.parse_args()
+
+    question_ids = ['A1', 'G2', 'A4']
+
+    cases = [
+        ('number-pattern', lambda: legacy_number_session(number_pattern, question_ids),
+         lambda: slot_number_session(number_pattern, question_ids)),
+        ('weather', lambda: legacy_weather_session(weather),
+         lambda: slot_weather_session(weather)),
+        ('price', lambda: legacy_price_session(price),
+         lambda: slot_price_session(price)),
+    ]
+
+    print(f"동시 세션 {args.sessions}개 기준 세션당 메모리")
+    print(f"{'game':<16}{'legacy(B)':>12}{'slots(B)':>12}{'ratio':>8}{'total legacy':>15}{'total slots':>14}")
+    for name, legacy, slots in cases:
+        legacy_bytes = measure(legacy, args.sessions)
+        slot_bytes = measure(slots, args.sessions)
+        print(f"{name:<16}{legacy_bytes:>12.0f}{slot_bytes:>12.0f}{legacy_bytes / slot_bytes:>8.1f}"
+              f"{legacy_bytes * args.sessions / 1e6:>13.1f}MB{slot_bytes * args.sessions / 1e6:>12.1f}MB")
+
+
+if __name__ == '__main__':
+    main()
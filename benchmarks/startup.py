@@ -0,0 +1,108 @@
+"""
+콜드 스타트 벤치마크 (import 시간 + 첫 화면)
+
+앱마다 새 파이썬 프로세스를 띄워서 두 가지를 잽니다.
+  - import: `python -X importtime`으로 앱 모듈을 불러올 때 걸린 시간과 가장 무거운 패키지
+  - first paint: 프로세스 시작부터 AppTest로 첫 화면을 다 그릴 때까지 걸린 시간
+price.py는 PRICE_FAST_START=0(pandas 사용)으로도 한 번 더 잽니다.
+
+    python benchmarks/startup.py --repeat 3 --json startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+APPS = [
+    ('number-pattern.py', {}),
+    ('weather.py', {}),
+    ('price.py', {}),
+    ('price.py', {'PRICE_FAST_START': '0'}),
+    ('app.py', {}),  # 세 게임을 한 프로세스에서 제공하는 멀티페이지 진입점
+]
+
+IMPORT_SCRIPT = """
+import runpy, sys
+sys.path.insert(0, {root!r})
+runpy.run_path({app!r}, run_name='startup_bench')
+"""
+
+PAINT_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=120).run()
+assert not at.exception, at.exception
+print(time.perf_counter() - start, 'pandas' in sys.modules)
+"""
+
+
+def run_python(args, script, env):
+    return subprocess.run([sys.executable, *args, '-c', script], cwd=ROOT, env=env,
+                          check=True, capture_output=True, text=True)
+
+
+def parse_importtime(stderr):
+    """-X importtime 출력에서 최상위 모듈별 누적 시간(마이크로초)을 모읍니다."""
+    top_level = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if not name.startswith('  '):  # 들여쓰기가 없으면 최상위 import
+            top_level[name.strip()] = top_level.get(name.strip(), 0) + int(cumulative)
+    return top_level
+
+
+def measure(filename, extra_env, repeat):
+    env = {**os.environ, **extra_env}
+    app = str(ROOT / filename)
+    script_args = {'root': str(ROOT), 'app': app}
+
+    import_ms, paint_ms = [], []
+    heaviest, pandas_loaded = [], False
+    for _ in range(repeat):
+        result = run_python(['-X', 'importtime'], IMPORT_SCRIPT.format(**script_args), env)
+        top_level = parse_importtime(result.stderr)
+        import_ms.append(sum(top_level.values()) / 1000)
+        heaviest = sorted(top_level.items(), key=lambda item: -item[1])[:5]
+
+        result = run_python([], PAINT_SCRIPT.format(**script_args), env)
+        seconds, pandas_flag = result.stdout.split()
+        paint_ms.append(float(seconds) * 1000)
+        pandas_loaded = pandas_flag == 'True'
+
+    return {
+        'app': filename,
+        'env': extra_env,
+        'import_ms': statistics.median(import_ms),
+        'first_paint_ms': statistics.median(paint_ms),
+        'pandas_imported': pandas_loaded,
+        'heaviest_imports_ms': {name: us / 1000 for name, us in heaviest},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3, help='앱마다 반복 횟수 (중앙값 사용)')
+    parser.add_argument('--json', help='결과를 JSON 파일로 저장할 경로')
+    args = parser.parse_args()
+
+    results = [measure(filename, env, args.repeat) for filename, env in APPS]
+
+    print(f"{'app':<34}{'import(ms)':>12}{'first paint(ms)':>17}{'pandas':>8}")
+    for r in results:
+        label = r['app'] + ''.join(f" {k}={v}" for k, v in r['env'].items())
+        print(f"{label:<34}{r['import_ms']:>12.0f}{r['first_paint_ms']:>17.0f}{str(r['pandas_imported']):>8}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
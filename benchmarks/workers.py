@@ -0,0 +1,134 @@
+"""
+launch.py 워커 수별 처리량 벤치마크
+
+launch.py를 워커 수를 바꿔 가며 띄우고, 한 주소(127.0.0.1, 학교 NAT 뒤의 한 반과 같은 상황)에서
+브라우저 여러 개를 흉내 낸 클라이언트가 동시에 스크립트를 다시 실행시킵니다.
+클라이언트는 브라우저처럼 먼저 페이지를 받아 워커 쿠키를 얻고, 그 쿠키로 웹소켓(/_stcore/stream)에
+연결해서 rerun_script 메시지를 보내고 script_finished를 기다리기를 되풀이합니다.
+워커 수마다 초당 스크립트 실행 수와 클라이언트가 워커에 나뉜 모양을 보여줍니다.
+(워커 수가 CPU 코어 수보다 많으면 처리량은 더 늘지 않습니다)
+
+    python benchmarks/workers.py --workers 1 2 4 --clients 16 --seconds 10
+"""
+import argparse
+import asyncio
+import http.cookies
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from collections import Counter
+from pathlib import Path
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from launch import WORKER_COOKIE
+
+
+def wait_until_up(port, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"port {port} did not come up in {timeout}s")
+
+
+def worker_cookie(port):
+    """브라우저처럼 첫 페이지를 받아 프록시가 붙여 준 워커 쿠키를 꺼냅니다."""
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=10) as response:
+        cookies = http.cookies.SimpleCookie()
+        for header in response.headers.get_all('Set-Cookie') or ():
+            cookies.load(header)
+    return cookies[WORKER_COOKIE].value if WORKER_COOKIE in cookies else None
+
+
+async def client(port, cookie, deadline, client_index):
+    """deadline까지 스크립트를 다시 실행시키고 끝난 실행 수를 돌려줍니다."""
+    headers = {'Cookie': f"{WORKER_COOKIE}={cookie}"} if cookie is not None else {}
+    async with websockets.connect(f"ws://127.0.0.1:{port}/_stcore/stream", subprotocols=['streamlit'],
+                                  additional_headers=headers, max_size=None) as ws:
+        runs = 0
+        while time.monotonic() < deadline:
+            message = BackMsg()
+            message.rerun_script.query_string = f"sid=bench{client_index}"
+            message.rerun_script.page_script_hash = ''
+            await ws.send(message.SerializeToString())
+            while True:
+                forward = ForwardMsg()
+                forward.ParseFromString(await ws.recv())
+                if forward.WhichOneof('type') == 'script_finished':
+                    break
+            runs += 1
+        return runs
+
+
+async def drive(port, cookies, seconds):
+    deadline = time.monotonic() + seconds
+    results = await asyncio.gather(*(client(port, cookie, deadline, i) for i, cookie in enumerate(cookies)))
+    return sum(results)
+
+
+def measure(workers, args, store_path):
+    env = dict(os.environ, GAME_SESSION_STORE=f"sqlite:///{store_path}")
+    command = [sys.executable, str(ROOT / 'launch.py'), '--workers', str(workers),
+               '--port', str(args.port), '--script', args.script]
+    proxy = subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL)
+    try:
+        for port in range(args.port + 1, args.port + 1 + workers):
+            wait_until_up(port)
+        wait_until_up(args.port)
+        cookies = [worker_cookie(args.port) for _ in range(args.clients)]
+        asyncio.run(drive(args.port, cookies, 1.0))  # 첫 실행(모듈 불러오기) 데우기
+        runs = asyncio.run(drive(args.port, cookies, args.seconds))
+    finally:
+        proxy.send_signal(signal.SIGINT)  # launch.py가 워커를 정리하고 끝납니다.
+        proxy.wait(15)
+    return {
+        'workers': workers,
+        'clients': args.clients,
+        'runs': runs,
+        'runs_per_s': round(runs / args.seconds, 1),
+        'clients_per_worker': dict(sorted(Counter(cookies).items(), key=lambda item: str(item[0]))),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--clients', type=int, default=16, help='동시에 접속하는 브라우저 수 (모두 같은 주소)')
+    parser.add_argument('--seconds', type=float, default=10.0)
+    parser.add_argument('--port', type=int, default=8701)
+    parser.add_argument('--script', default='number-pattern.py')
+    parser.add_argument('--json', help='결과를 저장할 JSON 파일 경로')
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for workers in args.workers:
+            result = measure(workers, args, Path(directory) / f"sessions-{workers}.db")
+            results.append(result)
+            print(f"workers {workers:>2}  {result['runs_per_s']:>8.1f} runs/s  "
+                  f"clients per worker {result['clients_per_worker']}", flush=True)
+    for result in results:
+        print(f"workers {result['workers']:>2}  x{result['runs_per_s'] / results[0]['runs_per_s']:.2f} "
+              f"of {results[0]['workers']} worker(s)")
+    report = {'cpu_count': os.cpu_count(), 'script': args.script, 'results': results}
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    print(f"cpu_count {os.cpu_count()}")
+
+
+if __name__ == '__main__':
+    main()
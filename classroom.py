@@ -0,0 +1,156 @@
+import streamlit as st
+
+# 수업 모드 (선생님이 라운드마다 문제 하나를 내고 반 전체가 함께 풉니다)
+#   streamlit run classroom.py
+# 문제 선택과 표시 문자열은 engine.classroom이 라운드마다 한 번만 만들고,
+# 학생 화면은 그 라운드를 읽어서 그리기만 합니다. 화면은 1초마다 방 코드로 방을 다시 읽습니다.
+# (GAME_SESSION_STORE가 SQLite면 방이 그 파일에 있으므로 launch.py의 어느 워커에서든 같은 방을 봅니다)
+from engine.classroom import (
+    GAMES, classroom_tally, close_classroom, close_round, get_classroom, join_classroom, open_classroom,
+    start_round, submit_answer,
+)
+from engine.weather import WEATHER_EMOJIS
+
+GAME_TITLES = {'number-pattern': "🤖 숫자 추론", 'weather': "☀️ 날씨 추론"}
+TEACHER_KEY = 'classroom_teacher'  # 선생님이 연 방 코드
+STUDENT_KEY = 'classroom_student'  # (방 코드, 학생 번호)
+REFRESH_SECONDS = 1
+
+
+def on_open(game):
+    st.session_state[TEACHER_KEY] = open_classroom(game).code
+
+
+def on_end(code):
+    """수업을 끝내고 방을 지웁니다. (학생 화면은 다시 방 코드 입력으로 돌아갑니다)"""
+    close_classroom(code)
+    st.session_state.pop(TEACHER_KEY, None)
+
+
+def on_join():
+    code = st.session_state.get('classroom_code', '')
+    name = st.session_state.get('classroom_name', '')
+    student_id = join_classroom(code, name or "이름 없음")
+    if student_id is None:
+        st.session_state['classroom_error'] = f"'{code}' 방을 찾을 수 없어요."
+        return
+    st.session_state.pop('classroom_error', None)
+    st.session_state[STUDENT_KEY] = (code.strip().upper(), student_id)
+
+
+def on_answer(code, student_id, round_number):
+    guess = st.session_state.get(f"classroom_guess_{round_number}")
+    st.session_state[f"classroom_result_{round_number}"] = submit_answer(code, student_id, guess, round_number)
+
+
+def current_classroom(code):
+    """
+    방 코드로 지금 방을 읽습니다. 수업이 끝났거나 오래 쉬어서 지워진 방이면
+    전체 화면을 다시 그려 처음 화면으로 돌아갑니다.
+    """
+    classroom = get_classroom(code)
+    if classroom is None:
+        st.rerun(scope="app")
+    return classroom
+
+
+def guess_label(classroom, guess):
+    return WEATHER_EMOJIS[guess] if classroom.game == 'weather' else str(guess)
+
+
+@st.fragment(run_every=REFRESH_SECONDS)
+def teacher_board(code):
+    """선생님 화면: 지금 라운드 문제와 실시간 집계"""
+    classroom = current_classroom(code)
+    tally = classroom_tally(code)
+    if tally is None:  # 방을 읽은 사이에 지워졌습니다.
+        st.rerun(scope="app")
+    current = classroom.round
+    st.subheader(f"방 코드: {code}  ·  학생 {tally['students']}명")
+
+    col1, col2, col3 = st.columns(3)
+    col1.button("▶️ 다음 문제", on_click=start_round, args=(code,), width="stretch")
+    col2.button("⏹️ 정답 공개", on_click=close_round, args=(code,), disabled=not tally['open'],
+                width="stretch")
+    col3.button("🚪 수업 끝내기", on_click=on_end, args=(code,), width="stretch")
+    if current is None:
+        st.info("학생들이 들어오면 '다음 문제'를 눌러 첫 라운드를 시작하세요.")
+        return
+
+    st.markdown(f"### {tally['round']}번째 문제")
+    st.markdown(f"## {current.question['prompt']}")
+    st.metric("낸 학생", f"{tally['answered']} / {tally['students']}",
+              f"정답 {tally['correct']}명", delta_color="off")
+    if tally['guesses']:
+        st.bar_chart({guess_label(classroom, guess): count for guess, count in tally['guesses'].items()})
+    if not tally['open']:
+        st.success(f"정답: **{current.question['reveal']}**  \n규칙: {current.question['rule']}")
+    if tally['leaders']:
+        st.markdown("**🏆 순위**  \n" + "  \n".join(f"{name}: {score}점" for name, score in tally['leaders']))
+
+
+@st.fragment(run_every=REFRESH_SECONDS)
+def student_board(code, student_id):
+    """학생 화면: 선생님이 연 라운드를 읽어서 그리기만 합니다."""
+    classroom = current_classroom(code)
+    current = classroom.round
+    if current is None:
+        st.info("선생님이 문제를 내기를 기다리고 있어요…")
+        return
+
+    st.markdown(f"### {current.number}번째 문제")
+    st.markdown(f"## {current.question['prompt']}")
+    result = st.session_state.get(f"classroom_result_{current.number}")
+    answered = student_id in current.answered
+    if current.open and not answered:
+        if classroom.game == 'weather':
+            st.radio("내일 날씨를 선택하세요:", range(len(WEATHER_EMOJIS)),
+                     format_func=WEATHER_EMOJIS.__getitem__, key=f"classroom_guess_{current.number}")
+        else:
+            st.number_input("빈칸(?)에 들어갈 숫자를 입력하세요:", step=1, value=None,
+                            key=f"classroom_guess_{current.number}")
+        # 숫자를 지운 채로는 낼 수 없습니다. (engine.classroom도 빈 답은 받지 않습니다)
+        empty = st.session_state.get(f"classroom_guess_{current.number}") is None
+        st.button("🚀 정답 제출", on_click=on_answer, args=(code, student_id, current.number),
+                  disabled=empty)
+    elif current.open:
+        st.info("답을 냈어요! 선생님이 정답을 공개할 때까지 기다려 주세요.")
+    else:
+        if result:
+            st.success(f"🎉 **정답입니다!** 정답은 **{current.question['reveal']}**")
+        else:
+            st.error(f"정답은 **{current.question['reveal']}** 였어요.")
+        st.markdown(f"**✅ 규칙:** {current.question['rule']}")
+    st.caption(f"내 점수: {classroom.scores.get(student_id, 0)}점")
+
+
+def classroom_page():
+    st.set_page_config(layout="centered")
+    st.title("🏫 수업 모드")
+
+    role = st.radio("역할", ["학생", "선생님"], horizontal=True)
+    st.markdown("---")
+
+    if role == "선생님":
+        classroom = get_classroom(st.session_state.get(TEACHER_KEY))
+        if classroom is None:
+            game = st.selectbox("게임", GAMES, format_func=GAME_TITLES.__getitem__)
+            st.button("방 만들기", on_click=on_open, args=(game,))
+            return
+        teacher_board(classroom.code)
+        return
+
+    code, student_id = st.session_state.get(STUDENT_KEY, (None, None))
+    classroom = get_classroom(code)
+    if classroom is None:
+        st.text_input("방 코드", key='classroom_code')
+        st.text_input("이름", key='classroom_name')
+        st.button("들어가기", on_click=on_join)
+        if 'classroom_error' in st.session_state:
+            st.error(st.session_state['classroom_error'])
+        return
+    student_board(classroom.code, student_id)
+
+
+if __name__ == "__main__":
+    classroom_page()
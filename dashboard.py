@@ -0,0 +1,52 @@
+import os
+import sqlite3
+
+import streamlit as st
+
+# 문제별 난이도 통계 (읽기 전용)
+#   GAME_ANSWER_LOG=answers.db streamlit run dashboard.py
+# 원본 답안은 읽지 않고 engine.analytics가 미리 모아 둔 question_stats 표만 조회합니다.
+from engine.analytics import read_stats
+
+GAMES = [('number-pattern', "🤖 숫자 추론"), ('weather', "☀️ 날씨 추론"), ('price', "💰 가격 추론")]
+
+
+@st.cache_resource(show_spinner=False)
+def connect(path):
+    """읽기 전용으로 DB를 엽니다."""
+    return sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+
+
+def stat_rows(rows):
+    return [
+        {"문제": question, "시도": attempts, "정답률": f"{accuracy:.0%}",
+         "풀이 시간 중앙값(초)": p50, "풀이 시간 90%(초)": p90}
+        for _, question, attempts, accuracy, p50, p90 in rows
+    ]
+
+
+def dashboard():
+    st.set_page_config(layout="centered")
+    st.title("📊 문제별 난이도")
+
+    path = os.environ.get('GAME_ANSWER_LOG')
+    if not path or not os.path.exists(path):
+        st.info("GAME_ANSWER_LOG 환경 변수로 답안 기록 DB를 지정하면 통계를 볼 수 있어요.")
+        return
+
+    conn = connect(path)
+    st.caption("정답률이 낮은 문제부터 보여줍니다.")
+    for tab, (game, _) in zip(st.tabs([title for _, title in GAMES]), GAMES):
+        with tab:
+            try:
+                rows = read_stats(conn, game)
+            except sqlite3.OperationalError:  # 아직 통계 표가 만들어지지 않음
+                rows = []
+            if rows:
+                st.dataframe(stat_rows(rows), hide_index=True)
+            else:
+                st.write("기록된 답안이 없어요.")
+
+
+if __name__ == "__main__":
+    dashboard()
@@ -0,0 +1,11 @@
+"""
+Streamlit 없이 동작하는 게임 엔진
+
+문제 생성, 채점, 상태 전이를 순수 파이썬 객체로 처리합니다.
+Streamlit 스크립트(number-pattern.py, weather.py, price.py)는 이 엔진 위에서 화면만 그립니다.
+
+    from engine import number_pattern as game
+    state = game.NumberPatternState()
+    game.start_new_question(state)
+    game.submit_answer(state, 42)
+"""
@@ -0,0 +1,132 @@
+# 답안 기록(answers 테이블)을 문제별 통계로 미리 모아 두는 단계
+# 원본 답안을 매번 다시 읽지 않도록, 마지막으로 처리한 행 번호(watermark) 이후의 답안만
+# 읽어서 문제별 시도 수, 정답 수, 풀이 시간 히스토그램을 갱신합니다.
+# 풀이 시간 백분위수는 고정 구간 히스토그램에서 구하므로 문제 하나당 저장 공간이 일정합니다.
+#   python -m engine.analytics answers.db   (쌓여 있는 답안을 한 번에 반영)
+import json
+import sqlite3
+import sys
+from bisect import bisect_left
+
+# 풀이 시간 구간 (초). 0.25초부터 1.25배씩 늘려 약 10분까지
+LATENCY_BOUNDS = tuple(round(0.25 * 1.25 ** i, 3) for i in range(36))
+BATCH_SIZE = 10_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS question_stats (
+    game TEXT NOT NULL,
+    question TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    latency_sum REAL NOT NULL,
+    latency_counts TEXT NOT NULL,
+    accuracy REAL NOT NULL,
+    p50 REAL NOT NULL,
+    p90 REAL NOT NULL,
+    PRIMARY KEY (game, question)
+);
+CREATE TABLE IF NOT EXISTS aggregate_watermark (
+    name TEXT PRIMARY KEY,
+    last_id INTEGER NOT NULL
+);
+"""
+UPSERT = """
+INSERT OR REPLACE INTO question_stats
+    (game, question, attempts, correct, latency_sum, latency_counts, accuracy, p50, p90)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def percentile(counts, fraction):
+    """히스토그램에서 백분위수를 구간 위쪽 경계값으로 돌려줍니다."""
+    target = fraction * sum(counts)
+    seen = 0
+    for bound, count in zip(LATENCY_BOUNDS, counts):
+        seen += count
+        if seen >= target:
+            return bound
+    return LATENCY_BOUNDS[-1]  # 마지막 구간보다 오래 걸린 답안
+
+
+def create_tables(conn):
+    conn.executescript(SCHEMA)
+
+
+def update_aggregates(conn, batch_size=BATCH_SIZE):
+    """
+    watermark 이후의 답안을 문제별 통계에 반영하고, 반영한 답안 수를 돌려줍니다.
+    묶음마다 watermark 읽기부터 통계와 watermark 쓰기까지를 BEGIN IMMEDIATE 트랜잭션 하나로 묶으므로
+    여러 워커가 같은 DB를 갱신하거나 중간에 멈춰도 같은 답안을 두 번 세지 않습니다.
+    """
+    create_tables(conn)
+    total = 0
+    while True:
+        conn.execute("BEGIN IMMEDIATE")  # 쓰기 잠금을 먼저 잡습니다.
+        try:
+            count = aggregate_batch(conn, batch_size)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        if not count:
+            return total
+        total += count
+
+
+def aggregate_batch(conn, batch_size):
+    """watermark 다음 답안 batch_size개를 통계에 반영하고 그 수를 돌려줍니다. (트랜잭션 안에서 부릅니다)"""
+    row = conn.execute("SELECT last_id FROM aggregate_watermark WHERE name = 'answers'").fetchone()
+    last_id = row[0] if row else 0
+    rows = conn.execute(
+        "SELECT id, game, question, is_correct, latency FROM answers WHERE id > ? ORDER BY id LIMIT ?",
+        (last_id, batch_size),
+    ).fetchall()
+    if not rows:
+        return 0
+
+    # 이번 묶음에 나온 문제의 기존 통계만 불러와서 갱신합니다.
+    stats = {}
+    for _, game, question, is_correct, latency in rows:
+        key = (game, question)
+        if key not in stats:
+            stored = conn.execute(
+                "SELECT attempts, correct, latency_sum, latency_counts FROM question_stats "
+                "WHERE game = ? AND question = ?", key,
+            ).fetchone()
+            if stored:
+                stats[key] = [stored[0], stored[1], stored[2], json.loads(stored[3])]
+            else:
+                stats[key] = [0, 0, 0.0, [0] * (len(LATENCY_BOUNDS) + 1)]
+        entry = stats[key]
+        entry[0] += 1
+        entry[1] += is_correct
+        entry[2] += latency
+        entry[3][bisect_left(LATENCY_BOUNDS, latency)] += 1
+
+    conn.executemany(UPSERT, [
+        (game, question, attempts, correct, latency_sum, json.dumps(counts),
+         correct / attempts, percentile(counts, 0.5), percentile(counts, 0.9))
+        for (game, question), (attempts, correct, latency_sum, counts) in stats.items()
+    ])
+    conn.execute("INSERT OR REPLACE INTO aggregate_watermark (name, last_id) VALUES ('answers', ?)",
+                 (rows[-1][0],))
+    return len(rows)
+
+
+def read_stats(conn, game=None):
+    """미리 모아 둔 문제별 통계를 정답률이 낮은 순서로 돌려줍니다. (원본 답안은 읽지 않습니다)"""
+    query = "SELECT game, question, attempts, accuracy, p50, p90 FROM question_stats"
+    params = ()
+    if game:
+        query += " WHERE game = ?"
+        params = (game,)
+    return conn.execute(query + " ORDER BY accuracy, attempts DESC", params).fetchall()
+
+
+def main():
+    conn = sqlite3.connect(sys.argv[1])
+    print(f"{update_aggregates(conn)} answers aggregated")
+
+
+if __name__ == '__main__':
+    main()
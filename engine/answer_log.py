@@ -0,0 +1,183 @@
+# 답안 기록 (SQLite, WAL 모드)
+# GAME_ANSWER_LOG 환경 변수에 DB 파일 경로를 주면 켜집니다.
+#   GAME_ANSWER_LOG=answers.db streamlit run app.py
+# 스크립트 실행 중에는 큐에 넣기만 하고, 디스크 쓰기는 백그라운드 스레드가 묶어서 처리합니다.
+# 큐가 가득 차면 기다리지 않고 버린 뒤 버린 개수(dropped)를 셉니다.
+# DB를 열거나 쓰다가 오류가 나면 그 묶음은 버린 것으로 세고, 로그를 남긴 뒤 다음 묶음에서 다시 연결합니다.
+# 답안을 쓴 뒤에는 같은 스레드에서 문제별 통계(engine.analytics)도 이어서 갱신합니다.
+import atexit
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from .analytics import update_aggregates
+
+MAX_QUEUE = 10_000
+BATCH_SIZE = 256
+FLUSH_INTERVAL = 0.5  # 초. 이 시간 동안 모인 답안을 한 번에 씁니다.
+RETRY_INTERVAL = 1.0  # 초. DB 오류가 난 뒤 다시 연결하기 전에 기다리는 시간
+CLOSE_TIMEOUT = 5.0  # 초. 종료할 때 남은 답안을 쓰기를 기다리는 최대 시간
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    id INTEGER PRIMARY KEY,
+    time REAL NOT NULL,
+    game TEXT NOT NULL,
+    question TEXT NOT NULL,
+    guess INTEGER,
+    is_correct INTEGER NOT NULL,
+    latency REAL NOT NULL
+)
+"""
+INSERT = "INSERT INTO answers (time, game, question, guess, is_correct, latency) VALUES (?, ?, ?, ?, ?, ?)"
+
+_STOP = object()
+logger = logging.getLogger(__name__)
+
+
+def connect(path):
+    """WAL 모드로 DB를 열고 answers 테이블을 만듭니다."""
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(SCHEMA)
+    conn.commit()
+    return conn
+
+
+class AnswerLog:
+    """답안을 큐에 모았다가 백그라운드 스레드에서 묶어서 INSERT 합니다."""
+
+    def __init__(self, path, max_queue=MAX_QUEUE, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL,
+                 retry_interval=RETRY_INTERVAL):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retry_interval = retry_interval
+        self.queue = queue.Queue(max_queue)
+        self.dropped = 0
+        self.written = 0
+        self.writer = None
+        self.lock = threading.Lock()
+
+    def record(self, game, question, guess, is_correct, shown_at):
+        """답안 하나를 큐에 넣습니다. shown_at은 문제를 보여준 시각(time.monotonic())입니다."""
+        now = time.monotonic()
+        row = (time.time(), game, str(question), guess, int(bool(is_correct)), now - shown_at)
+        self.start()
+        try:
+            self.queue.put_nowait(row)
+        except queue.Full:
+            with self.lock:
+                self.dropped += 1
+
+    def start(self):
+        """처음 기록할 때 쓰기 스레드를 띄우고, 종료할 때 남은 답안을 모두 쓰도록 등록합니다."""
+        if self.writer is not None:
+            return
+        with self.lock:
+            if self.writer is not None:
+                return
+            self.writer = threading.Thread(target=self._write_loop, name='answer-log', daemon=True)
+            self.writer.start()
+        atexit.register(self.close)
+
+    def close(self, timeout=CLOSE_TIMEOUT):
+        """큐에 남은 답안을 모두 쓰고 쓰기 스레드를 멈춥니다. (timeout초 넘게 걸리면 기다리지 않습니다)"""
+        if self.writer is None:
+            return
+        deadline = time.monotonic() + timeout
+        try:
+            self.queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning("answer log queue is still full after %.1fs; %d answers not written",
+                           timeout, self.queue.qsize())
+        else:
+            self.writer.join(max(deadline - time.monotonic(), 0))
+            if self.writer.is_alive():
+                logger.warning("answer log writer did not finish within %.1fs", timeout)
+        self.writer = None
+
+    def _write_batch(self, conn, batch):
+        """묶음 하나를 씁니다. 실패하면 로그를 남기고 버린 개수로 센 뒤 None을 돌려줘서 다시 연결하게 합니다."""
+        try:
+            if conn is None:
+                conn = connect(self.path)
+            with conn:
+                conn.executemany(INSERT, batch)
+        except Exception:
+            logger.exception("answer log: could not write %d answers to %s", len(batch), self.path)
+            with self.lock:
+                self.dropped += len(batch)
+            if conn is not None:
+                conn.close()
+            time.sleep(self.retry_interval)
+            return None
+        self.written += len(batch)
+        try:
+            update_aggregates(conn)
+        except Exception:  # 답안은 이미 썼으므로 통계는 다음 묶음에서 이어서 갱신합니다.
+            logger.exception("answer log: could not update question aggregates")
+        return conn
+
+    def _write_loop(self):
+        conn = None  # 첫 묶음을 쓸 때 엽니다.
+        try:
+            stopping = False
+            while not stopping:
+                batch = [self.queue.get()]
+                # 첫 답안이 들어오면 잠깐 더 모아서 한 트랜잭션으로 씁니다.
+                deadline = time.monotonic() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(self.queue.get(timeout=timeout))
+                    except queue.Empty:
+                        break
+                if _STOP in batch:
+                    stopping = True
+                    batch.remove(_STOP)
+                    # 멈추기 전에 큐에 남은 것까지 모두 씁니다.
+                    while True:
+                        try:
+                            batch.append(self.queue.get_nowait())
+                        except queue.Empty:
+                            break
+                if batch:
+                    conn = self._write_batch(conn, batch)
+        finally:
+            if conn is not None:
+                conn.close()
+
+
+class NullAnswerLog:
+    """기록이 꺼져 있을 때 쓰는 객체. 아무 일도 하지 않습니다."""
+
+    dropped = 0
+    written = 0
+
+    def record(self, game, question, guess, is_correct, shown_at):
+        pass
+
+    def close(self, timeout=CLOSE_TIMEOUT):
+        pass
+
+
+_answer_log = None
+_answer_log_lock = threading.Lock()
+
+
+def get_answer_log():
+    """GAME_ANSWER_LOG가 있으면 공유 AnswerLog를, 없으면 NullAnswerLog를 돌려줍니다."""
+    global _answer_log
+    if _answer_log is None:
+        with _answer_log_lock:
+            if _answer_log is None:
+                path = os.environ.get('GAME_ANSWER_LOG')
+                _answer_log = AnswerLog(path) if path else NullAnswerLog()
+    return _answer_log
@@ -0,0 +1,365 @@
+# 수업 모드: 선생님이 문제를 한 라운드씩 내고 반 전체가 같은 문제를 푸는 방
+# 학생마다 start_new_question()으로 문제를 고르고 화면 문자열을 만드는 대신,
+# 라운드를 열 때 문제 선택과 표시 문자열 만들기를 한 번만 하고 모든 학생 세션이 그 결과를 같이 읽습니다.
+# 답은 방 하나의 집계(보기별 인원, 정답 수, 학생별 점수)에 모으고, 방을 바꾸는 일은 저장소가 한 번에 하나씩 합니다.
+# 방 저장소는 GAME_SESSION_STORE를 따릅니다.
+#   sqlite:///경로 → 세션과 같은 SQLite 파일의 classrooms 표 (launch.py 워커 여러 개가 같은 방을 봅니다)
+#   그 밖        → 현재 프로세스 메모리 (방마다 잠금 하나)
+# 선생님이 수업을 끝내면 방을 지우고, 끝내지 않고 떠난 방도 ROOM_IDLE_SECONDS 동안 아무 일이 없으면
+# 새 방을 열 때 함께 지웁니다.
+import os
+import pickle
+import secrets
+import sqlite3
+import threading
+import time
+from collections import Counter
+
+from . import number_pattern, weather
+from .rng import new_seed
+from .scheduler import QuestionOrder
+
+GAMES = ('number-pattern', 'weather')
+CODE_ALPHABET = 'ABCDEFGHJKLMNPQRSTUVWXYZ23456789'  # 헷갈리는 글자(0/O, 1/I) 제외
+CODE_LENGTH = 4
+ROOM_IDLE_SECONDS = 2 * 60 * 60  # 마지막 입장/라운드/답 이후 이만큼 지난 방은 지웁니다.
+
+
+def number_round_question(order):
+    """숫자 추론 라운드 문제 (한 방 안에서는 겹치지 않습니다)"""
+    question_id = number_pattern.question_id_at(order.cursor, order.key)
+    order.cursor += 1
+    q_data = number_pattern.get_question(question_id)
+    return {
+        'question': question_id,
+        'prompt': number_pattern.display_sequence_str(q_data),
+        'answer': number_pattern.correct_answer(q_data),
+        'reveal': number_pattern.full_sequence_str(q_data),
+        'rule': q_data['rule_desc'],
+    }
+
+
+def weather_round_question(order):
+    """날씨 추론 라운드 문제 (답은 날씨 코드)"""
+    pattern_id = order.next(weather.PATTERN_COUNT, cycle=True)
+    history, _ = weather.build_weather_history(pattern_id)
+    answer = weather.NEXT_WEATHER[pattern_id]
+    return {
+        'question': weather.pattern_name(pattern_id),
+        'prompt': ' '.join(history),
+        'answer': answer,
+        'reveal': weather.WEATHER_EMOJIS[answer],
+        'rule': weather.pattern_description(pattern_id),
+    }
+
+
+ROUND_BUILDERS = {
+    'number-pattern': number_round_question,
+    'weather': weather_round_question,
+}
+
+
+class Round:
+    """라운드 하나 (문제와 표시 문자열은 열 때 한 번 만들고, 이후에는 집계만 바뀝니다)"""
+
+    __slots__ = ('number', 'question', 'opened_at', 'open', 'guesses', 'correct', 'answered')
+
+    def __init__(self, number, question):
+        self.number: int = number
+        self.question: dict = question
+        self.opened_at: float = time.time()
+        self.open: bool = True
+        self.guesses: Counter = Counter()  # 보기(입력값)별 인원
+        self.correct: int = 0
+        self.answered: set = set()  # 이미 낸 학생 번호 (한 사람이 여러 번 내지 못하게)
+
+
+class Classroom:
+    """방 하나 (학생 명단, 점수, 지금 라운드). 바꾸는 메서드는 방 저장소가 잠금이나 트랜잭션 안에서 부릅니다."""
+
+    __slots__ = ('code', 'game', 'order', 'students', 'scores', 'round', 'version', 'last_active')
+
+    def __init__(self, code, game, seed=None):
+        if game not in ROUND_BUILDERS:
+            raise ValueError(f"수업 모드를 지원하지 않는 게임입니다: {game}")
+        self.code: str = code
+        self.game: str = game
+        self.order: QuestionOrder = QuestionOrder(new_seed() if seed is None else int(seed))
+        self.students: dict = {}  # 학생 번호 -> 이름
+        self.scores: Counter = Counter()
+        self.round: Round | None = None
+        self.version: int = 0  # 무엇이든 바뀔 때마다 1씩 늘어납니다. (화면이 다시 그릴지, 저장할지 판단)
+        self.last_active: float = time.time()  # 마지막으로 무엇이 바뀐 시각 (오래 쉰 방 지우기, 워커끼리 같은 시계)
+
+    def changed(self):
+        """무엇이 바뀔 때마다 부릅니다."""
+        self.version += 1
+        self.last_active = time.time()
+
+    def join(self, name):
+        """학생을 방에 넣고 학생 번호를 돌려줍니다."""
+        student_id = secrets.token_hex(8)
+        self.students[student_id] = name
+        self.changed()
+        return student_id
+
+    def start_round(self):
+        """지난 라운드를 닫고 다음 문제로 새 라운드를 엽니다. (문제와 표시 문자열은 여기서 한 번만 만듭니다)"""
+        number = self.round.number + 1 if self.round else 1
+        self.round = Round(number, ROUND_BUILDERS[self.game](self.order))
+        self.changed()
+        return self.round
+
+    def close_round(self):
+        """답 받기를 멈추고 정답을 공개합니다."""
+        if self.round is not None and self.round.open:
+            self.round.open = False
+            self.changed()
+
+    def submit(self, student_id, guess, round_number):
+        """
+        학생의 답을 집계합니다. 정답 여부를 돌려주고, 답이 비어 있거나(None)
+        round_number 라운드가 이미 지나갔거나 닫혔거나 이미 낸 학생이면 None을 돌려줍니다.
+        """
+        current = self.round
+        if current is None or guess is None or current.number != round_number:
+            return None
+        if not current.open or student_id in current.answered:
+            return None
+        is_correct = guess == current.question['answer']
+        current.answered.add(student_id)
+        current.guesses[guess] += 1
+        if is_correct:
+            current.correct += 1
+            self.scores[student_id] += 1
+        self.changed()
+        return is_correct
+
+    def tally(self):
+        """화면에 보여줄 집계 사본"""
+        current = self.round
+        return {
+            'version': self.version,
+            'students': len(self.students),
+            'round': current.number if current else 0,
+            'open': current.open if current else False,
+            'answered': len(current.answered) if current else 0,
+            'correct': current.correct if current else 0,
+            'guesses': dict(current.guesses) if current else {},
+            'leaders': [(self.students[sid], score) for sid, score in self.scores.most_common(5)],
+        }
+
+
+def new_code():
+    return ''.join(secrets.choice(CODE_ALPHABET) for _ in range(CODE_LENGTH))
+
+
+class MemoryRooms:
+    """현재 프로세스 메모리에 두는 방 저장소 (워커 하나일 때). 방마다 잠금 하나로 보호합니다."""
+
+    def __init__(self):
+        self.rooms = {}
+        self.locks = {}
+        self.lock = threading.Lock()  # rooms/locks 자체를 바꿀 때
+
+    def create(self, game, seed=None, idle_seconds=ROOM_IDLE_SECONDS):
+        self.evict_idle(idle_seconds)
+        with self.lock:
+            code = new_code()
+            while code in self.rooms:
+                code = new_code()
+            self.locks[code] = threading.Lock()
+            classroom = self.rooms[code] = Classroom(code, game, seed)
+        return classroom
+
+    def get(self, code):
+        return self.rooms.get(code)
+
+    def update(self, code, change, *args):
+        """방을 잠그고 change(방, *args)의 결과를 돌려줍니다. 방이 없으면 None."""
+        lock = self.locks.get(code)
+        if lock is None:
+            return None
+        with lock:
+            classroom = self.rooms.get(code)
+            return change(classroom, *args) if classroom is not None else None
+
+    def view(self, code, read):
+        """다른 스레드가 바꾸는 도중이 아닌 방으로 read(방)을 부릅니다. 방이 없으면 None."""
+        return self.update(code, read)
+
+    def delete(self, code):
+        with self.lock:
+            self.rooms.pop(code, None)
+            self.locks.pop(code, None)
+
+    def evict_idle(self, idle_seconds):
+        now = time.time()
+        with self.lock:
+            idle = [code for code, classroom in self.rooms.items() if now - classroom.last_active > idle_seconds]
+            for code in idle:
+                del self.rooms[code], self.locks[code]
+        return len(idle)
+
+
+ROOM_SCHEMA = """
+CREATE TABLE IF NOT EXISTS classrooms (
+    code TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    updated REAL NOT NULL
+)
+"""
+
+
+class SqliteRooms:
+    """
+    SQLite 파일에 두는 방 저장소 (launch.py 워커 여러 개가 같은 방을 봅니다).
+    방을 바꿀 때는 BEGIN IMMEDIATE로 읽고-바꾸고-쓰기를 한 번에 하고, 읽을 때는 version이 그대로면
+    이 프로세스에 남겨 둔 사본을 씁니다. (학생 화면은 1초마다 방을 읽습니다)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.local = threading.local()  # 스레드마다 연결 하나
+        self.cache = {}  # 방 코드 -> (version, Classroom 사본)
+
+    def connection(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = self.local.conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(ROOM_SCHEMA)
+        return conn
+
+    def create(self, game, seed=None, idle_seconds=ROOM_IDLE_SECONDS):
+        conn = self.connection()
+        self.evict_idle(idle_seconds)
+        while True:
+            classroom = Classroom(new_code(), game, seed)
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO classrooms (code, version, data, updated) VALUES (?, ?, ?, ?)",
+                (classroom.code, classroom.version, pickle.dumps(classroom), classroom.last_active))
+            if cursor.rowcount:
+                return classroom
+
+    def get(self, code):
+        conn = self.connection()
+        row = conn.execute("SELECT version FROM classrooms WHERE code = ?", (code,)).fetchone()
+        if row is None:
+            self.cache.pop(code, None)
+            return None
+        cached = self.cache.get(code)
+        if cached is not None and cached[0] == row[0]:
+            return cached[1]
+        row = conn.execute("SELECT version, data FROM classrooms WHERE code = ?", (code,)).fetchone()
+        if row is None:
+            return None
+        classroom = pickle.loads(row[1])
+        self.cache[code] = (row[0], classroom)
+        return classroom
+
+    def update(self, code, change, *args):
+        """다른 워커가 같은 방을 동시에 바꾸지 못하게 트랜잭션 안에서 change(방, *args)를 부릅니다."""
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT data FROM classrooms WHERE code = ?", (code,)).fetchone()
+            if row is None:
+                conn.execute("ROLLBACK")
+                return None
+            classroom = pickle.loads(row[0])
+            version = classroom.version
+            result = change(classroom, *args)
+            if classroom.version != version:
+                conn.execute("UPDATE classrooms SET version = ?, data = ?, updated = ? WHERE code = ?",
+                             (classroom.version, pickle.dumps(classroom), classroom.last_active, code))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        self.cache[code] = (classroom.version, classroom)
+        return result
+
+    def view(self, code, read):
+        """읽기 전용 사본으로 read(방)을 부릅니다. (쓰기 잠금을 잡지 않습니다) 방이 없으면 None."""
+        classroom = self.get(code)
+        return read(classroom) if classroom is not None else None
+
+    def delete(self, code):
+        self.connection().execute("DELETE FROM classrooms WHERE code = ?", (code,))
+        self.cache.pop(code, None)
+
+    def evict_idle(self, idle_seconds):
+        cursor = self.connection().execute("DELETE FROM classrooms WHERE updated < ?", (time.time() - idle_seconds,))
+        return cursor.rowcount
+
+
+def open_rooms(url):
+    """GAME_SESSION_STORE와 같은 주소로 방 저장소를 만듭니다. (SQLite가 아니면 프로세스 메모리)"""
+    if url and url.startswith('sqlite:///'):
+        return SqliteRooms(url[len('sqlite:///'):])
+    return MemoryRooms()
+
+
+_rooms = None
+_rooms_lock = threading.Lock()
+
+
+def get_rooms():
+    """GAME_SESSION_STORE로 정한 공유 방 저장소를 돌려줍니다."""
+    global _rooms
+    if _rooms is None:
+        with _rooms_lock:
+            if _rooms is None:
+                _rooms = open_rooms(os.environ.get('GAME_SESSION_STORE'))
+    return _rooms
+
+
+def normalize_code(code):
+    return code.strip().upper() if code else None
+
+
+def open_classroom(game, seed=None):
+    """새 방을 만들고 돌려줍니다. (방 코드는 학생이 입력하기 쉽게 짧게 만듭니다)"""
+    return get_rooms().create(game, seed)
+
+
+def get_classroom(code):
+    """방 코드로 방을 찾습니다. 없으면 None. (SQLite 저장소에서는 읽기 전용 사본입니다)"""
+    code = normalize_code(code)
+    return get_rooms().get(code) if code else None
+
+
+def join_classroom(code, name):
+    """학생을 방에 넣고 학생 번호를 돌려줍니다. 방이 없으면 None."""
+    return get_rooms().update(normalize_code(code), Classroom.join, name)
+
+
+def start_round(code):
+    return get_rooms().update(code, Classroom.start_round)
+
+
+def close_round(code):
+    get_rooms().update(code, Classroom.close_round)
+
+
+def submit_answer(code, student_id, guess, round_number):
+    """학생의 답을 집계하고 정답 여부를 돌려줍니다. (받지 않은 답이면 None)"""
+    return get_rooms().update(code, Classroom.submit, student_id, guess, round_number)
+
+
+def classroom_tally(code):
+    """화면에 보여줄 방 집계 (Classroom.tally). 방이 없으면 None."""
+    return get_rooms().view(code, Classroom.tally)
+
+
+def close_classroom(code):
+    """선생님이 수업을 끝낸 방을 지웁니다."""
+    get_rooms().delete(code)
+
+
+def evict_idle_classrooms(idle_seconds=ROOM_IDLE_SECONDS):
+    """오랫동안 아무 일이 없던 방을 지우고, 지운 방 수를 돌려줍니다."""
+    return get_rooms().evict_idle(idle_seconds)
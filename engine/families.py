@@ -0,0 +1,188 @@
+# 항을 미리 만들어 두지 않는 수열 (필요한 항만 계산)
+# 덧셈/곱셈/제곱(2차식)/피보나치 같은 점화식/번갈아 나오는 규칙을 지원하고,
+# n번째 항은 닫힌 식이나 행렬 거듭제곱으로 O(log n)번의 정수 연산만에 구합니다.
+# 파이썬 정수를 그대로 쓰므로 값이 아무리 커져도 정확합니다.
+import math
+from abc import ABC, abstractmethod
+
+SHOWN_TERMS = 5  # 문제에서 앞쪽에 보여주는 항 수
+DIGITS_SHOWN = 30  # 이보다 긴 수는 줄여서 보여줍니다.
+
+
+class SequenceFamily(ABC):
+    """n번째 항(0부터 셈)을 바로 계산하는 수열의 공통 부분 (term과 rule_desc는 가족마다 구현합니다)"""
+
+    __slots__ = ()
+    type = None
+
+    @abstractmethod
+    def term(self, n):
+        """n번째 항"""
+
+    def terms(self, start, stop):
+        return [self.term(n) for n in range(start, stop)]
+
+    @abstractmethod
+    def rule_desc(self):
+        """FIXED_SEQUENCES와 같은 말투의 규칙 설명"""
+
+
+class Arithmetic(SequenceFamily):
+    __slots__ = ('start', 'diff')
+    type = 'arithmetic'
+
+    def __init__(self, start, diff):
+        self.start = start
+        self.diff = diff
+
+    def term(self, n):
+        return self.start + n * self.diff
+
+    def rule_desc(self):
+        if self.diff < 0:
+            return f"{-self.diff}씩 작아지는 (빼기) 패턴"
+        return f"{self.diff}씩 커지는 (더하기) 패턴"
+
+
+class Geometric(SequenceFamily):
+    __slots__ = ('start', 'ratio')
+    type = 'geometric'
+
+    def __init__(self, start, ratio):
+        self.start = start
+        self.ratio = ratio
+
+    def term(self, n):
+        return self.start * self.ratio ** n
+
+    def rule_desc(self):
+        return f"{self.ratio}씩 곱하는 패턴"
+
+
+class Quadratic(SequenceFamily):
+    """a·n² + b·n + c (이웃한 항의 차이가 2a씩 커지는 수열)"""
+
+    __slots__ = ('a', 'b', 'c')
+    type = 'quadratic'
+
+    def __init__(self, a, b, c):
+        self.a = a
+        self.b = b
+        self.c = c
+
+    def term(self, n):
+        return (self.a * n + self.b) * n + self.c
+
+    def rule_desc(self):
+        first_gap = self.term(1) - self.term(0)
+        return f"더하는 수가 {first_gap}부터 {2 * self.a}씩 커지는 패턴"
+
+
+class LinearRecurrence(SequenceFamily):
+    """
+    a(n) = c1·a(n-1) + c2·a(n-2) + ... + ck·a(n-k) 꼴의 점화식 (피보나치: coefficients=(1, 1))
+    동반 행렬의 거듭제곱으로 n번째 항을 구합니다.
+    """
+
+    __slots__ = ('coefficients', 'initial')
+    type = 'recurrence'
+
+    def __init__(self, coefficients, initial):
+        if len(coefficients) != len(initial):
+            raise ValueError("점화식 계수와 첫 항의 개수가 같아야 합니다.")
+        self.coefficients = tuple(coefficients)
+        self.initial = tuple(initial)
+
+    def term(self, n):
+        k = len(self.initial)
+        if n < k:
+            return self.initial[n]
+        # [a(n+k-1), ..., a(n)] = M^(n-k+1) · [a(k-1), ..., a(0)]
+        companion = [list(self.coefficients)] + [[int(i == j) for j in range(k)] for i in range(k - 1)]
+        power = matrix_power(companion, n - k + 1)
+        state = self.initial[::-1]
+        return sum(x * y for x, y in zip(power[0], state))
+
+    def terms(self, start, stop):
+        # 연속한 항은 점화식을 그대로 따라가는 편이 빠릅니다.
+        k = len(self.initial)
+        if start >= stop:
+            return []
+        window = [self.term(n) for n in range(start, min(start + k, stop))]
+        while len(window) < stop - start:
+            window.append(sum(c * x for c, x in zip(self.coefficients, reversed(window[-k:]))))
+        return window
+
+    def rule_desc(self):
+        if self.coefficients == (1, 1):
+            return "앞의 두 수를 더하는 패턴"
+        if len(self.coefficients) == 1:
+            return f"{self.coefficients[0]}씩 곱하는 패턴"
+        parts = [f"{c}×(앞의 {i}번째 수)" if c != 1 else f"앞의 {i}번째 수"
+                 for i, c in enumerate(self.coefficients, 1) if c]
+        return " + ".join(parts) + " 패턴"
+
+
+class Alternating(SequenceFamily):
+    """여러 수열이 번갈아 나오는 수열 (홀수 번째는 첫 수열, 짝수 번째는 둘째 수열 ...)"""
+
+    __slots__ = ('families',)
+    type = 'alternating'
+
+    def __init__(self, *families):
+        self.families = families
+
+    def term(self, n):
+        count = len(self.families)
+        return self.families[n % count].term(n // count)
+
+    def rule_desc(self):
+        if len(self.families) == 2:
+            odd, even = self.families
+            return f"두 수열이 번갈아 나오는 패턴 (홀수 번째: {odd.rule_desc()}, 짝수 번째: {even.rule_desc()})"
+        return f"{len(self.families)}개의 수열이 차례로 번갈아 나오는 패턴"
+
+
+def matrix_power(matrix, exponent):
+    """정수 정사각 행렬의 거듭제곱 (제곱을 반복해서 O(log exponent)번 곱합니다)"""
+    size = len(matrix)
+    result = [[int(i == j) for j in range(size)] for i in range(size)]
+    while exponent:
+        if exponent & 1:
+            result = matrix_multiply(result, matrix)
+        exponent >>= 1
+        if exponent:
+            matrix = matrix_multiply(matrix, matrix)
+    return result
+
+
+def matrix_multiply(a, b):
+    columns = list(zip(*b))
+    return [[sum(x * y for x, y in zip(row, column)) for column in columns] for row in a]
+
+
+def format_term(value, max_digits=DIGITS_SHOWN):
+    """아주 큰 수는 '1.2346×10^208987'처럼 줄여 씁니다. (전체를 10진수 문자열로 바꾸지 않습니다)"""
+    bits = abs(value).bit_length()
+    if bits * math.log10(2) < max_digits:
+        return str(value)
+    shift = bits - 64
+    exponent = math.log10(abs(value) >> shift) + shift * math.log10(2)
+    mantissa = 10 ** (exponent - math.floor(exponent))
+    sign = '-' if value < 0 else ''
+    return f"{sign}{mantissa:.4f}×10^{math.floor(exponent)}"
+
+
+def lazy_display_terms(family, blank_index, shown=SHOWN_TERMS, reveal=False):
+    """
+    앞쪽 shown개 항과 빈칸(blank_index번째 항)만 문자열로 만듭니다.
+    빈칸이 멀리 있으면 사이를 '⋯'로 줄이므로 수열 전체를 만들지 않습니다.
+    """
+    parts = [format_term(value) for value in family.terms(0, shown)]
+    if blank_index >= shown:
+        if blank_index > shown:
+            parts.append('⋯')
+        parts.append(f"({blank_index + 1:,}번째) " + (format_term(family.term(blank_index)) if reveal else '?'))
+    elif not reveal:
+        parts[blank_index] = '?'
+    return parts
@@ -0,0 +1,108 @@
+# 날씨 이력으로 내일 날씨를 예측하는 n-그램(마르코프) 예측기
+# 이력은 날씨 코드(0=맑음, 1=비, 2=구름) 배열이고, 모든 계산은 NumPy 배열 연산이라
+# 이력 길이에 비례하는 시간만 듭니다. (파이썬 반복은 차수 k나 주기 후보 수만큼만 돕니다)
+#   1. 가장 짧은 주기 찾기: p칸 민 이력과 얼마나 어긋나는지 비교 (잡음이 있으면 허용 비율 안에서)
+#   2. 차수 k 전이 세기: 직전 k일을 3진수 하나로 묶고 np.bincount로 (문맥, 다음 날씨) 횟수를 셉니다.
+#   3. 확률: 주기가 있으면 내일과 같은 자리에 있던 날들의 횟수, 없으면 마지막 k일 문맥의 전이 횟수에
+#      가산 평활(Dirichlet alpha)을 더해 나눕니다.
+#      본 횟수가 적을수록 한 날씨에 몰아주지 않으므로 6일짜리 이력에서도 지나치게 확신하지 않습니다.
+import numpy as np
+
+NUM_WEATHERS = 3
+ALPHA = 0.5  # 가산 평활 (Krichevsky-Trofimov)
+MAX_ORDER = 12  # 전이 표가 3 ** 12 * 3칸(약 160만)을 넘지 않게 하고, 찾아볼 주기 후보도 여기까지만 봅니다.
+
+
+def as_codes(history):
+    return np.asarray(history, dtype=np.int64)
+
+
+def context_codes(history, order, num_states=NUM_WEATHERS):
+    """i번째 값이 history[i:i+order]를 num_states진수로 읽은 수인 배열 (길이 n - order + 1)"""
+    history = as_codes(history)
+    count = len(history) - order + 1
+    codes = np.zeros(max(count, 0), dtype=np.int64)
+    for i in range(order):  # order번만 돕니다.
+        codes = codes * num_states + history[i:i + count]
+    return codes
+
+
+def transition_counts(history, order, num_states=NUM_WEATHERS):
+    """(문맥 수, num_states) 모양의 전이 횟수 표. 행은 직전 order일, 열은 다음 날 날씨입니다."""
+    history = as_codes(history)
+    contexts = num_states ** order
+    if len(history) <= order:
+        return np.zeros((contexts, num_states), dtype=np.int64)
+    codes = context_codes(history[:-1], order, num_states)
+    pairs = codes * num_states + history[order:]
+    return np.bincount(pairs, minlength=contexts * num_states).reshape(contexts, num_states)
+
+
+def mismatch_rates(history, max_period):
+    """p = 1..max_period마다 history[i]와 history[i-p]가 다른 비율"""
+    history = as_codes(history)
+    return np.array([np.count_nonzero(history[p:] != history[:-p]) / (len(history) - p)
+                     for p in range(1, max_period + 1)])
+
+
+def minimal_period(history, max_period=None, tolerance=0.0):
+    """
+    어긋나는 비율이 tolerance 이하인 가장 짧은 주기. 없으면 None.
+    주기가 맞으려면 이력에 두 번 이상 나와야 하므로 max_period는 이력 길이의 절반까지입니다.
+    """
+    history = as_codes(history)
+    limit = len(history) // 2
+    max_period = limit if max_period is None else min(max_period, limit)
+    if max_period < 1:
+        return None
+    rates = mismatch_rates(history, max_period)
+    matches = np.flatnonzero(rates <= tolerance)
+    return int(matches[0]) + 1 if len(matches) else None
+
+
+def phase_counts(history, period, num_states=NUM_WEATHERS):
+    """내일과 같은 자리(주기 안 위치)에 있던 날들의 날씨 횟수"""
+    history = as_codes(history)
+    phase = len(history) % period
+    return np.bincount(history[phase::period], minlength=num_states)
+
+
+def forecast(history, order=None, tolerance=0.0, alpha=ALPHA, num_states=NUM_WEATHERS):
+    """
+    다음 날 날씨 확률 배열과 찾은 주기(없으면 None)를 돌려줍니다.
+    order를 주면 차수 order 마르코프 연쇄로 예측합니다.
+    주지 않으면 가장 짧은 주기를 찾아서 같은 자리에 있던 날들의 날씨로 예측하고
+    (잡음이 섞여도 문맥 하나가 깨지는 것보다 덜 흔들립니다), 주기가 없으면 1차 마르코프 연쇄로 예측합니다.
+    """
+    history = as_codes(history)
+    period = None
+    if order is None:
+        period = minimal_period(history, min(MAX_ORDER, len(history) // 2), tolerance)
+        order = 1
+    if period is not None:
+        row = phase_counts(history, period, num_states)
+    else:
+        order = min(order, MAX_ORDER, max(len(history) - 1, 0))
+        counts = transition_counts(history, order, num_states)
+        if order:
+            row = counts[int(context_codes(history[len(history) - order:], order, num_states)[0])]
+        else:
+            row = counts.sum(axis=0)
+    probabilities = (row + alpha) / (row.sum() + alpha * num_states)
+    return probabilities, period
+
+
+def periodic_history(word, length):
+    """한 주기 분량(word)을 length일 동안 반복한 이력과 그다음 날 날씨"""
+    word = as_codes(word)
+    days = np.arange(length + 1)
+    sequence = word[days % len(word)]
+    return sequence[:-1], int(sequence[-1])
+
+
+def add_noise(history, noise, rng, num_states=NUM_WEATHERS):
+    """날마다 noise 확률로 다른 날씨 하나로 바꿉니다. (잡음 모드)"""
+    history = as_codes(history).copy()
+    flip = rng.random(len(history)) < noise
+    history[flip] = (history[flip] + rng.integers(1, num_states, np.count_nonzero(flip))) % num_states
+    return history
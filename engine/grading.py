@@ -0,0 +1,177 @@
+# 종이로 푼 답안지 한꺼번에 채점하기
+# (학생, 게임, 문제, 답) 행이 담긴 CSV/엑셀 파일을 청크 단위로 읽어서 pandas 열 연산으로 채점합니다.
+# 정답은 실제 게임과 같은 엔진 함수로 구합니다.
+#   숫자 추론: number_pattern.correct_answer (직접 만든 문제, 수열 가족, 자동 생성 문제 'N번호')
+#   날씨 추론: 패턴 이름(engine.weather.pattern_name) -> NEXT_WEATHER
+#   가격 추론: 단계 번호(1 ~ TARGET_SCORE) -> generate_step_data의 정답 (calculate_price)
+# 문제마다 정답은 처음 한 번만 구해서 기억해 두고, 행마다 하는 일은 열 단위 비교뿐입니다.
+#   python -m engine.grading answers.csv graded.csv
+import argparse
+import io
+import time
+
+import numpy as np
+import pandas as pd
+
+from . import number_pattern, price, weather
+
+COLUMNS = ('student', 'game', 'question', 'answer')
+COLUMN_ALIASES = {'학생': 'student', '게임': 'game', '문제': 'question', '답': 'answer'}
+CHUNK_SIZE = 50_000
+GAMES = ('number-pattern', 'weather', 'price')
+
+# 날씨 답은 코드(0/1/2), 이모지, 이름 어느 것으로 써도 됩니다.
+WEATHER_ALIASES = {
+    **{emoji: str(code) for code, emoji in enumerate(weather.WEATHER_EMOJIS)},
+    **{name: str(code) for code, name in enumerate(weather.WEATHER_NAMES)},
+}
+
+
+def number_answers(question_ids):
+    """숫자 추론 문제 ID들의 정답. 자동 생성 문제는 배치 배열에서 한 번에 꺼냅니다."""
+    answers = {}
+    generated = []
+    for question_id in question_ids:
+        if question_id in number_pattern.FIXED_SEQUENCES or question_id in number_pattern.FAMILY_SEQUENCES:
+            answers[question_id] = str(number_pattern.correct_answer(number_pattern.get_question(question_id)))
+        elif question_id[1:].isdigit() and question_id.startswith(number_pattern.GENERATED_PREFIX):
+            generated.append(question_id)
+    if generated:
+        batch = number_pattern.get_generated_sequences()
+        index = np.array([int(question_id[1:]) for question_id in generated])
+        valid = index < len(batch['type'])
+        terms = batch['terms'][index[valid], batch['blank_index'][index[valid]]]
+        answers.update(zip(np.array(generated)[valid].tolist(), map(str, terms.tolist())))
+    return answers
+
+
+def weather_answers(question_ids):
+    return {name: str(weather.NEXT_WEATHER[weather.PATTERN_IDS[name]])
+            for name in question_ids if name in weather.PATTERN_IDS}
+
+
+def price_answers(question_ids):
+    """게임에 있는 단계(1 ~ TARGET_SCORE)만 채점합니다. 그 밖의 단계 번호는 모르는 문제로 둡니다."""
+    answers = {}
+    for question_id in question_ids:
+        if question_id.isdigit() and 1 <= int(question_id) <= price.TARGET_SCORE:
+            answers[question_id] = str(price.generate_step_data(int(question_id))[3])
+    return answers
+
+
+ANSWER_FUNCTIONS = {
+    'number-pattern': number_answers,
+    'weather': weather_answers,
+    'price': price_answers,
+}
+
+
+class AnswerKey:
+    """(게임, 문제 ID) -> 정답 문자열. 청크마다 처음 보는 문제만 찾아서 더합니다."""
+
+    def __init__(self):
+        self.answers = {game: {} for game in GAMES}
+
+    def lookup(self, games, questions):
+        """행마다 정답 문자열 Series (모르는 게임이나 문제는 NaN)"""
+        result = pd.Series(np.nan, index=games.index, dtype=object)
+        for game, known in self.answers.items():
+            rows = games == game
+            if not rows.any():
+                continue
+            game_questions = questions[rows]
+            new = [q for q in game_questions.unique().tolist() if q not in known]
+            if new:
+                known.update(ANSWER_FUNCTIONS[game](new))
+            result[rows] = game_questions.map(known)
+        return result
+
+
+def normalize_answers(answers, games):
+    """학생 답을 정답과 같은 문자열 꼴로 맞춥니다. ('1,200' -> '1200', '7.0' -> '7', '비' -> '1')"""
+    text = answers.astype(str).str.strip().str.replace(',', '', regex=False)
+    text = text.str.replace(r'\.0+$', '', regex=True)
+    weather_rows = games == 'weather'
+    if weather_rows.any():
+        text[weather_rows] = text[weather_rows].replace(WEATHER_ALIASES)
+    return text.where(answers.notna(), None)
+
+
+def normalize_columns(frame):
+    frame = frame.rename(columns=lambda name: COLUMN_ALIASES.get(str(name).strip(), str(name).strip().lower()))
+    missing = [name for name in COLUMNS if name not in frame.columns]
+    if missing:
+        raise ValueError(f"답안지에 필요한 열이 없습니다: {', '.join(missing)}")
+    return frame
+
+
+def grade_chunk(frame, key):
+    """청크 하나를 채점해서 correct_answer, is_correct 열을 붙여 돌려줍니다."""
+    frame = normalize_columns(frame)
+    # 'Weather'와 'weather'가 점수표에서 따로 묶이지 않도록 정리한 게임 이름을 열에 다시 씁니다.
+    games = frame['game'] = frame['game'].astype(str).str.strip().str.lower()
+    questions = frame['question'].astype(str).str.strip()
+    # 숫자로 읽힌 가격 단계(1.0 -> '1')
+    questions = questions.str.replace(r'\.0+$', '', regex=True)
+    correct = key.lookup(games, questions)
+    frame['correct_answer'] = correct
+    frame['is_correct'] = (normalize_answers(frame['answer'], games) == correct) & correct.notna()
+    return frame
+
+
+def read_chunks(source, filename, chunk_size=CHUNK_SIZE):
+    """CSV는 chunksize로 나눠 읽고, 엑셀은 한 번에 읽은 뒤 같은 크기로 나눕니다."""
+    if str(filename).lower().endswith(('.xlsx', '.xls')):
+        try:
+            frame = pd.read_excel(source, dtype=str)
+        except ImportError as error:
+            raise ValueError("엑셀 파일을 읽으려면 openpyxl을 설치하세요. (pip install openpyxl)") from error
+        for start in range(0, len(frame), chunk_size):
+            yield frame.iloc[start:start + chunk_size].copy()
+        return
+    yield from pd.read_csv(source, dtype=str, chunksize=chunk_size, skipinitialspace=True, encoding='utf-8-sig')
+
+
+def grade_file(source, filename, chunk_size=CHUNK_SIZE):
+    """
+    답안지 파일 전체를 채점합니다.
+    (행마다 채점 결과 DataFrame, 학생·게임별 점수 DataFrame)을 돌려줍니다.
+    """
+    key = AnswerKey()
+    graded = [grade_chunk(chunk, key) for chunk in read_chunks(source, filename, chunk_size)]
+    rows = pd.concat(graded, ignore_index=True) if graded else pd.DataFrame(columns=[*COLUMNS, 'correct_answer', 'is_correct'])
+    return rows, student_scores(rows)
+
+
+def student_scores(rows):
+    scores = rows.groupby(['student', 'game'], sort=True)['is_correct'].agg(attempts='size', correct='sum')
+    scores['correct'] = scores['correct'].astype(int)
+    scores['accuracy'] = (scores['correct'] / scores['attempts']).round(3)
+    return scores.reset_index()
+
+
+def to_csv_bytes(frame):
+    """다운로드용 CSV (엑셀에서 한글이 깨지지 않도록 BOM을 붙입니다)"""
+    buffer = io.StringIO()
+    frame.to_csv(buffer, index=False)
+    return buffer.getvalue().encode('utf-8-sig')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="종이 답안지(CSV/엑셀)를 한꺼번에 채점합니다.")
+    parser.add_argument('path')
+    parser.add_argument('output', nargs='?', help='행별 채점 결과를 쓸 CSV 파일')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rows, scores = grade_file(args.path, args.path, args.chunk_size)
+    elapsed = time.perf_counter() - start
+    if args.output:
+        rows.to_csv(args.output, index=False)
+    print(scores.to_string(index=False))
+    print(f"{len(rows):,} rows, {int(rows['is_correct'].sum()):,} correct in {elapsed:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,280 @@
+# 스크립트 실행 단계별 시간과 상태 전이 계측
+# GAME_METRICS_PATH 환경 변수를 주면 켜집니다. (없으면 아무 일도 하지 않는 객체를 돌려줍니다)
+#   GAME_METRICS_PATH=metrics.prom  → Prometheus 텍스트 형식으로 덮어쓰기
+#   GAME_METRICS_PATH=metrics.jsonl → 내보낼 때마다 JSON 한 줄씩 추가
+# launch.py 워커처럼 GAME_WORKER가 있으면 .prom은 워커마다 다른 파일(metrics.worker0.prom)에 worker 레이블을 붙여 쓰고,
+# .jsonl 줄에는 pid와 worker를 넣습니다.
+# 값은 고정 구간 히스토그램에 누적하므로 관측 한 번의 비용은 이분 탐색 한 번입니다.
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+from .render_cache import RENDER_CACHE
+
+# 초 단위 구간 (100µs ~ 10s)
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 세션 하나가 실행한 스크립트 횟수 구간
+RUN_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+FLUSH_INTERVAL = 10.0  # 초
+# 이 시간 동안 실행이 없는 세션은 끝난 것으로 보고 실행 횟수를 히스토그램에 넣은 뒤 잊습니다.
+SESSION_IDLE_SECONDS = 30 * 60
+MAX_LIVE_SESSIONS = 10_000  # 진행 중으로 기억하는 세션 수 한도 (넘으면 가장 오래 쉰 세션부터 넣습니다)
+# 화면을 그릴 때의 게임 상태 → 기록할 단계 이름
+RENDER_PHASES = {'playing': 'question', 'finished': 'feedback', 'victory': 'victory', 'complete': 'complete'}
+
+logger = logging.getLogger(__name__)
+
+
+def worker_path(path, worker):
+    """워커마다 따로 쓸 .prom 파일 경로 (metrics.prom -> metrics.worker0.prom)"""
+    if worker is None or path.endswith('.jsonl'):
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.worker{worker}{ext}"
+
+
+class Histogram:
+    """고정 구간 히스토그램 (구간별 개수, 합계, 전체 개수)"""
+
+    __slots__ = ('bounds', 'counts', 'total', 'count')
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # 마지막 칸은 +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def copy(self):
+        other = Histogram(self.bounds)
+        other.counts = list(self.counts)
+        other.total = self.total
+        other.count = self.count
+        return other
+
+    def to_dict(self):
+        return {'bounds': list(self.bounds), 'counts': list(self.counts),
+                'sum': self.total, 'count': self.count}
+
+
+class Metrics:
+    """프로세스 전체에서 공유하는 계측 저장소"""
+
+    def __init__(self, path, flush_interval=FLUSH_INTERVAL, session_idle=SESSION_IDLE_SECONDS,
+                 max_live_sessions=MAX_LIVE_SESSIONS, worker=None):
+        self.worker = worker  # launch.py 워커 번호 (GAME_WORKER)
+        self.path = worker_path(path, worker)
+        self.flush_interval = flush_interval
+        self.session_idle = session_idle
+        self.max_live_sessions = max_live_sessions
+        self.lock = threading.Lock()
+        self.phases = {}  # (게임, 단계) → Histogram
+        self.transitions = {}  # (게임, 이전 상태, 다음 상태) → 횟수
+        # (게임, 세션 ID) → [스크립트 실행 횟수, 마지막 실행 시각]. 마지막 실행이 오래된 순서로 둡니다.
+        self.session_runs = OrderedDict()
+        self.finished_runs = {}  # 게임 → 끝난 세션들의 실행 횟수 Histogram
+        self.flusher = None
+
+    # ----- 기록 -----
+    def observe(self, game, phase, seconds):
+        with self.lock:
+            histogram = self.phases.get((game, phase))
+            if histogram is None:
+                histogram = self.phases[(game, phase)] = Histogram(LATENCY_BUCKETS)
+            histogram.observe(seconds)
+
+    @contextmanager
+    def phase(self, game, name):
+        """with 블록 안에서 걸린 시간을 (게임, 단계) 히스토그램에 기록합니다."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(game, name, time.perf_counter() - start)
+
+    def transition(self, game, old_state, new_state):
+        if old_state == new_state:
+            return
+        key = (game, old_state, new_state)
+        with self.lock:
+            self.transitions[key] = self.transitions.get(key, 0) + 1
+
+    def count_run(self, game, session_id):
+        key = (game, session_id)
+        now = time.monotonic()
+        with self.lock:
+            entry = self.session_runs.get(key)
+            if entry is None:
+                self.session_runs[key] = [1, now]
+            else:
+                entry[0] += 1
+                entry[1] = now
+                self.session_runs.move_to_end(key)
+            self.finish_idle_sessions(now)
+        self.start_flusher()
+
+    def finish_idle_sessions(self, now):
+        """오래 쉰 세션과 한도를 넘은 세션을 끝난 세션 히스토그램으로 옮깁니다. (잠금 안에서 부릅니다)"""
+        runs = self.session_runs
+        while runs:
+            (game, session_id), (count, last_seen) = next(iter(runs.items()))
+            if now - last_seen < self.session_idle and len(runs) <= self.max_live_sessions:
+                break
+            del runs[(game, session_id)]
+            histogram = self.finished_runs.get(game)
+            if histogram is None:
+                histogram = self.finished_runs[game] = Histogram(RUN_COUNT_BUCKETS)
+            histogram.observe(count)
+
+    def wrap(self, game, phase, func):
+        """
+        상태 객체를 첫 인자로 받는 엔진 함수를 감쌉니다.
+        걸린 시간을 phase 이름으로 기록하고, game_state가 바뀌었으면 전이도 셉니다.
+        """
+        @wraps(func)
+        def wrapper(state, *args, **kwargs):
+            old_state = state.game_state
+            start = time.perf_counter()
+            result = func(state, *args, **kwargs)
+            self.observe(game, phase, time.perf_counter() - start)
+            self.transition(game, old_state, state.game_state)
+            return result
+        return wrapper
+
+    # ----- 내보내기 -----
+    def snapshot(self):
+        with self.lock:
+            self.finish_idle_sessions(time.monotonic())
+            # 끝난 세션에 진행 중인 세션의 지금까지 횟수를 더해서 내보냅니다.
+            run_histograms = {game: h.copy() for game, h in self.finished_runs.items()}
+            for (game, _), (runs, _) in self.session_runs.items():
+                histogram = run_histograms.get(game)
+                if histogram is None:
+                    histogram = run_histograms[game] = Histogram(RUN_COUNT_BUCKETS)
+                histogram.observe(runs)
+            return {
+                'time': time.time(),
+                'pid': os.getpid(),
+                'worker': self.worker,
+                'phases': [{'game': game, 'phase': phase, **h.to_dict()}
+                           for (game, phase), h in self.phases.items()],
+                'transitions': [{'game': game, 'from': old, 'to': new, 'count': count}
+                                for (game, old, new), count in self.transitions.items()],
+                'session_runs': [{'game': game, **h.to_dict()} for game, h in run_histograms.items()],
+                'render_cache': RENDER_CACHE.stats(),
+            }
+
+    def labels(self, **labels):
+        """Prometheus 레이블 글자 (워커 번호가 있으면 worker 레이블을 앞에 붙입니다)"""
+        if self.worker is not None:
+            labels = {'worker': self.worker, **labels}
+        return ','.join(f'{name}="{value}"' for name, value in labels.items())
+
+    def to_prometheus(self, snapshot=None):
+        snapshot = snapshot or self.snapshot()
+        lines = ['# TYPE game_phase_seconds histogram']
+        for item in snapshot['phases']:
+            lines += prometheus_histogram('game_phase_seconds', self.labels(game=item['game'], phase=item['phase']), item)
+        lines.append('# TYPE game_state_transitions_total counter')
+        for item in snapshot['transitions']:
+            labels = self.labels(game=item['game'], **{'from': item['from'], 'to': item['to']})
+            lines.append(f'game_state_transitions_total{{{labels}}} {item["count"]}')
+        lines.append('# TYPE game_session_runs histogram')
+        for item in snapshot['session_runs']:
+            lines += prometheus_histogram('game_session_runs', self.labels(game=item['game']), item)
+        cache = snapshot['render_cache']
+        labels = f'{{{self.labels()}}}' if self.worker is not None else ''
+        lines += ['# TYPE game_render_cache_hits_total counter', f'game_render_cache_hits_total{labels} {cache["hits"]}',
+                  '# TYPE game_render_cache_misses_total counter',
+                  f'game_render_cache_misses_total{labels} {cache["misses"]}',
+                  '# TYPE game_render_cache_size gauge', f'game_render_cache_size{labels} {cache["size"]}']
+        return '\n'.join(lines) + '\n'
+
+    def flush(self):
+        """설정된 파일로 지금까지의 값을 내보냅니다."""
+        snapshot = self.snapshot()
+        if self.path.endswith('.jsonl'):
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(snapshot, ensure_ascii=False) + '\n')  # 여러 워커가 덧붙여도 한 줄은 한 번에 씁니다.
+        else:
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"  # 같은 경로를 쓰는 다른 프로세스와 겹치지 않게
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(self.to_prometheus(snapshot))
+            os.replace(tmp_path, self.path)
+
+    def start_flusher(self):
+        """처음 기록될 때 주기적으로 내보내는 스레드를 띄우고, 종료할 때도 한 번 내보냅니다."""
+        if self.flusher is not None:
+            return
+        with self.lock:
+            if self.flusher is not None:
+                return
+            self.flusher = threading.Thread(target=self._flush_loop, name='game-metrics', daemon=True)
+            self.flusher.start()
+        atexit.register(self.flush)
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception:
+                # 디스크가 꽉 찼거나 경로가 사라져도 스레드는 살아 있다가 다음 간격에 다시 씁니다.
+                logger.exception("metrics flush to %s failed", self.path)
+
+
+class NullMetrics:
+    """계측이 꺼져 있을 때 쓰는 객체. 모든 호출이 아무 일도 하지 않습니다."""
+
+    def observe(self, game, phase, seconds):
+        pass
+
+    def phase(self, game, name):
+        return nullcontext()
+
+    def transition(self, game, old_state, new_state):
+        pass
+
+    def count_run(self, game, session_id):
+        pass
+
+    def wrap(self, game, phase, func):
+        return func
+
+
+def prometheus_histogram(name, labels, item):
+    """누적 구간 개수로 바꿔서 Prometheus 히스토그램 줄들을 만듭니다."""
+    lines, cumulative = [], 0
+    for bound, count in zip([*item['bounds'], '+Inf'], item['counts']):
+        cumulative += count
+        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+    lines.append(f'{name}_sum{{{labels}}} {item["sum"]}')
+    lines.append(f'{name}_count{{{labels}}} {item["count"]}')
+    return lines
+
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics():
+    """GAME_METRICS_PATH가 있으면 공유 Metrics를, 없으면 NullMetrics를 돌려줍니다."""
+    global _metrics
+    if _metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                path = os.environ.get('GAME_METRICS_PATH')
+                _metrics = Metrics(path, worker=os.environ.get('GAME_WORKER')) if path else NullMetrics()
+    return _metrics
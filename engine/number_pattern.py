@@ -0,0 +1,182 @@
+# 숫자 추론 게임 엔진 (Streamlit 없이 동작)
+import time
+from functools import lru_cache
+
+from .families import Alternating, Arithmetic, LinearRecurrence, Quadratic, lazy_display_terms
+from .problem_bank import get_bank
+from .rng import SessionRandom
+from .scheduler import QuestionOrder, permute
+from .sequences import generate_problem_batch, problem_record
+
+TARGET_SCORE = 3
+
+# 고정 문제를 다 풀면 자동 생성 문제에서 이어서 출제합니다.
+# 후보를 GENERATED_CANDIDATES개 뽑고 중복을 빼므로 실제 문제 수는 58,045개입니다.
+# (생성 범위 전체가 sequences.PROBLEM_SPACE_SIZE = 58,050문제라서 후보 대부분은 중복입니다)
+GENERATED_CANDIDATES = 1_000_000
+GENERATED_PREFIX = 'N'
+
+# 미리 정의된 고정 수열 목록 (총 10개)
+# 형식: {
+#   '문제 ID': {
+#       'sequence': [수열 값], 
+#       'blank_index': 정답(빈칸)의 인덱스, 
+#       'type': 'arithmetic' 또는 'geometric',
+#       'diff_ratio': 공차/공비 값,
+#       'rule_desc': "규칙 설명"
+#   }
+# }
+FIXED_SEQUENCES = {
+    # 덧셈 (+1, +5, +10) - 5개
+    'A1': {'sequence': [10, 11, 12, 13, 14, 15], 'blank_index': 3, 'type': 'arithmetic', 'diff_ratio': 1, 'rule_desc': "1씩 커지는 (더하기) 패턴"},
+    'A2': {'sequence': [5, 10, 15, 20, 25, 30], 'blank_index': 2, 'type': 'arithmetic', 'diff_ratio': 5, 'rule_desc': "5씩 커지는 (더하기) 패턴"},
+    'A3': {'sequence': [100, 110, 120, 130, 140, 150], 'blank_index': 4, 'type': 'arithmetic', 'diff_ratio': 10, 'rule_desc': "10씩 커지는 (더하기) 패턴"},
+    'A4': {'sequence': [23, 25, 27, 29, 31], 'blank_index': 2, 'type': 'arithmetic', 'diff_ratio': 2, 'rule_desc': "2씩 커지는 (더하기) 패턴"},
+    'A5': {'sequence': [7, 17, 27, 37, 47, 57], 'blank_index': 3, 'type': 'arithmetic', 'diff_ratio': 10, 'rule_desc': "10씩 커지는 (더하기) 패턴"},
+    
+    # 곱셈 (x2, x4, x5) - 5개
+    'G1': {'sequence': [2, 4, 8, 16, 32], 'blank_index': 3, 'type': 'geometric', 'diff_ratio': 2, 'rule_desc': "2씩 곱하는 패턴"},
+    'G2': {'sequence': [3, 15, 75, 375, 1875], 'blank_index': 2, 'type': 'geometric', 'diff_ratio': 5, 'rule_desc': "5씩 곱하는 패턴"},
+    'G3': {'sequence': [1, 4, 16, 64, 256], 'blank_index': 3, 'type': 'geometric', 'diff_ratio': 4, 'rule_desc': "4씩 곱하는 패턴"},
+    'G4': {'sequence': [5, 10, 20, 40, 80], 'blank_index': 4, 'type': 'geometric', 'diff_ratio': 2, 'rule_desc': "2씩 곱하는 패턴"},
+    'G5': {'sequence': [4, 20, 100, 500, 2500], 'blank_index': 3, 'type': 'geometric', 'diff_ratio': 5, 'rule_desc': "5씩 곱하는 패턴"},
+}
+
+# 항을 미리 만들어 두지 않는 수열 문제 (engine.families)
+# 'family'가 n번째 항을 바로 계산하므로 빈칸이 아주 먼 항이어도 됩니다.
+FAMILY_SEQUENCES = {
+    'Q1': {'family': Quadratic(1, 1, 1), 'blank_index': 4},  # 1, 3, 7, 13, 21
+    'F1': {'family': LinearRecurrence((1, 1), (1, 1)), 'blank_index': 6},  # 피보나치
+    'F2': {'family': LinearRecurrence((1, 1), (2, 1)), 'blank_index': 5},  # 2, 1, 3, 4, 7, 11
+    'L1': {'family': Alternating(Arithmetic(1, 2), Arithmetic(10, 10)), 'blank_index': 5},
+    'R1': {'family': Arithmetic(3, 3), 'blank_index': 999_999},  # 100만 번째 항
+}
+for _q_data in FAMILY_SEQUENCES.values():
+    _q_data['type'] = _q_data['family'].type
+    _q_data['rule_desc'] = _q_data['family'].rule_desc()
+
+# 직접 만든 문제 (자동 생성 문제보다 먼저 냅니다)
+# 쉬운 고정 문제를 먼저 섞어서 내고, 어려운 수열 가족 문제(2차식, 피보나치 …)는 그다음에 섞어서 냅니다.
+HANDMADE_TIERS = (tuple(FIXED_SEQUENCES), tuple(FAMILY_SEQUENCES))
+HANDMADE_IDS = tuple(question_id for tier in HANDMADE_TIERS for question_id in tier)
+
+@lru_cache(maxsize=None)
+def get_generated_sequences():
+    """
+    자동 생성 문제 묶음을 프로세스 전체에서 한 번만 만들어 공유합니다.
+    문제 은행(GAME_PROBLEM_BANK)이 있으면 만들지 않고 메모리 맵 배열을 그대로 씁니다.
+    """
+    bank = get_bank()
+    if bank is not None:
+        return bank.sequence_batch()
+    return generate_problem_batch(GENERATED_CANDIDATES, seed=0)
+
+def get_question(question_id):
+    """문제 ID로 FIXED_SEQUENCES, FAMILY_SEQUENCES 또는 자동 생성 문제의 데이터를 가져옵니다."""
+    if question_id in FIXED_SEQUENCES:
+        return FIXED_SEQUENCES[question_id]
+    if question_id in FAMILY_SEQUENCES:
+        return FAMILY_SEQUENCES[question_id]
+    return problem_record(get_generated_sequences(), int(question_id[len(GENERATED_PREFIX):]))
+
+def count_questions():
+    """출제할 수 있는 전체 문제 수"""
+    return len(HANDMADE_IDS) + len(get_generated_sequences()['type'])
+
+def question_id_at(position, key):
+    """
+    key로 섞은 문제 순서의 position번째 문제 ID.
+    고정 문제, 수열 가족 문제, 자동 생성 문제 순서로 나오고, 각 묶음 안에서만 key로 섞습니다.
+    """
+    for tier in HANDMADE_TIERS:
+        if position < len(tier):
+            return tier[permute(position, len(tier), key)]
+        position -= len(tier)
+    pool_size = len(get_generated_sequences()['type'])
+    return f"{GENERATED_PREFIX}{permute(position, pool_size, key)}"
+
+class NumberPatternState:
+    """숫자 추론 게임의 세션 상태 (문제 ID와 작은 정수만 저장)"""
+
+    __slots__ = ('game_state', 'score', 'target_score', 'question_id',
+                 'order', 'is_correct', 'input_key', 'shown_at', 'rng')
+
+    def __init__(self, target_score: int = TARGET_SCORE, seed: int | None = None):
+        self.game_state: str = 'init'
+        self.score: int = 0
+        self.target_score: int = target_score
+        self.question_id: str | None = None  # FIXED_SEQUENCES/FAMILY_SEQUENCES 키 또는 자동 생성 문제 ID
+        self.is_correct: bool = False  # 마지막 제출 결과 (피드백 종류)
+        self.input_key: int = 0  # 입력 위젯 초기화용 카운터
+        self.shown_at: float = 0.0  # 문제를 낸 시각 (time.monotonic)
+        self.rng: SessionRandom = SessionRandom(seed)  # 이 세션만 쓰는 난수열
+        # 겹치지 않는 문제 순서 (세션 시드를 키로 쓰고, 지금까지 낸 문제 수만 더 저장합니다)
+        self.order: QuestionOrder = QuestionOrder(self.rng.seed)
+
+def display_sequence_str(q_data):
+    """빈칸을 '?'로 가린 문제 수열 문자열"""
+    if 'family' in q_data:
+        return " → ".join(lazy_display_terms(q_data['family'], q_data['blank_index']))
+    display_sequence = list(map(str, q_data['sequence']))
+    display_sequence[q_data['blank_index']] = '?'
+    return " → ".join(display_sequence)
+
+def full_sequence_str(q_data):
+    """정답을 포함한 전체 수열 문자열"""
+    if 'family' in q_data:
+        return " → ".join(lazy_display_terms(q_data['family'], q_data['blank_index'], reveal=True))
+    return " → ".join(map(str, q_data['sequence']))
+
+def correct_answer(q_data):
+    if 'family' in q_data:
+        return q_data['family'].term(q_data['blank_index'])
+    return q_data['sequence'][q_data['blank_index']]
+
+def start_new_question(state):
+    """세션의 문제 순서에서 다음 문제를 골라 상태에 저장합니다."""
+    
+    # 1. 문제 선택 (직접 만든 문제를 먼저 내고, 다 쓰면 자동 생성 문제를 냅니다)
+    if not has_next_question(state):
+        # 모든 문제를 다 풀었을 경우 (재시작 또는 오류 방지)
+        state.game_state = 'complete' 
+        return
+    question_id = question_id_at(state.order.cursor, state.order.key)
+    state.order.cursor += 1
+        
+    # 2. 상태 저장 (문제 ID만 저장하고, 표시할 문자열은 get_question으로 다시 만듭니다)
+    state.question_id = question_id
+    
+    state.game_state = 'playing'
+    state.input_key += 1
+    state.shown_at = time.monotonic()
+
+def submit_answer(state, user_guess):
+    """답을 채점하고 다음 상태('finished' 또는 'victory')로 넘깁니다. 정답 여부를 돌려줍니다."""
+    
+    # 1. 정답 확인 로직
+    state.is_correct = (user_guess == correct_answer(get_question(state.question_id)))
+    if state.is_correct:
+        state.score += 1
+    
+    # 2. 게임 상태 업데이트
+    state.game_state = 'finished'
+    
+    # 승리 조건 즉시 체크
+    if state.score >= state.target_score:
+        state.game_state = 'victory'
+    return state.is_correct
+
+def has_next_question(state):
+    """사용 가능한 문제가 남아있는지 확인"""
+    return state.order.remaining(count_questions()) > 0
+
+def replay_questions(seed, count):
+    """시드로 세션의 문제 순서를 처음부터 다시 만듭니다. (답과 상관없이 같은 순서로 나옵니다)"""
+    state = NumberPatternState(seed=seed)
+    question_ids = []
+    for _ in range(count):
+        start_new_question(state)
+        if state.game_state == 'complete':
+            break
+        question_ids.append(state.question_id)
+    return question_ids
@@ -0,0 +1,125 @@
+# 가격 추론 게임 엔진 (Streamlit 없이 동작)
+import time
+from functools import lru_cache
+
+# ----- 기본 설정 -----
+FIXED_STEPS = 3  # 1~3단계는 직접 만든 문제, 그 이후 단계는 자동 생성 문제
+GENERATED_STEPS = 2  # 승리하기 전에 푸는 자동 생성 단계 수
+TARGET_SCORE = FIXED_STEPS + GENERATED_STEPS
+BASKET_PRICE = 100  # 바구니 크기 1당 100원
+ITEM_PRICE = {
+    '🍬 사탕': 10,
+    '🍫 초콜릿': 5
+}
+
+# ----- 가격 계산 -----
+def calculate_price(size, items=None):
+    """바구니 크기와 과자 종류로 가격 계산"""
+    price = size * BASKET_PRICE
+    if items:
+        if isinstance(items, str):
+            price += ITEM_PRICE.get(items, 0)
+        elif isinstance(items, list):
+            for i in items:
+                price += ITEM_PRICE.get(i, 0)
+    return price
+
+# ----- 단계별 문제 생성 -----
+def generate_step_data(step):
+    examples = []
+
+    if step == 1:
+        # 바구니 크기만 다름
+        sizes = [2, 4, 6]
+        for s in sizes:
+            examples.append({'basket': s, 'item': '❌ 없음', 'price': calculate_price(s)})
+        problem_size = 5
+        problem_items = None
+        answer = calculate_price(problem_size)
+        hint = "바구니가 클수록 가격이 커져요! 바구니 1칸은 100원이에요."
+
+    elif step == 2:
+        # 같은 크기, 다른 간식
+        examples.append({'basket': 5, 'item': '❌ 없음', 'price': calculate_price(5)})
+        examples.append({'basket': 5, 'item': '🍬 사탕', 'price': calculate_price(5, '🍬 사탕')})
+        examples.append({'basket': 5, 'item': '🍫 초콜릿', 'price': calculate_price(5, '🍫 초콜릿')})
+        problem_size = 4
+        problem_items = '🍬 사탕'
+        answer = calculate_price(problem_size, problem_items)
+        hint = "같은 바구니라도, 사탕이나 초콜릿이 들어가면 조금 더 비싸져요!"
+
+    elif step == 3:
+        # 크기와 간식이 모두 다름
+        examples.append({'basket': 3, 'item': '🍬 사탕', 'price': calculate_price(3, '🍬 사탕')})
+        examples.append({'basket': 4, 'item': '🍫 초콜릿', 'price': calculate_price(4, '🍫 초콜릿')})
+        examples.append({'basket': 2, 'item': '🍬 사탕 + 🍫 초콜릿', 'price': calculate_price(2, ['🍬 사탕', '🍫 초콜릿'])})
+        problem_size = 5
+        problem_items = ['🍬 사탕', '🍫 초콜릿']
+        answer = calculate_price(problem_size, problem_items)
+        hint = "이제 큰 바구니에 사탕과 초콜릿을 모두 넣어요. 두 개 다 더해보세요!"
+
+    elif step > FIXED_STEPS:
+        # 자동 생성 단계 (단계 번호를 시드로 써서 항상 같은 문제가 나옵니다)
+        return generated_step(step)
+
+    else:
+        return [], 0, None, 0, "단계 오류"
+
+    return examples, problem_size, problem_items, answer, hint
+
+@lru_cache(maxsize=1024)
+def generated_step(step):
+    """자동 생성 단계. 문제 은행(GAME_PROBLEM_BANK)에 있으면 거기서 읽습니다. (NumPy는 이때 처음 불러옵니다)"""
+    from .problem_bank import get_bank
+    bank = get_bank()
+    if bank is not None:
+        stored = bank.price_step(step)
+        if stored is not None:
+            return stored
+    return make_generated_step(step)
+
+def make_generated_step(step):
+    """예시만으로 정답이 하나로 정해지는 단계를 만듭니다."""
+    from .price_steps import generate_steps
+    return generate_steps(1, seed=step, batch_size=64)[0]
+
+# ----- 세션 상태 -----
+class PriceState:
+    """가격 추론 게임의 세션 상태"""
+
+    __slots__ = ('game_state', 'step', 'score', 'user_guess', 'is_correct', 'input_key', 'shown_at')
+
+    def __init__(self):
+        self.game_state: str = 'init'
+        self.step: int = 1  # 예시 표와 문제는 단계 번호로 다시 만듭니다.
+        self.score: int = 0
+        self.user_guess: int = 0
+        self.is_correct: bool = False
+        self.input_key: int = 0
+        self.shown_at: float = 0.0  # 문제를 낸 시각 (time.monotonic)
+
+# ----- 문제 새로 만들기 -----
+def start_new_question(state):
+    # 예시와 정답은 저장하지 않고 state.step으로 generate_step_data를 다시 불러 만듭니다.
+    # 직전 문제를 맞혔다면 다음 단계로 넘어갑니다.
+    if state.is_correct:
+        state.step += 1
+        state.is_correct = False
+    state.game_state = 'playing'
+    state.input_key += 1
+    state.shown_at = time.monotonic()
+
+# ----- 정답 제출 -----
+def submit_answer(state, user_guess):
+    """답을 채점하고 다음 상태('finished' 또는 'victory')로 넘깁니다. 정답 여부를 돌려줍니다."""
+    _, _, _, correct_answer, _ = generate_step_data(state.step)
+    state.user_guess = user_guess
+    state.is_correct = state.user_guess == correct_answer
+    if state.is_correct:
+        state.score += 1
+
+    if state.score >= TARGET_SCORE:
+        state.game_state = 'victory'
+    else:
+        state.game_state = 'finished'
+    return state.is_correct
@@ -0,0 +1,99 @@
+# 가격 추론 게임의 단계 자동 생성기
+# 바구니 크기와 간식 조합으로 예시 표와 손님 주문을 무작위로 만들고,
+# 예시만으로 정답 가격이 하나로 정해지는 후보만 NumPy로 한꺼번에 골라냅니다.
+import numpy as np
+
+from .price import BASKET_PRICE, ITEM_PRICE, calculate_price
+
+ITEM_NAMES = list(ITEM_PRICE)
+NUM_EXAMPLES = 3
+BASKET_SIZES = (1, 9)  # 바구니 크기 범위 (양 끝 포함)
+ITEM_CHANCE = 0.5  # 예시/주문에 간식 하나하나가 들어갈 확률
+BATCH_SIZE = 4096
+GENERATED_HINT = "예시들을 서로 비교해서 바구니 1칸의 값과 간식마다 더해지는 값을 찾아보세요!"
+
+
+def draw_candidates(n, rng, num_examples=NUM_EXAMPLES):
+    """
+    후보 단계 n개를 뽑아 특성 행렬로 돌려줍니다.
+    특성은 [바구니 크기, 간식1 여부, 간식2 여부, ...] 입니다.
+    examples: (n, num_examples, 특성 수), problems: (n, 특성 수)
+    """
+    num_features = 1 + len(ITEM_NAMES)
+    rows = np.empty((n, num_examples + 1, num_features), dtype=np.int64)
+    rows[..., 0] = rng.integers(BASKET_SIZES[0], BASKET_SIZES[1] + 1, (n, num_examples + 1))
+    rows[..., 1:] = rng.random((n, num_examples + 1, len(ITEM_NAMES))) < ITEM_CHANCE
+    return rows[:, :-1], rows[:, -1]
+
+
+def identifiable(examples, problems, tol=1e-6):
+    """
+    예시 표만으로 주문 가격이 하나로 정해지는지 한꺼번에 검사합니다.
+    주문의 특성 벡터가 예시 행들이 만드는 공간 안에 있어야 합니다.
+    (pinv(X) X 로 투영했을 때 남는 성분이 없어야 함)
+    또한 최소제곱 해로 예측한 가격이 실제 가격과 같아야 합니다.
+    """
+    x = examples.astype(np.float64)
+    q = problems.astype(np.float64)
+    x_pinv = np.linalg.pinv(x)  # (n, 특성 수, 예시 수)
+    projection = np.einsum('nfe,neg->nfg', x_pinv, x)
+    residual = q - np.einsum('nf,nfg->ng', q, projection)
+    in_row_space = np.abs(residual).max(axis=1) < tol
+
+    coefficients = np.array([BASKET_PRICE, *ITEM_PRICE.values()], dtype=np.float64)
+    prices = x @ coefficients
+    fitted = np.einsum('nfe,ne->nf', x_pinv, prices)
+    predicted = np.einsum('nf,nf->n', q, fitted)
+    consistent = np.abs(predicted - q @ coefficients) < 0.5
+
+    # 주문이 예시 중 하나와 똑같으면 표에서 그대로 읽을 수 있으므로 제외합니다.
+    copied = (examples == problems[:, None, :]).all(axis=2).any(axis=1)
+    return in_row_space & consistent & ~copied
+
+
+def validate_batch(n, seed=None, num_examples=NUM_EXAMPLES):
+    """후보 n개를 만들어 검사합니다. (examples, problems, 통과 여부)를 돌려줍니다."""
+    rng = np.random.default_rng(seed)
+    examples, problems = draw_candidates(n, rng, num_examples)
+    return examples, problems, identifiable(examples, problems)
+
+
+def items_of(features):
+    """특성 벡터의 간식 부분을 calculate_price가 받는 형식(None/문자열/리스트)으로 바꿉니다."""
+    items = [name for name, included in zip(ITEM_NAMES, features[1:]) if included]
+    if not items:
+        return None
+    if len(items) == 1:
+        return items[0]
+    return items
+
+
+def item_text(items):
+    if items is None:
+        return '❌ 없음'
+    if isinstance(items, list):
+        return ' + '.join(items)
+    return items
+
+
+def to_step_data(example_rows, problem_row):
+    """검사를 통과한 후보 하나를 generate_step_data와 같은 형식으로 바꿉니다."""
+    examples = []
+    for row in example_rows.tolist():
+        items = items_of(row)
+        examples.append({'basket': row[0], 'item': item_text(items), 'price': calculate_price(row[0], items)})
+    problem_size = int(problem_row[0])
+    problem_items = items_of(problem_row.tolist())
+    answer = calculate_price(problem_size, problem_items)
+    return examples, problem_size, problem_items, answer, GENERATED_HINT
+
+
+def generate_steps(count, seed=None, batch_size=BATCH_SIZE):
+    """정답이 하나로 정해지는 단계 count개를 만듭니다. 필요하면 배치를 더 뽑습니다."""
+    rng = np.random.default_rng(seed)
+    steps = []
+    while len(steps) < count:
+        examples, problems = draw_candidates(batch_size, rng)
+        for i in np.flatnonzero(identifiable(examples, problems))[:count - len(steps)]:
+            steps.append(to_step_data(examples[i], problems[i]))
+    return steps
@@ -0,0 +1,265 @@
+# 메모리 맵으로 여는 이진 문제 은행
+# 문제를 파이썬 객체 대신 고정 폭 정수 레코드로 파일 하나에 미리 써 두고, 서버는 시작할 때
+# np.memmap으로 열기만 합니다. 여러 워커 프로세스가 같은 파일을 열면 운영체제 페이지 캐시를
+# 함께 쓰므로 문제가 많아져도 프로세스마다 복사본이 생기지 않고 여는 시간도 거의 없습니다.
+# (지금 숫자 문제는 중복을 뺀 58,045개, 가격 단계는 --price-steps개입니다)
+#
+#   python -m engine.problem_bank build problems.bank --price-steps 1000
+#   GAME_PROBLEM_BANK=problems.bank streamlit run app.py
+#
+# 파일 구조 (리틀 엔디언)
+#   머리말: 매직 b'PBNK', 버전(u2), 구역 수(u2)
+#   구역 목록: 구역마다 이름(8바이트), 시작 위치(u8), 레코드 수(u8)
+#   구역: sequence / weather / price / str_offs / str_data (64바이트 경계에 맞춤)
+# 문자열(날씨 패턴 이름과 설명, 가격 힌트)은 str_offs(u4 시작 위치 배열)와 str_data(UTF-8)로 된 문자열 표에 두고
+# 레코드에는 문자열 번호만 저장합니다.
+import argparse
+import os
+import struct
+import time
+from functools import lru_cache
+
+import numpy as np
+
+from .sequences import MAX_LENGTH, NUMBER_INPUT_MAX
+
+MAGIC = b'PBNK'
+VERSION = 1
+HEADER = struct.Struct('<4sHH')
+SECTION = struct.Struct('<8sQQ')
+ALIGN = 64
+
+BANK_HISTORY_LENGTH = 6
+BANK_MAX_PERIOD = BANK_HISTORY_LENGTH // 2
+NUM_EXAMPLES = 3
+
+SEQUENCE_DTYPE = np.dtype([
+    ('type', 'u1'), ('length', 'u1'), ('blank_index', 'u1'), ('_pad', 'u1'),
+    ('start', '<i4'), ('diff_ratio', '<i4'), ('terms', '<i8', (MAX_LENGTH,)),
+])
+WEATHER_DTYPE = np.dtype([
+    ('history', 'u1', (BANK_HISTORY_LENGTH,)), ('next', 'u1'), ('period', 'u1'),
+    ('word', 'u1', (BANK_MAX_PERIOD,)), ('_pad', 'u1', (3,)), ('name', '<u4'), ('desc', '<u4'),
+])
+PRICE_DTYPE = np.dtype([
+    ('example_basket', '<i2', (NUM_EXAMPLES,)), ('example_items', 'u1', (NUM_EXAMPLES,)),
+    ('problem_items', 'u1'), ('problem_basket', '<i2'), ('answer', '<i4'), ('hint', '<u4'),
+])
+SECTION_DTYPES = {
+    'sequence': SEQUENCE_DTYPE,
+    'weather': WEATHER_DTYPE,
+    'price': PRICE_DTYPE,
+    'str_offs': np.dtype('<u4'),
+    'str_data': np.dtype('u1'),
+}
+
+
+class ProblemBank:
+    """메모리 맵으로 연 문제 은행 (구역마다 레코드 배열 하나)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.raw = np.memmap(path, dtype=np.uint8, mode='r')
+        magic, version, section_count = HEADER.unpack_from(self.raw, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: 문제 은행 파일이 아닙니다.")
+        if version != VERSION:
+            raise ValueError(f"{path}: 문제 은행 버전 {version}은(는) 지원하지 않습니다. (필요한 버전: {VERSION})")
+        self.sections = {}
+        for i in range(section_count):
+            name, offset, count = SECTION.unpack_from(self.raw, HEADER.size + i * SECTION.size)
+            name = name.rstrip(b'\0').decode('ascii')
+            dtype = SECTION_DTYPES[name]
+            self.sections[name] = self.raw[offset:offset + count * dtype.itemsize].view(dtype)
+
+    @property
+    def sequences(self):
+        return self.sections['sequence']
+
+    @property
+    def weather(self):
+        return self.sections['weather']
+
+    @property
+    def price(self):
+        return self.sections['price']
+
+    def string(self, index):
+        offsets = self.sections['str_offs']
+        return bytes(self.sections['str_data'][offsets[index]:offsets[index + 1]]).decode('utf-8')
+
+    def sequence_batch(self):
+        """engine.sequences.generate_problem_batch와 같은 모양의 딕셔너리 (복사 없이 뷰만 만듭니다)"""
+        records = self.sequences
+        return {name: records[name] for name in ('type', 'start', 'diff_ratio', 'length', 'blank_index', 'terms')}
+
+    def weather_index(self):
+        """engine.weather.build_pattern_index와 같은 모양의 딕셔너리"""
+        records = self.weather
+        return {name: records[name] for name in ('history', 'next', 'period', 'word')}
+
+    def weather_strings(self):
+        """패턴마다 (이름 목록, 설명 목록) (engine.weather.pattern_name, pattern_description과 같은 값)"""
+        records = self.weather
+        return ([self.string(i) for i in records['name'].tolist()],
+                [self.string(i) for i in records['desc'].tolist()])
+
+    def price_step(self, step):
+        """step번째 단계를 generate_step_data와 같은 형식으로 돌려줍니다. (1단계부터, 없으면 None)"""
+        if not 1 <= step <= len(self.price):
+            return None
+        from .price import calculate_price
+        from .price_steps import item_text
+        record = self.price[step - 1]
+        examples = []
+        for basket, mask in zip(record['example_basket'].tolist(), record['example_items'].tolist()):
+            items = items_from_mask(mask)
+            examples.append({'basket': basket, 'item': item_text(items), 'price': calculate_price(basket, items)})
+        problem_items = items_from_mask(int(record['problem_items']))
+        return (examples, int(record['problem_basket']), problem_items,
+                int(record['answer']), self.string(int(record['hint'])))
+
+
+def items_from_mask(mask):
+    """간식 비트마스크를 calculate_price가 받는 형식(None/문자열/리스트)으로 바꿉니다."""
+    from .price_steps import ITEM_NAMES
+    items = [name for bit, name in enumerate(ITEM_NAMES) if mask >> bit & 1]
+    if not items:
+        return None
+    if len(items) == 1:
+        return items[0]
+    return items
+
+
+def items_to_mask(items):
+    from .price_steps import ITEM_NAMES
+    if items is None:
+        return 0
+    if isinstance(items, str):
+        items = [items]
+    return sum(1 << ITEM_NAMES.index(name) for name in items)
+
+
+class StringTable:
+    """같은 문자열은 한 번만 저장하는 문자열 표"""
+
+    def __init__(self):
+        self.ids = {}
+
+    def add(self, text):
+        return self.ids.setdefault(text, len(self.ids))
+
+    def sections(self):
+        data = [text.encode('utf-8') for text in self.ids]
+        offsets = np.zeros(len(data) + 1, dtype='<u4')
+        offsets[1:] = np.cumsum([len(chunk) for chunk in data])
+        return offsets, np.frombuffer(b''.join(data), dtype=np.uint8)
+
+
+# ----- 만들기 -----
+def build_sequences(candidates, seed):
+    """자동 생성 숫자 문제 (number_pattern.get_generated_sequences와 같은 시드와 후보 수, 중복은 빠집니다)"""
+    from .sequences import generate_problem_batch
+    batch = generate_problem_batch(candidates, seed=seed, max_value=NUMBER_INPUT_MAX)
+    records = np.zeros(len(batch['type']), dtype=SEQUENCE_DTYPE)
+    for name in ('type', 'start', 'diff_ratio', 'length', 'blank_index', 'terms'):
+        records[name] = batch[name]
+    return records
+
+
+def build_weather(strings):
+    from . import weather
+    index = weather.build_pattern_index(BANK_HISTORY_LENGTH, BANK_MAX_PERIOD)
+    records = np.zeros(len(index['next']), dtype=WEATHER_DTYPE)
+    for name in ('history', 'next', 'period', 'word'):
+        records[name] = index[name]
+    # 이름과 설명은 이미 열린 문제 은행을 거치지 않고 새로 만듭니다.
+    records['name'] = [strings.add(weather.make_pattern_name(i)) for i in range(len(records))]
+    records['desc'] = [strings.add(weather.make_pattern_description(i)) for i in range(len(records))]
+    return records
+
+
+def build_price(strings, step_count):
+    from .price import FIXED_STEPS, generate_step_data, make_generated_step
+    from .price_steps import ITEM_NAMES
+    records = np.zeros(step_count, dtype=PRICE_DTYPE)
+    for step in range(1, step_count + 1):
+        if step <= FIXED_STEPS:
+            step_data = generate_step_data(step)
+        else:
+            step_data = make_generated_step(step)  # 이미 열린 문제 은행을 거치지 않고 새로 만듭니다.
+        examples, problem_size, problem_items, answer, hint = step_data
+        record = records[step - 1]
+        record['example_basket'] = [example['basket'] for example in examples]
+        # 예시의 'item' 문자열('🍬 사탕 + 🍫 초콜릿', '❌ 없음')을 비트마스크로 바꿉니다.
+        record['example_items'] = [sum(1 << bit for bit, name in enumerate(ITEM_NAMES) if name in example['item'])
+                                   for example in examples]
+        record['problem_basket'] = problem_size
+        record['problem_items'] = items_to_mask(problem_items)
+        record['answer'] = answer
+        record['hint'] = strings.add(hint)
+    return records
+
+
+def write_bank(path, sections):
+    """구역들을 64바이트 경계에 맞춰 파일 하나로 씁니다. (임시 파일에 쓴 뒤 바꿔치기)"""
+    table_size = HEADER.size + SECTION.size * len(sections)
+    offset = -(-table_size // ALIGN) * ALIGN
+    entries, chunks = [], []
+    for name, array in sections.items():
+        if len(name) > 8:
+            raise ValueError(f"구역 이름은 8바이트 이하여야 합니다: {name}")
+        data = np.ascontiguousarray(array).tobytes()
+        entries.append(SECTION.pack(name.encode('ascii'), offset, len(array)))
+        padding = -len(data) % ALIGN
+        chunks.append(data + b'\0' * padding)
+        offset += len(data) + padding
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        header = HEADER.pack(MAGIC, VERSION, len(sections)) + b''.join(entries)
+        f.write(header + b'\0' * (-len(header) % ALIGN))
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, path)
+
+
+def build(path, candidates, seed, price_steps):
+    strings = StringTable()
+    sections = {
+        'sequence': build_sequences(candidates, seed),
+        'weather': build_weather(strings),
+        'price': build_price(strings, price_steps),
+    }
+    sections['str_offs'], sections['str_data'] = strings.sections()
+    write_bank(path, sections)
+    return sections
+
+
+@lru_cache(maxsize=None)
+def get_bank():
+    """GAME_PROBLEM_BANK가 있으면 그 파일을 연 ProblemBank를, 없으면 None을 돌려줍니다."""
+    path = os.environ.get('GAME_PROBLEM_BANK')
+    return ProblemBank(path) if path else None
+
+
+def main():
+    from .number_pattern import GENERATED_CANDIDATES
+    parser = argparse.ArgumentParser(description="이진 문제 은행 파일을 만듭니다.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    build_parser = subparsers.add_parser('build')
+    build_parser.add_argument('path')
+    build_parser.add_argument('--candidates', '--pool-size', dest='candidates', type=int,
+                              default=GENERATED_CANDIDATES, help='자동 생성 숫자 문제 후보 수 (중복은 빠집니다)')
+    build_parser.add_argument('--seed', type=int, default=0)
+    build_parser.add_argument('--price-steps', type=int, default=1000, help='저장할 가격 단계 수 (1단계부터)')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    sections = build(args.path, args.candidates, args.seed, args.price_steps)
+    counts = ', '.join(f"{name} {len(array):,}" for name, array in sections.items())
+    print(f"{args.path}: {os.path.getsize(args.path):,} bytes ({counts}) in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
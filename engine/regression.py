@@ -0,0 +1,121 @@
+# 가격 추론 "AI 훈련" 모드의 온라인 회귀 (재귀 최소제곱, RLS)
+# 플레이어가 (바구니 크기, 간식, 가격) 예시를 하나씩 가르치면 계수를 처음부터 다시 맞추지 않고
+# 예시 하나당 O(특성 수²)로 고칩니다. 세션에는 예시 목록 대신 계수 벡터와 역공분산 행렬만 남기므로
+# 예시가 수천 개여도 화면을 다시 그리는 비용이 그대로입니다.
+#   가격 ≈ 바구니 크기 × w0 + Σ (간식 i가 들어 있으면 wi)
+import numpy as np
+
+from .price import BASKET_PRICE, ITEM_PRICE, calculate_price
+from .rng import SessionRandom
+
+INITIAL_VARIANCE = 1e6  # 처음에는 계수를 거의 모른다고 봅니다. (P = δI)
+RECENT_EXAMPLES = 5  # 화면에 보여줄 최근 예시 수
+BASKET_SIZES = (1, 9)
+
+
+class RecursiveLeastSquares:
+    """예시를 하나씩 받아 계수를 고치는 선형 회귀 (절편 없음)"""
+
+    __slots__ = ('weights', 'covariance', 'count')
+
+    def __init__(self, num_features, initial_variance=INITIAL_VARIANCE):
+        self.weights = np.zeros(num_features)
+        self.covariance = np.eye(num_features) * initial_variance  # (XᵀX)⁻¹에 해당하는 행렬 P
+        self.count: int = 0
+
+    def update(self, features, target):
+        """
+        예시 하나로 계수를 고치고 고치기 전 예측 오차를 돌려줍니다.
+        셔먼-모리슨 공식으로 P를 직접 고치므로 역행렬을 다시 구하지 않습니다.
+        """
+        x = np.asarray(features, dtype=np.float64)
+        px = self.covariance @ x
+        gain = px / (1.0 + x @ px)
+        error = target - x @ self.weights
+        self.weights += gain * error
+        self.covariance -= np.outer(gain, px)
+        self.count += 1
+        return error
+
+    def predict(self, features):
+        return float(np.asarray(features, dtype=np.float64) @ self.weights)
+
+    def add_feature(self, initial_variance=INITIAL_VARIANCE):
+        """새 특성(간식 종류)을 계수 0, 분산 δ로 덧붙입니다. 지금까지 배운 계수는 그대로 둡니다."""
+        size = len(self.weights)
+        covariance = np.zeros((size + 1, size + 1))
+        covariance[:size, :size] = self.covariance
+        covariance[size, size] = initial_variance
+        self.covariance = covariance
+        self.weights = np.append(self.weights, 0.0)
+
+
+class TrainingState:
+    """AI 훈련 모드의 세션 상태 (모델, 간식 이름, 최근 예시 몇 개, 지금 손님 주문)"""
+
+    __slots__ = ('model', 'item_names', 'recent', 'order', 'input_key', 'rng')
+
+    def __init__(self, item_names=tuple(ITEM_PRICE), seed=None):
+        self.item_names: list = list(item_names)
+        self.model: RecursiveLeastSquares = RecursiveLeastSquares(1 + len(self.item_names))
+        self.recent: list = []  # (바구니 크기, 간식 이름 목록, 가격) 최근 RECENT_EXAMPLES개
+        self.input_key: int = 0
+        self.rng: SessionRandom = SessionRandom(seed)
+        self.order: tuple = (1, ())
+        next_order(self)
+
+
+def features_of(state, size, items):
+    """[바구니 크기, 간식1 여부, 간식2 여부, ...]"""
+    return [size, *(name in items for name in state.item_names)]
+
+
+def teach(state, size, items, price):
+    """예시 하나를 가르칩니다. 가르치기 전 모델이 얼마나 틀렸는지 돌려줍니다."""
+    error = state.model.update(features_of(state, size, items), price)
+    state.recent = [(size, tuple(items), price), *state.recent[:RECENT_EXAMPLES - 1]]
+    state.input_key += 1
+    return error
+
+
+def add_item(state, name):
+    """새 간식 종류를 모델에 더합니다. 이미 있으면 아무 일도 하지 않습니다."""
+    name = name.strip()
+    if not name or name in state.item_names:
+        return False
+    state.item_names.append(name)
+    state.model.add_feature()
+    return True
+
+
+def estimates(state):
+    """{'바구니 1칸': 계수, 간식 이름: 계수, ...}"""
+    return dict(zip(['바구니 1칸', *state.item_names], state.model.weights.tolist()))
+
+
+def predict_order(state):
+    size, items = state.order
+    return state.model.predict(features_of(state, size, items))
+
+
+def next_order(state):
+    """다음 손님 주문을 세션 난수로 고릅니다."""
+    size = BASKET_SIZES[0] + state.rng.randrange(BASKET_SIZES[1] - BASKET_SIZES[0] + 1)
+    items = tuple(name for name in state.item_names if state.rng.random() < 0.5)
+    state.order = (size, items)
+
+
+def true_price(size, items):
+    """게임에 정해진 가격 규칙 (BASKET_PRICE, ITEM_PRICE). 플레이어가 더한 간식은 0원으로 봅니다."""
+    known = [name for name in items if name in ITEM_PRICE]
+    return calculate_price(size, known)
+
+
+def sample_examples(state, count, rng):
+    """정해진 가격 규칙으로 무작위 예시 count개를 가르칩니다. (rng는 np.random.Generator)"""
+    sizes = rng.integers(BASKET_SIZES[0], BASKET_SIZES[1] + 1, count)
+    included = rng.random((count, len(state.item_names))) < 0.5
+    item_prices = np.array([ITEM_PRICE.get(name, 0) for name in state.item_names])
+    prices = sizes * BASKET_PRICE + included @ item_prices
+    for size, row, price in zip(sizes.tolist(), included, prices.tolist()):
+        teach(state, size, [name for name, flag in zip(state.item_names, row) if flag], price)
@@ -0,0 +1,51 @@
+# 화면에 그릴 문자열(문제 표시, 피드백 문구 등)을 프로세스 전체에서 공유하는 LRU 캐시
+# 키는 (게임, 종류, 문제 ID, 결과...) 튜플이고, 같은 문제를 받은 세션들은 같은 문자열 객체를 씁니다.
+# 크기는 GAME_RENDER_CACHE_SIZE 환경 변수로 바꿀 수 있고, 넘치면 가장 오래 안 쓴 것부터 버립니다.
+# (sys.intern은 버릴 수가 없어서 쓰지 않고, 이 캐시가 문자열을 하나로 모으는 역할을 합니다)
+import os
+import threading
+from collections import OrderedDict
+
+RENDER_CACHE_SIZE = int(os.environ.get('GAME_RENDER_CACHE_SIZE', '4096'))
+
+
+class RenderCache:
+    """크기 제한이 있는 스레드 안전 LRU 캐시 (적중/실패 횟수를 셉니다)"""
+
+    def __init__(self, maxsize=RENDER_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, build, *args):
+        """key에 저장된 문자열을 돌려주고, 없으면 build(*args)로 만들어 저장합니다."""
+        with self.lock:
+            value = self.data.get(key)
+            if value is not None:
+                self.data.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+
+        # 만드는 동안에는 잠그지 않습니다. (두 세션이 동시에 만들면 먼저 넣은 쪽을 씁니다)
+        value = build(*args)
+        with self.lock:
+            value = self.data.setdefault(key, value)
+            self.data.move_to_end(key)
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+        return value
+
+    def stats(self):
+        with self.lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self.data), 'maxsize': self.maxsize}
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+            self.hits = self.misses = 0
+
+
+RENDER_CACHE = RenderCache()
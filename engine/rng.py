@@ -0,0 +1,67 @@
+# 세션마다 따로 쓰는 시드 고정 난수 생성기
+# 서버의 모든 세션 스레드가 전역 random 모듈을 함께 쓰면 어떤 실행도 다시 만들 수 없으므로,
+# 세션 상태에 (시드, 사용한 난수 개수)만 두고 난수는 BLOCK_SIZE개씩 미리 뽑아 씁니다.
+# k번째 난수 묶음은 (시드, k)로만 정해지므로 같은 시드로 처음부터 다시 돌리면
+# 문제 순서가 그대로 재현됩니다. (engine.number_pattern/weather의 replay_questions 참고)
+import secrets
+
+import numpy as np
+
+BLOCK_SIZE = 16  # 한 게임에서 쓰는 난수는 보통 이보다 적습니다.
+MAX_SEED = (1 << 63) - 1
+
+
+def new_seed():
+    """세션 시드 (버그 제보나 재현에 쓸 수 있도록 화면에 보여줄 만큼 짧게 만듭니다)"""
+    return secrets.randbelow(1 << 31)
+
+
+def parse_seed(value):
+    """주소(?seed=) 등에서 받은 값을 시드로 바꿉니다. 0 ~ MAX_SEED 정수가 아니면 None을 돌려줍니다."""
+    if value is None:
+        return None
+    text = str(value).strip()
+    if not (text.isascii() and text.isdigit()):
+        return None
+    seed = int(text)
+    return seed if seed <= MAX_SEED else None
+
+
+class SessionRandom:
+    """시드 하나로 정해지는 세션 전용 난수열"""
+
+    __slots__ = ('seed', 'draws', 'block_index', 'block')
+
+    def __init__(self, seed=None):
+        self.seed: int = new_seed() if seed is None else int(seed)
+        if not 0 <= self.seed <= MAX_SEED:
+            raise ValueError(f"seed must be between 0 and {MAX_SEED}: {seed}")
+        self.draws: int = 0  # 지금까지 쓴 난수 개수
+        self.block_index: int = -1
+        self.block = None  # 지금 쓰는 묶음 (float64 배열)
+
+    def __getstate__(self):
+        # 미리 뽑아 둔 묶음은 (시드, 개수)로 다시 만들 수 있으므로 저장하지 않습니다.
+        return self.seed, self.draws
+
+    def __setstate__(self, state):
+        self.seed, self.draws = state
+        self.block_index = -1
+        self.block = None
+
+    def random(self):
+        """[0, 1) 실수 하나"""
+        block_index, offset = divmod(self.draws, BLOCK_SIZE)
+        if block_index != self.block_index:
+            generator = np.random.default_rng([self.seed, block_index])
+            self.block = generator.random(BLOCK_SIZE)
+            self.block_index = block_index
+        self.draws += 1
+        return float(self.block[offset])
+
+    def randrange(self, n):
+        """0 이상 n 미만의 정수 하나"""
+        return min(int(self.random() * n), n - 1)
+
+    def choice(self, sequence):
+        return sequence[self.randrange(len(sequence))]
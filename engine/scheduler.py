@@ -0,0 +1,59 @@
+# 모든 게임이 함께 쓰는 "겹치지 않는 문제 순서"
+# 세션마다 (키, 커서) 정수 두 개만 저장하고, 커서 번째 문제 번호는 키로 섞은 순열에서 바로 계산합니다.
+# 순열은 파이스텔(Feistel) 네트워크와 사이클 워킹으로 만들기 때문에
+# 문제 풀 크기나 이미 푼 문제 수와 상관없이 한 번 고르는 데 드는 시간과 메모리가 일정합니다.
+MASK64 = (1 << 64) - 1
+ROUNDS = 4
+
+
+def _round(value, key, round_index, mask):
+    """파이스텔 라운드 함수 (splitmix64 섞기)"""
+    x = (value * 0x9E3779B97F4A7C15 + key + round_index * 0xBF58476D1CE4E5B9) & MASK64
+    x ^= x >> 31
+    x = (x * 0x94D049BB133111EB) & MASK64
+    x ^= x >> 29
+    return x & mask
+
+
+def permute(index, size, key):
+    """
+    0 ~ size-1을 key로 섞은 순열의 index번째 값.
+    size보다 조금 큰 2의 거듭제곱 범위에서 파이스텔 순열을 만들고,
+    범위를 벗어난 값은 다시 섞어서(사이클 워킹) size 안으로 들어올 때까지 반복합니다. (평균 4번 이하)
+    """
+    if not 0 <= index < size:
+        raise IndexError(f"index {index} out of range for size {size}")
+    half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+    mask = (1 << half_bits) - 1
+    x = index
+    while True:
+        left, right = x >> half_bits, x & mask
+        for round_index in range(ROUNDS):
+            left, right = right, left ^ _round(right, key, round_index, mask)
+        x = (left << half_bits) | right
+        if x < size:
+            return x
+
+
+class QuestionOrder:
+    """세션 하나의 문제 순서 (키와 지금까지 낸 문제 수만 저장)"""
+
+    __slots__ = ('key', 'cursor')
+
+    def __init__(self, key):
+        self.key: int = key
+        self.cursor: int = 0
+
+    def next(self, size, cycle=False):
+        """
+        size개 문제 중 아직 내지 않은 문제 번호를 돌려줍니다. 모두 냈으면 None.
+        cycle=True면 한 바퀴를 다 돈 뒤 다른 순서로 다시 섞어서 이어 갑니다.
+        """
+        round_number, position = divmod(self.cursor, size)
+        if round_number and not cycle:
+            return None
+        self.cursor += 1
+        return permute(position, size, self.key + round_number)
+
+    def remaining(self, size):
+        return max(size - self.cursor, 0)
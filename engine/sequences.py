@@ -0,0 +1,112 @@
+import numpy as np
+
+# number_input 위젯이 다룰 수 있는 가장 큰 정수 (자바스크립트 안전 정수 한계)
+NUMBER_INPUT_MAX = (1 << 53) - 1
+
+# 수열 종류 코드
+TYPE_ARITHMETIC = 0
+TYPE_GEOMETRIC = 1
+TYPE_NAMES = ('arithmetic', 'geometric')
+
+# 문제 생성 범위 (양 끝 포함)
+MIN_LENGTH, MAX_LENGTH = 5, 6
+ARITHMETIC_START = (1, 200)
+ARITHMETIC_DIFF = (1, 30)
+GEOMETRIC_START = (1, 50)
+GEOMETRIC_RATIO = (2, 10)
+GEOMETRIC_SHARE = 0.5  # 곱셈 문제 비율
+# 위 범위로 만들 수 있는 서로 다른 문제 수 (종류별 시작값 × 공차/공비) × (길이, 빈칸 위치) 조합 = 58,050
+# 후보를 이보다 훨씬 많이 뽑아도 중복을 빼면 이 수를 넘지 못합니다.
+PROBLEM_SPACE_SIZE = (
+    (ARITHMETIC_START[1] - ARITHMETIC_START[0] + 1) * (ARITHMETIC_DIFF[1] - ARITHMETIC_DIFF[0] + 1)
+    + (GEOMETRIC_START[1] - GEOMETRIC_START[0] + 1) * (GEOMETRIC_RATIO[1] - GEOMETRIC_RATIO[0] + 1)
+) * sum(length - 1 for length in range(MIN_LENGTH, MAX_LENGTH + 1))
+
+
+def generate_problem_batch(n, seed=None, max_value=NUMBER_INPUT_MAX):
+    """
+    덧셈/곱셈 수열 문제 n개를 NumPy로 한 번에 만듭니다.
+    중복 문제와 number_input 범위를 넘는 문제는 버리므로 결과는 n개보다 적을 수 있습니다.
+    반환값은 열(column)마다 배열 하나씩 담은 딕셔너리입니다.
+    """
+    rng = np.random.default_rng(seed)
+
+    is_geometric = rng.random(n) < GEOMETRIC_SHARE
+    start = np.where(
+        is_geometric,
+        rng.integers(GEOMETRIC_START[0], GEOMETRIC_START[1] + 1, n),
+        rng.integers(ARITHMETIC_START[0], ARITHMETIC_START[1] + 1, n),
+    )
+    diff_ratio = np.where(
+        is_geometric,
+        rng.integers(GEOMETRIC_RATIO[0], GEOMETRIC_RATIO[1] + 1, n),
+        rng.integers(ARITHMETIC_DIFF[0], ARITHMETIC_DIFF[1] + 1, n),
+    )
+    length = rng.integers(MIN_LENGTH, MAX_LENGTH + 1, n)
+    # 첫 항은 남겨 두어야 규칙을 찾을 수 있으므로 빈칸은 1번 이후에서만 고릅니다.
+    blank_index = rng.integers(1, length)
+
+    # 1. 같은 (종류, 시작값, 공차/공비, 길이, 빈칸) 조합을 정수 하나로 묶고,
+    # 정렬 대신 표시용 배열에 체크해서 한 번만 남깁니다.
+    start_size = max(ARITHMETIC_START[1], GEOMETRIC_START[1]) + 1
+    step_size = max(ARITHMETIC_DIFF[1], GEOMETRIC_RATIO[1]) + 1
+    code = is_geometric.astype(np.int64)
+    for value, size in ((start, start_size), (diff_ratio, step_size),
+                        (length, MAX_LENGTH + 1), (blank_index, MAX_LENGTH)):
+        code = code * size + value
+    seen = np.zeros(2 * start_size * step_size * (MAX_LENGTH + 1) * MAX_LENGTH, dtype=bool)
+    seen[code] = True
+    code = rng.permutation(np.flatnonzero(seen))
+
+    code, blank_index = np.divmod(code, MAX_LENGTH)
+    code, length = np.divmod(code, MAX_LENGTH + 1)
+    code, diff_ratio = np.divmod(code, step_size)
+    is_geometric, start = np.divmod(code, start_size)
+    is_geometric = is_geometric.astype(bool)
+
+    # 2. 남은 문제의 모든 항을 한 번에 계산합니다.
+    # 곱셈 수열은 오버플로를 피하려고 실수로 크기부터 검사합니다.
+    k = np.arange(MAX_LENGTH)
+    valid = k < length[:, None]
+    approx = np.where(
+        is_geometric[:, None],
+        start[:, None] * diff_ratio[:, None].astype(np.float64) ** k,
+        start[:, None] + diff_ratio[:, None] * k,
+    )
+    fits = ~(valid & (approx > max_value)).any(axis=1)
+
+    terms = np.where(
+        is_geometric[fits, None],
+        start[fits, None] * diff_ratio[fits, None] ** k,
+        start[fits, None] + diff_ratio[fits, None] * k,
+    )
+    terms = np.where(valid[fits], terms, 0)
+
+    return {
+        'type': is_geometric[fits].astype(np.uint8),
+        'start': start[fits],
+        'diff_ratio': diff_ratio[fits],
+        'length': length[fits].astype(np.uint8),
+        'blank_index': blank_index[fits].astype(np.uint8),
+        'terms': terms,
+    }
+
+
+def rule_description(pattern_type, diff_ratio):
+    """FIXED_SEQUENCES와 같은 말투로 규칙 설명을 만듭니다."""
+    if pattern_type == 'geometric':
+        return f"{diff_ratio}씩 곱하는 패턴"
+    return f"{diff_ratio}씩 커지는 (더하기) 패턴"
+
+
+def problem_record(batch, i):
+    """배치의 i번째 문제를 FIXED_SEQUENCES 항목과 같은 형식의 딕셔너리로 돌려줍니다."""
+    pattern_type = TYPE_NAMES[int(batch['type'][i])]
+    diff_ratio = int(batch['diff_ratio'][i])
+    return {
+        'sequence': batch['terms'][i, :int(batch['length'][i])].tolist(),
+        'blank_index': int(batch['blank_index'][i]),
+        'type': pattern_type,
+        'diff_ratio': diff_ratio,
+        'rule_desc': rule_description(pattern_type, diff_ratio),
+    }
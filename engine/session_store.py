@@ -0,0 +1,164 @@
+# 세션 상태를 프로세스 밖에 저장하는 백엔드
+# 워커를 여러 개 띄우거나 다시 시작해도 게임이 이어지도록, 게임별 상태 객체를
+# (세션 번호, 상태 키)로 저장합니다. GAME_SESSION_STORE 환경 변수로 고릅니다.
+#   GAME_SESSION_STORE=sqlite:///sessions.db  → SQLite (WAL, 여러 프로세스가 함께 씀)
+#   GAME_SESSION_STORE=memory                 → 현재 프로세스 메모리 (테스트용)
+#   없음                                       → 저장하지 않음 (st.session_state만 사용)
+# 상태 객체는 __slots__ 값 목록만 pickle로 저장합니다. (NumPy 버퍼 같은 다시 만들 수 있는 값은 빼고)
+# time.monotonic() 시각은 프로세스마다 기준이 다르므로 벽시계 시각으로 바꿔 저장하고 읽을 때 되돌립니다.
+# SQLite에 저장한 세션은 SESSION_TTL 동안 저장되지 않으면 지웁니다.
+import importlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT NOT NULL,
+    key TEXT NOT NULL,
+    data BLOB NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (session_id, key)
+);
+CREATE INDEX IF NOT EXISTS sessions_updated ON sessions (updated);
+"""
+SESSION_TTL = 7 * 24 * 60 * 60  # 이만큼 저장되지 않은 세션은 지웁니다. (초)
+SWEEP_INTERVAL = 10 * 60  # 오래된 세션을 지우는 간격 (초, 워커마다)
+MONOTONIC_SLOTS = frozenset({'shown_at'})  # time.monotonic() 값을 담는 슬롯
+
+
+def to_wall_clock(value):
+    """이 프로세스의 time.monotonic() 시각을 벽시계 시각(time.time())으로 바꿉니다. (0.0은 '아직 없음')"""
+    return value and time.time() - (time.monotonic() - value)
+
+
+def from_wall_clock(value):
+    return value and time.monotonic() - (time.time() - value)
+
+
+def dump_state(state):
+    """상태 객체를 (모듈, 클래스, 슬롯 이름, 값) 묶음의 바이트열로 바꿉니다."""
+    cls = type(state)
+    values = [to_wall_clock(getattr(state, name)) if name in MONOTONIC_SLOTS else getattr(state, name)
+              for name in cls.__slots__]
+    return pickle.dumps((cls.__module__, cls.__qualname__, cls.__slots__, values), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_state(data):
+    """
+    dump_state로 저장한 바이트열을 상태 객체로 되돌립니다.
+    engine 패키지 밖의 클래스이거나 배포 후 슬롯 구성이 바뀌었으면 None을 돌려줍니다. (새 게임으로 시작)
+    """
+    module_name, class_name, slots, values = pickle.loads(data)
+    if not module_name.startswith('engine.'):
+        return None
+    cls = getattr(importlib.import_module(module_name), class_name, None)
+    if cls is None or tuple(cls.__slots__) != tuple(slots):
+        return None
+    state = cls.__new__(cls)
+    for name, value in zip(slots, values):
+        setattr(state, name, from_wall_clock(value) if name in MONOTONIC_SLOTS else value)
+    return state
+
+
+class NullStore:
+    """저장하지 않는 백엔드"""
+
+    enabled = False
+
+    def load(self, session_id, key):
+        return None
+
+    def save(self, session_id, key, state):
+        pass
+
+
+class MemoryStore:
+    """현재 프로세스 메모리에 바이트열로 저장하는 백엔드 (워커를 다시 시작하면 사라집니다)"""
+
+    enabled = True
+
+    def __init__(self):
+        self.data = {}
+        self.lock = threading.Lock()
+
+    def load(self, session_id, key):
+        with self.lock:
+            data = self.data.get((session_id, key))
+        return load_state(data) if data is not None else None
+
+    def save(self, session_id, key, state):
+        data = dump_state(state)
+        with self.lock:
+            self.data[(session_id, key)] = data
+
+
+class SqliteStore:
+    """SQLite 파일에 저장하는 백엔드. WAL 모드라서 여러 워커 프로세스가 동시에 읽고 쓸 수 있습니다."""
+
+    enabled = True
+
+    def __init__(self, path, ttl=SESSION_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.local = threading.local()  # 스크립트 실행 스레드마다 연결 하나
+        self.next_sweep = 0.0  # 다음에 오래된 세션을 지울 시각 (time.monotonic)
+
+    def connection(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = self.local.conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            conn.commit()
+        return conn
+
+    def sweep(self, conn):
+        """SWEEP_INTERVAL마다 한 번, ttl 동안 저장되지 않은 세션을 지우고 지운 수를 돌려줍니다."""
+        now = time.monotonic()
+        if now < self.next_sweep:
+            return 0
+        self.next_sweep = now + SWEEP_INTERVAL
+        with conn:
+            return conn.execute("DELETE FROM sessions WHERE updated < ?", (time.time() - self.ttl,)).rowcount
+
+    def load(self, session_id, key):
+        row = self.connection().execute(
+            "SELECT data FROM sessions WHERE session_id = ? AND key = ?", (session_id, key),
+        ).fetchone()
+        return load_state(row[0]) if row else None
+
+    def save(self, session_id, key, state):
+        conn = self.connection()
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO sessions (session_id, key, data, updated) VALUES (?, ?, ?, ?)",
+                         (session_id, key, dump_state(state), time.time()))
+        self.sweep(conn)
+
+
+def open_store(url):
+    """'sqlite:///경로' 또는 'memory'로 백엔드를 만듭니다."""
+    if not url:
+        return NullStore()
+    if url == 'memory':
+        return MemoryStore()
+    if url.startswith('sqlite:///'):
+        return SqliteStore(url[len('sqlite:///'):])
+    raise ValueError(f"알 수 없는 세션 저장소: {url}")
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_session_store():
+    """GAME_SESSION_STORE로 정한 공유 백엔드를 돌려줍니다."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = open_store(os.environ.get('GAME_SESSION_STORE'))
+    return _store
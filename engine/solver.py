@@ -0,0 +1,419 @@
+# 문제 자동 풀이기: 출제된 문제가 정말 풀 수 있는지 한꺼번에 검사합니다.
+# 플레이어가 보는 것만으로 규칙을 추론해서 답을 구하고, 저장된 정답과 비교합니다.
+#   숫자 추론: '?'가 있는 수열 -> 덧셈/곱셈 규칙 (수열 가족은 2차식, 피보나치형 점화식, 번갈아 나오기까지)
+#   날씨 추론: 과거 6일 이력 -> 이력과 맞는 모든 주기의 다음 날 날씨
+#   가격 추론: 예시 표(바구니 크기, 들어있는 것, 가격) -> 최소제곱으로 구한 칸당/간식당 가격
+# 자동 생성 문제는 출제 묶음(get_generated_sequences) 전체를 NumPy 배열 연산으로 한 번씩 검사합니다.
+# --sequences를 주면 다른 시드로 뽑은 문제도 중복을 빼고 검사합니다. (생성 범위 전체는 sequences.PROBLEM_SPACE_SIZE = 58,050문제)
+#   python -m engine.solver --sequences 2000000 --seed 1 --json solver-report.json   (문제가 있으면 종료 코드 1)
+import argparse
+import json
+import sys
+import time
+from fractions import Fraction
+
+import numpy as np
+
+from . import number_pattern, price, weather
+from .families import SHOWN_TERMS, Alternating, Arithmetic, Geometric, LinearRecurrence
+from .price_steps import ITEM_NAMES, item_text
+from .sequences import MAX_LENGTH, TYPE_ARITHMETIC, TYPE_GEOMETRIC, TYPE_NAMES, generate_problem_batch
+
+# 검사 결과
+OK, AMBIGUOUS, UNSOLVABLE, WRONG_ANSWER, RULE_MISMATCH = range(5)
+STATUS_NAMES = ('ok', 'ambiguous', 'unsolvable', 'wrong_answer', 'rule_mismatch')
+REPORT_EXAMPLES = 20  # 보고서에 문제마다 남기는 예시 수
+
+
+# ----- 숫자 추론 -----
+def take(values, index):
+    return np.take_along_axis(values, index[:, None], axis=1)[:, 0]
+
+
+def solve_sequences(terms, length, blank_index):
+    """
+    보이는 항(빈칸과 길이 밖을 뺀 항)만으로 덧셈/곱셈 규칙을 추론합니다.
+    문제마다 (덧셈 규칙이 맞는지, 그 답, 공차, 곱셈 규칙이 맞는지, 그 답, 공비)를 배열로 돌려줍니다.
+    """
+    terms = np.asarray(terms, dtype=np.int64)
+    length = np.asarray(length, dtype=np.int64)
+    blank_index = np.asarray(blank_index, dtype=np.int64)
+    k = np.arange(terms.shape[1])
+    visible = (k < length[:, None]) & (k != blank_index[:, None])
+    # 보이는 항 중 앞의 두 개로 규칙을 정하고, 나머지 보이는 항으로 확인합니다.
+    first_two = np.argsort(~visible, axis=1, kind='stable')[:, :2]
+    j0, j1 = first_two[:, 0], first_two[:, 1]
+    t0, t1 = take(terms, j0), take(terms, j1)
+    gap = j1 - j0
+    offset = k - j0[:, None]
+
+    # 덧셈: t0 + d·(k - j0)
+    diff, remainder = np.divmod(t1 - t0, gap)
+    arithmetic_terms = t0[:, None] + diff[:, None] * offset
+    arithmetic_ok = (remainder == 0) & ((arithmetic_terms == terms) | ~visible).all(axis=1)
+    arithmetic_answer = take(arithmetic_terms, blank_index)
+
+    # 곱셈: t0 · r^(k - j0) (r은 2 이상의 정수, 넘침을 피하려고 실수로 크기부터 봅니다)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        ratio = np.rint(np.where(t0 > 0, t1 / np.where(t0 > 0, t0, 1), 0.0) ** (1.0 / gap)).astype(np.int64)
+        approx = t0[:, None] * ratio[:, None].astype(np.float64) ** offset
+    in_range = np.abs(approx) < 2.0 ** 62
+    safe_ratio = np.where(ratio >= 2, ratio, 2)
+    power = safe_ratio[:, None] ** np.clip(np.abs(offset), 0, 62)
+    power = np.where(in_range, power, 1)
+    geometric_terms = np.where(offset >= 0, t0[:, None] * power, t0[:, None] // power)
+    exact = (offset >= 0) | (t0[:, None] % power == 0)
+    geometric_ok = (ratio >= 2) & ((in_range & exact & (geometric_terms == terms)) | ~visible).all(axis=1)
+    geometric_ok &= take(in_range & exact, blank_index)
+    geometric_answer = take(geometric_terms, blank_index)
+    return {
+        'arithmetic_ok': arithmetic_ok, 'arithmetic_answer': arithmetic_answer, 'diff': diff,
+        'geometric_ok': geometric_ok, 'geometric_answer': geometric_answer, 'ratio': ratio,
+    }
+
+
+def sequence_status(solved, answer, pattern_type, diff_ratio):
+    """추론 결과를 저장된 정답/종류/공차(공비)와 비교해서 문제마다 상태 코드를 매깁니다."""
+    a_ok, g_ok = solved['arithmetic_ok'], solved['geometric_ok']
+    a_answer, g_answer = solved['arithmetic_answer'], solved['geometric_answer']
+    inferred = np.where(a_ok, a_answer, g_answer)
+    inferred_type = np.where(a_ok, TYPE_ARITHMETIC, TYPE_GEOMETRIC)
+    inferred_step = np.where(a_ok, solved['diff'], solved['ratio'])
+
+    status = np.full(len(answer), OK, dtype=np.uint8)
+    status[(inferred_type != pattern_type) | (inferred_step != diff_ratio)] = RULE_MISMATCH
+    status[inferred != answer] = WRONG_ANSWER
+    status[a_ok & g_ok & (a_answer != g_answer)] = AMBIGUOUS
+    status[~a_ok & ~g_ok] = UNSOLVABLE
+    return status, inferred
+
+
+def fixed_sequence_arrays():
+    ids = list(number_pattern.FIXED_SEQUENCES)
+    terms = np.zeros((len(ids), MAX_LENGTH), dtype=np.int64)
+    for i, question_id in enumerate(ids):
+        sequence = number_pattern.FIXED_SEQUENCES[question_id]['sequence']
+        terms[i, :len(sequence)] = sequence
+    records = [number_pattern.FIXED_SEQUENCES[question_id] for question_id in ids]
+    return ids, {
+        'terms': terms,
+        'length': np.array([len(r['sequence']) for r in records]),
+        'blank_index': np.array([r['blank_index'] for r in records]),
+        'type': np.array([TYPE_NAMES.index(r['type']) for r in records]),
+        'diff_ratio': np.array([r['diff_ratio'] for r in records]),
+    }
+
+
+def check_sequence_batch(batch):
+    """generate_problem_batch 모양의 배열 묶음을 검사해서 (상태 코드, 추론한 답)을 돌려줍니다."""
+    terms = np.asarray(batch['terms'], dtype=np.int64)
+    blank_index = np.asarray(batch['blank_index'], dtype=np.int64)
+    solved = solve_sequences(terms, batch['length'], blank_index)
+    answer = take(terms, blank_index)
+    return sequence_status(solved, answer, batch['type'], batch['diff_ratio'])
+
+
+def generated_sequences(count, seed=0):
+    """
+    검사용 자동 생성 문제를 count개 뽑아 중복을 빼고 돌려줍니다.
+    생성 범위 전체가 PROBLEM_SPACE_SIZE(58,050)문제뿐이라서 count가 커도 같은 문제는 한 번만 검사합니다.
+    """
+    return generate_problem_batch(count, seed=seed)
+
+
+# 수열 가족 문제: 보이는 항이 몇 개 안 되므로 규칙 후보마다 파이썬 정수로 맞춰 봅니다.
+def fit_arithmetic(points):
+    (i0, v0), (i1, v1) = points[:2]
+    if (v1 - v0) % (i1 - i0):
+        return None
+    diff = (v1 - v0) // (i1 - i0)
+    return Arithmetic(v0 - diff * i0, diff)
+
+
+def fit_geometric(points):
+    (i0, v0), (i1, v1) = points[:2]
+    if v0 <= 0 or i0 != 0:
+        return None
+    ratio = round((v1 / v0) ** (1 / (i1 - i0)))
+    return Geometric(v0, ratio) if ratio >= 2 else None
+
+
+class Interpolated:
+    """보이는 항 세 개를 지나는 2차식 (계수가 분수일 수도 있어서 Fraction으로 계산합니다)"""
+
+    def __init__(self, points):
+        self.points = points[:3]
+
+    def term(self, n):
+        total = Fraction(0)
+        for i, (xi, yi) in enumerate(self.points):
+            weight = Fraction(1)
+            for j, (xj, _) in enumerate(self.points):
+                if i != j:
+                    weight *= Fraction(n - xj, xi - xj)
+            total += yi * weight
+        return total
+
+
+def fit_quadratic(points):
+    return Interpolated(points)
+
+
+def fit_fibonacci(points):
+    values = dict(points)
+    if 0 in values and 1 in values:
+        return LinearRecurrence((1, 1), (values[0], values[1]))
+    if 0 in values and 2 in values:  # 둘째 항이 빈칸
+        return LinearRecurrence((1, 1), (values[0], values[2] - values[0]))
+    return None
+
+
+def fit_alternating(points):
+    parts = []
+    for parity in (0, 1):
+        sub = [(i // 2, v) for i, v in points if i % 2 == parity]
+        if len(sub) < 2:
+            return None
+        parts.append(fit_arithmetic(sub))
+    if None in parts:
+        return None
+    return Alternating(*parts)
+
+
+# (이름, 맞추는 함수, 정해야 하는 값 수). 보이는 항이 정해야 하는 값 수보다 많아야 규칙으로 인정합니다.
+FAMILY_RULES = (
+    ('arithmetic', fit_arithmetic, 2),
+    ('geometric', fit_geometric, 2),
+    ('quadratic', fit_quadratic, 3),
+    ('fibonacci', fit_fibonacci, 2),
+    ('alternating', fit_alternating, 4),
+)
+
+
+def solve_family(points, blank_index):
+    """보이는 (위치, 값) 목록과 맞는 규칙마다 빈칸 값을 구해 {규칙 이름: 답}으로 돌려줍니다."""
+    answers = {}
+    for name, fit, parameters in FAMILY_RULES:
+        if len(points) <= parameters:
+            continue
+        rule = fit(points)
+        if rule is None or any(rule.term(i) != v for i, v in points):
+            continue
+        value = rule.term(blank_index)
+        if isinstance(value, Fraction):
+            if value.denominator != 1:
+                continue
+            value = value.numerator
+        answers[name] = value
+    return answers
+
+
+def check_family(q_data):
+    """수열 가족 문제 하나. 화면에 보이는 앞쪽 SHOWN_TERMS개 항(빈칸 제외)으로 추론합니다."""
+    family, blank_index = q_data['family'], q_data['blank_index']
+    points = [(i, v) for i, v in enumerate(family.terms(0, SHOWN_TERMS)) if i != blank_index]
+    answers = solve_family(points, blank_index)
+    distinct = set(answers.values())
+    if not distinct:
+        return UNSOLVABLE, None
+    if len(distinct) > 1:
+        return AMBIGUOUS, answers
+    inferred = distinct.pop()
+    return (OK if inferred == family.term(blank_index) else WRONG_ANSWER), inferred
+
+
+# ----- 날씨 추론 -----
+def solve_weather(histories):
+    """
+    이력(n, 날 수)마다 이력과 맞는 모든 주기(1 ~ 날 수/2)를 찾아 다음 날 날씨를 구합니다.
+    (가장 짧은 주기의 예측, 맞는 주기가 있는지, 맞는 주기끼리 예측이 다른지)를 돌려줍니다.
+    """
+    histories = np.asarray(histories)
+    days = histories.shape[1]
+    periods = range(1, days // 2 + 1)
+    consistent = np.stack([(histories[:, p:] == histories[:, :-p]).all(axis=1) for p in periods], axis=1)
+    predictions = np.stack([histories[:, days - p] for p in periods], axis=1)
+    solvable = consistent.any(axis=1)
+    first = consistent.argmax(axis=1)
+    inferred = take(predictions, first)
+    ambiguous = (consistent & (predictions != inferred[:, None])).any(axis=1)
+    return inferred, solvable, ambiguous
+
+
+def weather_status(histories, answers):
+    inferred, solvable, ambiguous = solve_weather(histories)
+    status = np.full(len(answers), OK, dtype=np.uint8)
+    status[inferred != answers] = WRONG_ANSWER
+    status[ambiguous] = AMBIGUOUS
+    status[~solvable] = UNSOLVABLE
+    return status, inferred
+
+
+def check_weather_symbols():
+    """날씨 이모지와 RULES 표 자체의 오류 (중복 이모지, 겹친 이모지 변형 선택자, 범위 밖 날씨 코드)"""
+    problems = []
+    if len(set(weather.WEATHER_EMOJIS)) != len(weather.WEATHER_EMOJIS):
+        problems.append("WEATHER_EMOJIS has duplicate entries")
+    for emoji in weather.WEATHER_EMOJIS:
+        if '\ufe0f\ufe0f' in emoji:
+            problems.append(f"{emoji!r} has a doubled variation selector")
+    for name, (sequence, next_weather, _) in weather.RULES.items():
+        codes = (*sequence, next_weather)
+        if not all(isinstance(code, int) and 0 <= code < len(weather.WEATHER_EMOJIS) for code in codes):
+            problems.append(f"{name}: weather codes out of range {codes}")
+    return problems
+
+
+def rule_arrays():
+    """RULES 표의 (이력, 저장된 다음 날씨) 배열"""
+    names = list(weather.RULES)
+    days = np.arange(weather.HISTORY_LENGTH)
+    histories = np.array([np.asarray(weather.RULES[name][0])[days % len(weather.RULES[name][0])] for name in names])
+    answers = np.array([weather.RULES[name][1] for name in names])
+    return names, histories, answers
+
+
+# ----- 가격 추론 -----
+def item_features(text):
+    """예시 표의 '들어있는 것' 칸 글자를 간식 여부 벡터로 바꿉니다."""
+    return [name in text for name in ITEM_NAMES]
+
+
+def price_arrays(steps):
+    """generate_step_data 형식의 단계들을 (예시 특성, 예시 가격, 주문 특성, 정답) 배열로 바꿉니다."""
+    examples, prices, problems, answers = [], [], [], []
+    for step_examples, problem_size, problem_items, answer, _ in steps:
+        examples.append([[example['basket'], *item_features(example['item'])] for example in step_examples])
+        prices.append([example['price'] for example in step_examples])
+        problems.append([problem_size, *item_features(item_text(problem_items))])
+        answers.append(answer)
+    return (np.array(examples, dtype=np.float64), np.array(prices, dtype=np.float64),
+            np.array(problems, dtype=np.float64), np.array(answers, dtype=np.float64))
+
+
+def bank_price_arrays(bank):
+    """문제 은행의 가격 구역을 같은 배열로 바꿉니다. (단계를 하나씩 만들지 않습니다)"""
+    records = bank.price
+    bits = 1 << np.arange(len(ITEM_NAMES))
+    item_prices = np.array([price.ITEM_PRICE[name] for name in ITEM_NAMES], dtype=np.float64)
+    example_items = (records['example_items'][..., None] & bits) > 0
+    examples = np.concatenate([records['example_basket'][..., None], example_items], axis=-1).astype(np.float64)
+    prices = records['example_basket'] * price.BASKET_PRICE + example_items @ item_prices
+    problems = np.concatenate([records['problem_basket'][:, None], (records['problem_items'][:, None] & bits) > 0],
+                              axis=-1).astype(np.float64)
+    return examples, prices, problems, records['answer'].astype(np.float64)
+
+
+def price_status(examples, prices, problems, answers, tol=1e-6):
+    """
+    예시 표만으로 최소제곱 계수를 구해 주문 가격을 추론합니다.
+    예시끼리 모순되면 풀 수 없음, 주문이 예시들로 정해지지 않으면 애매함으로 봅니다.
+    """
+    x_pinv = np.linalg.pinv(examples)  # (n, 특성 수, 예시 수)
+    coefficients = np.einsum('nfe,ne->nf', x_pinv, prices)
+    fitted = np.einsum('nef,nf->ne', examples, coefficients)
+    projection = np.einsum('nfe,neg->nfg', x_pinv, examples)
+    residual = problems - np.einsum('nf,nfg->ng', problems, projection)
+    inferred = np.einsum('nf,nf->n', problems, coefficients)
+
+    status = np.full(len(answers), OK, dtype=np.uint8)
+    status[np.abs(inferred - answers) > 0.5] = WRONG_ANSWER
+    status[np.abs(residual).max(axis=1) > tol] = AMBIGUOUS
+    status[np.abs(fitted - prices).max(axis=1) > 0.5] = UNSOLVABLE
+    return status, inferred
+
+
+# ----- 보고서 -----
+def summarize(name, status, ids, inferred, stored):
+    counts = np.bincount(status, minlength=len(STATUS_NAMES))
+    bad = np.flatnonzero(status != OK)[:REPORT_EXAMPLES]
+    return {
+        'game': name,
+        'checked': int(len(status)),
+        'counts': {STATUS_NAMES[code]: int(count) for code, count in enumerate(counts) if count},
+        'examples': [{'id': str(ids[i]), 'status': STATUS_NAMES[status[i]],
+                      'inferred': str(inferred[i]), 'stored': str(stored[i])} for i in bad],
+    }
+
+
+def run(sequence_count, price_steps, seed=0):
+    sections = []
+
+    ids, fixed = fixed_sequence_arrays()
+    status, inferred = check_sequence_batch(fixed)
+    sections.append(summarize('number-pattern/fixed', status, ids, inferred, take(fixed['terms'], fixed['blank_index'])))
+
+    family_ids = list(number_pattern.FAMILY_SEQUENCES)
+    family_results = [check_family(number_pattern.FAMILY_SEQUENCES[q]) for q in family_ids]
+    family_answers = [number_pattern.correct_answer(number_pattern.FAMILY_SEQUENCES[q]) for q in family_ids]
+    sections.append(summarize('number-pattern/family', np.array([s for s, _ in family_results], dtype=np.uint8),
+                              family_ids, [answer for _, answer in family_results], family_answers))
+
+    pool = number_pattern.get_generated_sequences()
+    status, inferred = check_sequence_batch(pool)
+    sections.append(summarize('number-pattern/pool', status, [f"N{i}" for i in range(len(status))],
+                              inferred, take(np.asarray(pool['terms'], dtype=np.int64),
+                                             np.asarray(pool['blank_index'], dtype=np.int64))))
+
+    if sequence_count:
+        batch = generated_sequences(sequence_count, seed)
+        status, inferred = check_sequence_batch(batch)
+        section = summarize('number-pattern/generated', status, np.arange(len(status)), inferred,
+                            take(batch['terms'], batch['blank_index'].astype(np.int64)))
+        section['drawn'] = sequence_count  # 뽑은 수 (checked는 중복을 뺀 수)
+        sections.append(section)
+
+    index = weather.PATTERN_INDEX
+    status, inferred = weather_status(index['history'], index['next'])
+    sections.append(summarize('weather/patterns', status, [weather.pattern_name(i) for i in range(len(status))],
+                              inferred, index['next']))
+    names, histories, answers = rule_arrays()
+    status, inferred = weather_status(histories, answers)
+    sections.append(summarize('weather/rules', status, names, inferred, answers))
+
+    steps = [price.generate_step_data(step) for step in range(1, price_steps + 1)]
+    status, inferred = price_status(*price_arrays(steps))
+    sections.append(summarize('price/steps', status, np.arange(1, price_steps + 1), inferred,
+                              [step[3] for step in steps]))
+    from .problem_bank import get_bank
+    bank = get_bank()
+    if bank is not None:
+        arrays = bank_price_arrays(bank)
+        status, inferred = price_status(*arrays)
+        sections.append(summarize('price/bank', status, np.arange(1, len(status) + 1), inferred, arrays[3]))
+
+    return {'sections': sections, 'symbol_problems': check_weather_symbols()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="출제된 문제를 플레이어가 보는 정보만으로 풀어 보고 보고서를 만듭니다.")
+    parser.add_argument('--sequences', type=int, default=0,
+                        help='출제 묶음과 따로 시드(--seed)로 뽑아 검사할 숫자 문제 수 (중복은 빼고 한 번씩 검사)')
+    parser.add_argument('--price-steps', type=int, default=200, help='검사할 가격 단계 수 (1단계부터)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help='보고서를 JSON으로 쓸 파일')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    report = run(args.sequences, args.price_steps, args.seed)
+    report['seconds'] = round(time.perf_counter() - start, 3)
+
+    failures = sum(section['checked'] - section['counts'].get('ok', 0) for section in report['sections'])
+    failures += len(report['symbol_problems'])
+    for section in report['sections']:
+        counts = ', '.join(f"{name} {count:,}" for name, count in section['counts'].items())
+        drawn = f"  (distinct of {section['drawn']:,} drawn)" if 'drawn' in section else ''
+        print(f"{section['game']:<26}{section['checked']:>12,}  {counts}{drawn}")
+        for example in section['examples']:
+            print(f"    {example['status']:<14}{example['id']:<20} inferred {example['inferred']} stored {example['stored']}")
+    for problem in report['symbol_problems']:
+        print(f"weather/symbols            {problem}")
+    print(f"{failures:,} problem(s) in {report['seconds']:.2f}s")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,252 @@
+# 날씨 추론 게임 엔진 (Streamlit 없이 동작)
+# 날씨는 작은 정수(0=맑음, 1=비, 2=구름)로 다루고, 이모지는 화면에 그릴 때만 바꿉니다.
+import time
+from itertools import product
+
+import numpy as np
+
+from .forecast import add_noise, forecast, periodic_history
+from .problem_bank import get_bank
+from .rng import SessionRandom
+from .scheduler import QuestionOrder
+
+# 전역 상수 설정
+SUN, RAIN, CLOUD = 0, 1, 2
+WEATHER_EMOJIS = ['☀️', '🌧️', '☁️']
+WEATHER_NAMES = ['맑음', '비', '구름']
+HISTORY_LENGTH = 6  # 과거 6일
+MAX_PERIOD = HISTORY_LENGTH // 2  # 패턴이 이력에 두 번 이상 나와야 규칙을 찾을 수 있습니다.
+TARGET_SCORE = 3
+# 잡음 모드: 더 긴 이력을 보여주고, 날마다 NOISE 확률로 규칙과 다른 날씨가 섞입니다.
+NOISY_HISTORY_LENGTH = 24  # HISTORY_LENGTH의 배수라서 규칙대로의 내일 날씨는 보통 모드와 같습니다.
+NOISE = 0.15
+NOISY_TOLERANCE = 0.4  # 예측기가 주기를 찾을 때 허용하는 어긋남 비율
+
+# 6가지 명확한 시퀀스 규칙 정의 (이름과 설명이 붙은 패턴)
+# 키(Key): 패턴 이름, 값(Value): [시퀀스, 다음 예측 날씨, 규칙 설명]
+RULES = {
+    "R1_비비맑음반복": [(RAIN, RAIN, SUN), RAIN, "비(2회) - 맑음(1회) 패턴이 반복됩니다."],
+    "R2_구비맑음반복": [(CLOUD, RAIN, SUN), CLOUD, "구름 - 비 - 맑음 패턴이 반복됩니다."],
+    "R3_맑구름반복": [(SUN, CLOUD), SUN, "맑음 - 구름 패턴이 반복됩니다."],
+    "R4_비구름반복": [(RAIN, CLOUD, CLOUD), RAIN, "비(1회) - 구름(2회) 패턴이 반복됩니다."],
+    "R5_역순구름": [(CLOUD, SUN, RAIN), CLOUD, "구름 - 맑음 - 비의 역순 패턴이 반복됩니다."],
+    "R6_비맑음맑음": [(RAIN, SUN, SUN), RAIN, "비(1회) - 맑음(2회) 패턴이 반복됩니다."],
+}
+
+
+def build_pattern_index(history_length=HISTORY_LENGTH, max_period=MAX_PERIOD, num_weathers=len(WEATHER_EMOJIS)):
+    """
+    주기가 2 ~ max_period인 모든 반복 패턴을 미리 계산해 배열 하나로 묶습니다.
+    더 짧은 주기로 다시 쪼개지는 패턴(예: 맑음-맑음)은 빼고, 패턴마다
+    과거 이력(history), 다음 날 날씨(next), 주기(period), 한 주기 분량(word)을 저장합니다.
+    """
+    histories, nexts, periods, words = [], [], [], []
+    days = np.arange(history_length)
+    for period in range(2, max_period + 1):
+        word = np.array(list(product(range(num_weathers), repeat=period)), dtype=np.uint8)
+        # 주기의 약수만큼 돌려도 같은 패턴이면 더 짧은 주기를 가진 패턴입니다.
+        primitive = np.ones(len(word), dtype=bool)
+        for shift in range(1, period):
+            if period % shift == 0:
+                primitive &= ~(word == np.roll(word, shift, axis=1)).all(axis=1)
+        word = word[primitive]
+        histories.append(word[:, days % period])
+        nexts.append(word[:, history_length % period])
+        periods.append(np.full(len(word), period, dtype=np.uint8))
+        padded = np.full((len(word), max_period), 255, dtype=np.uint8)
+        padded[:, :period] = word
+        words.append(padded)
+    return {
+        'history': np.concatenate(histories),
+        'next': np.concatenate(nexts),
+        'period': np.concatenate(periods),
+        'word': np.concatenate(words),
+    }
+
+
+def weather_bank():
+    """이력 길이가 이 게임과 같은 문제 은행(GAME_PROBLEM_BANK). 없으면 None"""
+    bank = get_bank()
+    if bank is not None and bank.weather['history'].shape[1] == HISTORY_LENGTH:
+        return bank
+    return None
+
+
+def load_pattern_index():
+    """문제 은행이 있으면 거기서 읽고, 없으면 직접 계산합니다."""
+    bank = weather_bank()
+    return bank.weather_index() if bank is not None else build_pattern_index()
+
+
+PATTERN_INDEX = load_pattern_index()
+PATTERN_COUNT = len(PATTERN_INDEX['next'])
+NEXT_WEATHER = PATTERN_INDEX['next'].tolist()  # 채점할 때 NumPy 스칼라를 거치지 않도록 리스트로 둡니다.
+
+
+def find_pattern(sequence):
+    """한 주기 분량의 날씨 코드로 패턴 번호를 찾습니다."""
+    padded = np.full(MAX_PERIOD, 255, dtype=np.uint8)
+    padded[:len(sequence)] = sequence
+    return int(np.flatnonzero((PATTERN_INDEX['word'] == padded).all(axis=1))[0])
+
+
+# 이름이 붙은 규칙 ↔ 패턴 번호
+RULE_PATTERN_IDS = {name: find_pattern(sequence) for name, (sequence, _, _) in RULES.items()}
+PATTERN_RULE_NAMES = {pattern_id: name for name, pattern_id in RULE_PATTERN_IDS.items()}
+
+
+def make_pattern_name(pattern_id):
+    """RULES에 있는 패턴은 규칙 이름을, 나머지는 'P<주기>_<코드>' 이름을 돌려줍니다."""
+    if pattern_id in PATTERN_RULE_NAMES:
+        return PATTERN_RULE_NAMES[pattern_id]
+    period = int(PATTERN_INDEX['period'][pattern_id])
+    return f"P{period}_" + ''.join(map(str, PATTERN_INDEX['word'][pattern_id, :period].tolist()))
+
+
+def make_pattern_description(pattern_id):
+    """규칙 설명. RULES에 없는 패턴은 '비(2회) - 맑음(1회)' 같은 말투로 만들어 줍니다."""
+    if pattern_id in PATTERN_RULE_NAMES:
+        return RULES[PATTERN_RULE_NAMES[pattern_id]][2]
+    period = int(PATTERN_INDEX['period'][pattern_id])
+    runs = []
+    for code in PATTERN_INDEX['word'][pattern_id, :period].tolist():
+        if runs and runs[-1][0] == code:
+            runs[-1][1] += 1
+        else:
+            runs.append([code, 1])
+    if all(count == 1 for _, count in runs):
+        parts = [WEATHER_NAMES[code] for code, _ in runs]
+    else:
+        parts = [f"{WEATHER_NAMES[code]}({count}회)" for code, count in runs]
+    return " - ".join(parts) + " 패턴이 반복됩니다."
+
+
+def load_pattern_strings():
+    """패턴마다 (이름 목록, 설명 목록). 문제 은행이 있으면 은행의 문자열 표에서 읽습니다."""
+    bank = weather_bank()
+    if bank is not None:
+        return bank.weather_strings()
+    return ([make_pattern_name(i) for i in range(PATTERN_COUNT)],
+            [make_pattern_description(i) for i in range(PATTERN_COUNT)])
+
+
+PATTERN_NAMES, PATTERN_DESCRIPTIONS = load_pattern_strings()
+PATTERN_IDS = {name: pattern_id for pattern_id, name in enumerate(PATTERN_NAMES)}
+
+
+def pattern_name(pattern_id):
+    return PATTERN_NAMES[pattern_id]
+
+
+def pattern_description(pattern_id):
+    return PATTERN_DESCRIPTIONS[pattern_id]
+
+
+def build_weather_history(pattern_id):
+    """패턴 번호로 과거 이력과 정답(내일 날씨)을 이모지로 바꿉니다. (화면에 그릴 때만 사용)"""
+    history = [WEATHER_EMOJIS[code] for code in PATTERN_INDEX['history'][pattern_id].tolist()]
+    return history, WEATHER_EMOJIS[NEXT_WEATHER[pattern_id]]
+
+
+def long_history(pattern_id, length, noise=0.0, rng=None):
+    """
+    패턴을 length일 동안 반복한 이력(날씨 코드 배열)과 규칙대로라면 올 다음 날 날씨.
+    noise > 0이면 날마다 그 확률로 다른 날씨가 섞입니다. (잡음 모드, rng는 np.random.Generator)
+    """
+    period = int(PATTERN_INDEX['period'][pattern_id])
+    history, next_weather = periodic_history(PATTERN_INDEX['word'][pattern_id, :period], length)
+    if noise:
+        history = add_noise(history, noise, rng if rng is not None else np.random.default_rng())
+    return history, next_weather
+
+
+class WeatherState:
+    """날씨 추론 게임의 세션 상태"""
+
+    __slots__ = ('game_state', 'score', 'target_score', 'pattern_id',
+                 'user_guess', 'is_correct', 'input_key', 'shown_at', 'rng', 'order', 'noisy')
+
+    def __init__(self, target_score: int = TARGET_SCORE, seed: int | None = None, noisy: bool = False):
+        self.game_state: str = 'init'
+        self.score: int = 0
+        self.target_score: int = target_score
+        self.pattern_id: int | None = None  # 현재(=직전) 문제의 PATTERN_INDEX 번호
+        self.user_guess: int = 0  # 날씨 코드
+        self.is_correct: bool = False
+        self.input_key: int = 0
+        self.shown_at: float = 0.0  # 문제를 낸 시각 (time.monotonic)
+        self.rng: SessionRandom = SessionRandom(seed)  # 이 세션만 쓰는 난수열
+        # 모든 패턴을 한 번씩 낸 뒤에 다시 섞어서 이어 가는 문제 순서 (세션 시드가 키)
+        self.order: QuestionOrder = QuestionOrder(self.rng.seed)
+        self.noisy: bool = noisy  # 잡음 모드
+
+
+def question_history(state):
+    """
+    지금 문제의 과거 이력(날씨 코드 배열)과 규칙대로라면 올 내일 날씨.
+    잡음 모드의 잡음은 (세션 시드, 문제 순서)로 정해지므로 다시 그려도 같은 이력이 나옵니다.
+    """
+    if not state.noisy:
+        return PATTERN_INDEX['history'][state.pattern_id], NEXT_WEATHER[state.pattern_id]
+    rng = np.random.default_rng([state.rng.seed, state.order.cursor])
+    return long_history(state.pattern_id, NOISY_HISTORY_LENGTH, NOISE, rng)
+
+
+def get_forecast_and_rule(state):
+    """
+    지금 문제의 (정답 날씨 코드, 날씨별 예측 확률 배열, 예측기가 찾은 주기, 규칙 설명)을 돌려줍니다.
+    확률은 engine.forecast가 과거 이력만 보고 계산합니다. (6일뿐이면 정답에도 100%를 주지 않습니다)
+    """
+    history, next_weather = question_history(state)
+    probabilities, period = forecast(history, tolerance=NOISY_TOLERANCE if state.noisy else 0.0)
+    return next_weather, probabilities, period, pattern_description(state.pattern_id)
+
+
+def start_new_question(state):
+    """새로운 문제 생성 및 상태 저장을 위한 헬퍼 함수"""
+
+    # 세션의 문제 순서에서 다음 패턴을 고르고, 패턴 번호만 저장합니다.
+    # 한 바퀴 안에서는 겹치지 않고, 바퀴가 바뀔 때도 직전 패턴은 건너뜁니다.
+    pattern_id = state.order.next(PATTERN_COUNT, cycle=True)
+    if pattern_id == state.pattern_id:
+        pattern_id = state.order.next(PATTERN_COUNT, cycle=True)
+    state.pattern_id = pattern_id
+
+    state.game_state = 'playing'
+    state.input_key += 1
+    state.shown_at = time.monotonic()
+
+
+def submit_answer(state, user_guess):
+    """
+    날씨 코드로 받은 답을 채점하고 다음 상태('finished' 또는 'victory')로 넘깁니다.
+    정답 여부를 돌려줍니다.
+    """
+
+    state.user_guess = user_guess
+
+    # 3. 피드백 및 결과 확인 (잡음 모드에서도 정답은 잡음이 없는 규칙대로의 날씨입니다)
+    if state.noisy:
+        correct_weather = question_history(state)[1]
+    else:
+        correct_weather = NEXT_WEATHER[state.pattern_id]
+    state.is_correct = (user_guess == correct_weather)
+    if state.is_correct:
+        state.score += 1
+
+    # 승리 조건 체크
+    if state.score >= state.target_score:
+        state.game_state = 'victory'
+    else:
+        state.game_state = 'finished'
+    return state.is_correct
+
+
+def replay_questions(seed, count):
+    """시드로 세션의 패턴 순서를 처음부터 다시 만듭니다. (답과 상관없이 같은 순서로 나옵니다)"""
+    state = WeatherState(seed=seed)
+    pattern_ids = []
+    for _ in range(count):
+        start_new_question(state)
+        pattern_ids.append(state.pattern_id)
+    return pattern_ids
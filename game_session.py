@@ -0,0 +1,58 @@
+import uuid
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# 세 게임 화면이 함께 쓰는 세션 도우미
+# 게임 상태 객체는 st.session_state[키] 하나에 두고, GAME_SESSION_STORE가 있으면
+# 주소의 ?sid= 세션 번호로 외부 저장소에서 읽어 오고 실행이 끝날 때 다시 저장합니다.
+from engine.session_store import get_session_store
+
+SESSION_STORE = get_session_store()  # GAME_SESSION_STORE가 없으면 st.session_state에만 둡니다.
+SID_KEY = 'game_session_sid'
+
+
+def session_key():
+    """
+    워커가 바뀌거나 다시 시작해도 이어지는 세션 번호 (주소의 ?sid=)
+    페이지를 옮기면 주소의 쿼리가 지워지므로 st.session_state에도 두고 다시 붙입니다.
+    (페이지마다 새 번호를 만들면 저장소에 버려진 세션이 쌓입니다)
+    """
+    sid = st.query_params.get('sid') or st.session_state.get(SID_KEY) or uuid.uuid4().hex
+    st.session_state[SID_KEY] = sid
+    if st.query_params.get('sid') != sid:
+        st.query_params['sid'] = sid
+    return sid
+
+
+def session_id():
+    """계측용 세션 구분자 (Streamlit 밖에서 실행되면 None)"""
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else None
+
+
+def requested_seed():
+    """주소의 ?seed= 값. 0 이상의 정수가 아니면 경고를 보여주고 새 게임 번호(None)로 시작합니다."""
+    from engine.rng import parse_seed  # engine.rng는 NumPy를 불러오므로 시드를 쓰는 게임에서만 불러옵니다.
+    value = st.query_params.get('seed')
+    seed = parse_seed(value)
+    if value is not None and seed is None:
+        st.warning(f"'?seed={value}' 는 올바른 게임 번호가 아니어서 새 게임으로 시작합니다. (0 이상의 정수)")
+    return seed
+
+
+def get_session_state(key, new_state):
+    """
+    key에 둔 세션 상태 객체를 가져옵니다.
+    없으면 세션 저장소에서 읽고, 저장소에도 없으면 new_state()로 새로 만듭니다.
+    """
+    if key not in st.session_state:
+        state = SESSION_STORE.load(session_key(), key) if SESSION_STORE.enabled else None
+        st.session_state[key] = state or new_state()
+    return st.session_state[key]
+
+
+def save_state(key):
+    """외부 저장소가 있으면 이번 실행이 끝난 상태를 저장해서 다른 워커에서도 이어 가게 합니다."""
+    if SESSION_STORE.enabled and key in st.session_state:
+        SESSION_STORE.save(session_key(), key, st.session_state[key])
@@ -0,0 +1,176 @@
+"""
+여러 Streamlit 워커를 띄우고 앞에 세션 고정(sticky) 프록시를 두는 실행기
+
+한 프로세스는 CPU 코어 하나만 쓰므로 워커를 코어 수만큼 띄우고, 프록시가 같은 브라우저를
+항상 같은 워커로 보냅니다. (Streamlit은 웹소켓 연결 하나에 세션을 묶어 두기 때문)
+접속자 주소가 아니라 쿠키(WORKER_COOKIE)로 워커를 정하므로 학교 NAT 뒤의 한 반 전체가
+같은 주소로 들어와도 워커마다 고르게 나뉩니다. 쿠키가 없는 첫 요청은 연결이 가장 적은 워커로 보내고
+응답에 쿠키를 붙입니다.
+게임 상태는 GAME_SESSION_STORE(기본 SQLite)에 저장되므로 워커가 죽어서 다시 뜨거나
+다른 워커로 옮겨 가도 주소의 ?sid= 로 이어서 풀 수 있습니다.
+
+    python launch.py --workers 4 --port 8501
+"""
+import argparse
+import asyncio
+import os
+import re
+import secrets
+import subprocess
+import sys
+import time
+
+BUFFER_SIZE = 64 * 1024
+MAX_HEADER_SIZE = 64 * 1024  # 요청/응답 머리(헤더)를 이만큼까지만 읽습니다.
+RESTART_INTERVAL = 1.0  # 워커가 살아 있는지 확인하는 간격 (초)
+WORKER_COOKIE = 'game_worker'
+WORKER_COOKIE_PATTERN = re.compile(rb'^cookie:.*\b' + WORKER_COOKIE.encode() + rb'=(\d+)', re.IGNORECASE | re.MULTILINE)
+
+
+class Worker:
+    """Streamlit 워커 프로세스 하나"""
+
+    def __init__(self, port, args, env):
+        self.port = port
+        self.args = args
+        self.env = env
+        self.process = None
+        self.restarts = 0
+        self.connections = 0  # 지금 프록시를 거쳐 열려 있는 연결 수
+
+    def start(self):
+        command = [
+            sys.executable, '-m', 'streamlit', 'run', self.args.script,
+            '--server.port', str(self.port),
+            '--server.address', '127.0.0.1',
+            '--server.headless', 'true',
+        ]
+        self.process = subprocess.Popen(command, env=self.env)
+
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+
+def cookie_worker(head):
+    """요청 머리의 Cookie에 적힌 워커 번호 (없으면 None)"""
+    match = WORKER_COOKIE_PATTERN.search(head)
+    return int(match.group(1)) if match else None
+
+
+def pick_workers(workers, preferred=None):
+    """
+    연결을 시도할 워커 순서. 쿠키에 적힌 워커가 있으면 그 워커부터,
+    없으면 지금 연결이 가장 적은 워커부터 시도합니다. (앞의 워커에 연결할 수 없으면 다음 워커로)
+    """
+    if preferred is None or not 0 <= preferred < len(workers):
+        preferred = min(range(len(workers)), key=lambda i: workers[i].connections)
+    return workers[preferred:] + workers[:preferred]
+
+
+async def read_head(reader):
+    """HTTP 요청/응답의 머리(빈 줄까지)를 읽습니다. 연결이 먼저 끊기면 읽은 만큼만 돌려줍니다."""
+    try:
+        return await reader.readuntil(b'\r\n\r\n')
+    except asyncio.IncompleteReadError as error:
+        return error.partial
+    except asyncio.LimitOverrunError:
+        return await reader.read(MAX_HEADER_SIZE)
+
+
+def with_worker_cookie(head, index):
+    """응답 머리의 상태 줄 다음에 워커 쿠키를 넣습니다."""
+    status_line, _, rest = head.partition(b'\r\n')
+    cookie = f"Set-Cookie: {WORKER_COOKIE}={index}; Path=/; HttpOnly; SameSite=Lax\r\n".encode()
+    return status_line + b'\r\n' + cookie + rest
+
+
+async def pipe(reader, writer):
+    try:
+        while data := await reader.read(BUFFER_SIZE):
+            writer.write(data)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def handle(client_reader, client_writer, workers):
+    head = await read_head(client_reader)
+    if not head:
+        client_writer.close()
+        return
+    preferred = cookie_worker(head)
+    for worker in pick_workers(workers, preferred):
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection('127.0.0.1', worker.port)
+            break
+        except OSError:
+            continue
+    else:
+        client_writer.close()
+        return
+    index = workers.index(worker)
+    worker.connections += 1
+    try:
+        upstream_writer.write(head)
+        if index != preferred:
+            # 처음 온 브라우저이거나 쿠키의 워커가 죽었으면 이번 워커를 쿠키로 알려 줍니다.
+            response = await read_head(upstream_reader)
+            client_writer.write(with_worker_cookie(response, index) if response.startswith(b'HTTP/') else response)
+        await asyncio.gather(pipe(client_reader, upstream_writer), pipe(upstream_reader, client_writer))
+    finally:
+        worker.connections -= 1
+
+
+async def supervise(workers):
+    """죽은 워커를 다시 띄웁니다. (세션은 저장소에 남아 있으므로 접속자는 이어서 풉니다)"""
+    while True:
+        await asyncio.sleep(RESTART_INTERVAL)
+        for worker in workers:
+            if not worker.alive():
+                worker.restarts += 1
+                print(f"worker :{worker.port} exited, restarting ({worker.restarts})", flush=True)
+                worker.start()
+
+
+async def serve(args, workers):
+    server = await asyncio.start_server(lambda r, w: handle(r, w, workers), args.host, args.port)
+    ports = ', '.join(str(worker.port) for worker in workers)
+    print(f"proxy http://{args.host}:{args.port} -> workers {ports}", flush=True)
+    async with server:
+        await asyncio.gather(server.serve_forever(), supervise(workers))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8501, help='프록시 포트 (워커는 그다음 포트부터 씁니다)')
+    parser.add_argument('--script', default='app.py')
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env.setdefault('GAME_SESSION_STORE', 'sqlite:///sessions.db')
+    # 워커를 옮겨 가도 쿠키(XSRF 토큰)가 통하도록 모든 워커가 같은 비밀 값을 씁니다.
+    env.setdefault('STREAMLIT_SERVER_COOKIE_SECRET', secrets.token_hex(16))
+    # GAME_WORKER: 워커 번호 (계측 파일과 레이블을 워커마다 나눕니다)
+    workers = [Worker(args.port + 1 + i, args, dict(env, GAME_WORKER=str(i))) for i in range(args.workers)]
+    for worker in workers:
+        worker.start()
+    try:
+        asyncio.run(serve(args, workers))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for worker in workers:
+            if worker.alive():
+                worker.process.terminate()
+        deadline = time.monotonic() + 5
+        for worker in workers:
+            if worker.process is not None:
+                worker.process.wait(max(deadline - time.monotonic(), 0.1))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,179 +1,243 @@
-import streamlit as st
-import pandas as pd
-import random
-
-# ----- 기본 설정 -----
-TARGET_SCORE = 3
-BASKET_PRICE = 100  # 바구니 크기 1당 100원
-ITEM_PRICE = {
-    '🍬 사탕': 10,
-    '🍫 초콜릿': 5
-}
-
-# ----- 가격 계산 -----
-def calculate_price(size, items=None):
-    """바구니 크기와 과자 종류로 가격 계산"""
-    price = size * BASKET_PRICE
-    if items:
-        if isinstance(items, str):
-            price += ITEM_PRICE.get(items, 0)
-        elif isinstance(items, list):
-            for i in items:
-                price += ITEM_PRICE.get(i, 0)
-    return price
-
-# ----- 단계별 문제 생성 -----
-def generate_step_data(step):
-    examples = []
-
-    if step == 1:
-        # 바구니 크기만 다름
-        sizes = [2, 4, 6]
-        for s in sizes:
-            examples.append({'basket': s, 'item': '❌ 없음', 'price': calculate_price(s)})
-        problem_size = 5
-        problem_items = None
-        answer = calculate_price(problem_size)
-        hint = "바구니가 클수록 가격이 커져요! 바구니 1칸은 100원이에요."
-
-    elif step == 2:
-        # 같은 크기, 다른 간식
-        examples.append({'basket': 5, 'item': '❌ 없음', 'price': calculate_price(5)})
-        examples.append({'basket': 5, 'item': '🍬 사탕', 'price': calculate_price(5, '🍬 사탕')})
-        examples.append({'basket': 5, 'item': '🍫 초콜릿', 'price': calculate_price(5, '🍫 초콜릿')})
-        problem_size = 4
-        problem_items = '🍬 사탕'
-        answer = calculate_price(problem_size, problem_items)
-        hint = "같은 바구니라도, 사탕이나 초콜릿이 들어가면 조금 더 비싸져요!"
-
-    elif step == 3:
-        # 크기와 간식이 모두 다름
-        examples.append({'basket': 3, 'item': '🍬 사탕', 'price': calculate_price(3, '🍬 사탕')})
-        examples.append({'basket': 4, 'item': '🍫 초콜릿', 'price': calculate_price(4, '🍫 초콜릿')})
-        examples.append({'basket': 2, 'item': '🍬 사탕 + 🍫 초콜릿', 'price': calculate_price(2, ['🍬 사탕', '🍫 초콜릿'])})
-        problem_size = 5
-        problem_items = ['🍬 사탕', '🍫 초콜릿']
-        answer = calculate_price(problem_size, problem_items)
-        hint = "이제 큰 바구니에 사탕과 초콜릿을 모두 넣어요. 두 개 다 더해보세요!"
-
-    else:
-        return [], 0, None, 0, "단계 오류"
-
-    return examples, problem_size, problem_items, answer, hint
-
-# ----- 문제 새로 만들기 -----
-def start_new_question():
-    step = st.session_state.get('step', 1)
-    examples, size, items, answer, hint = generate_step_data(step)
-    st.session_state.examples = examples
-    st.session_state.problem_size = size
-    st.session_state.problem_items = items
-    st.session_state.correct_answer = answer
-    st.session_state.step_hint = hint
-    st.session_state.game_state = 'playing'
-    st.session_state.input_key = random.random()
-
-# ----- 메인 게임 -----
-def basket_game():
-    st.set_page_config(layout="centered")
-
-    # 제목
-    st.title("💰 가격 추론 훈련 AI (회귀 분석)")
-    st.markdown("#### 바구니 크기와 간식을 보고 가격의 규칙을 찾아보세요!")
-    st.markdown(f"##### 총 {TARGET_SCORE}단계를 모두 맞히면 승리합니다!")
-    st.markdown("---")
-
-    # 초기화
-    if 'game_state' not in st.session_state:
-        st.session_state.step = 1
-        st.session_state.score = 0
-        st.session_state.game_state = 'init'
-        start_new_question()
-
-    # 승리 화면
-    if st.session_state.game_state == 'victory':
-        st.balloons()
-        st.success("🎉 모든 단계를 완성했어요!")
-        st.header("정답 요약 💡")
-        st.markdown("""
-        - 바구니 1칸은 **100원**  
-        - 🍬 사탕은 **10원 추가**  
-        - 🍫 초콜릿은 **5원 추가**
-        """)
-        st.markdown("내가 추론 능력을 기를 수 있도록 도와줘서 고마워 !👑")
-
-        # ----- 추가된 힌트 문장 팝업 -----
-        st.warning("""
-        **💡 힌트 문장: 지붕이 검은색이다.
-        """)
-        st.markdown("(이 문장을 메모장에 기록해두세요!)")
-
-        if st.button("🔄 다시 하기"):
-            for k in list(st.session_state.keys()):
-                del st.session_state[k]
-            st.rerun()
-        return
-
-    # 예시 표
-    st.subheader(f"🧩 Step {st.session_state.step} / {TARGET_SCORE}")
-    df = pd.DataFrame([{
-        "예시": f"예시 {i+1}",
-        "바구니 크기": ex['basket'],
-        "들어있는 것": ex['item'],
-        "가격": f"{ex['price']}원"
-    } for i, ex in enumerate(st.session_state.examples)])
-    st.dataframe(df, hide_index=True)
-    st.markdown(f"**힌트:** {st.session_state.step_hint}")
-    st.markdown("---")
-
-    # 문제 구간
-    if st.session_state.game_state == 'playing':
-        st.header("📦 이번 손님 주문!")
-        if st.session_state.problem_items is None:
-            item_text = "❌ 없음"
-        elif isinstance(st.session_state.problem_items, list):
-            item_text = " + ".join(st.session_state.problem_items)
-        else:
-            item_text = st.session_state.problem_items
-
-        st.info(f"바구니 크기: {st.session_state.problem_size}")
-        st.info(f"들어있는 것: {item_text}")
-        guess = st.number_input("💰 이 바구니의 가격은 얼마일까요? (원)", min_value=0, step=5, key=st.session_state.input_key)
-
-        if st.button("🚀 정답 제출"):
-            st.session_state.user_guess = guess
-            st.session_state.game_state = 'checking'
-            st.rerun()
-
-    # 정답 확인
-    if st.session_state.game_state == 'checking':
-        guess = st.session_state.user_guess
-        correct = guess == st.session_state.correct_answer
-        answer = st.session_state.correct_answer
-
-        if correct:
-            st.success(f"정답이에요! ✅ 가격은 {answer}원이었어요!")
-            st.session_state.score += 1
-            st.session_state.step += 1
-        else:
-            st.error(f"아쉬워요 😢 정답은 {answer}원이었어요.")
-        st.session_state.game_state = 'finished'
-
-    # 다음 단계
-    if st.session_state.game_state == 'finished':
-        if st.session_state.score >= TARGET_SCORE:
-            st.session_state.game_state = 'victory'
-            st.rerun()
-        else:
-            if st.button("다음 손님 계산하기"):
-                start_new_question()
-                st.rerun()
-
-    # 현재 점수
-    st.markdown("---")
-    st.info(f"현재 계산한 손님 수: {st.session_state.score} / {TARGET_SCORE}")
-
-# 실행
-if __name__ == "__main__":
-    basket_game()
-
+import os
+
+import streamlit as st
+
+# 문제 생성/채점/상태 전이는 engine 패키지가 맡고, 이 파일은 화면만 그립니다.
+from engine.price import (
+    TARGET_SCORE, PriceState, generate_step_data, start_new_question, submit_answer,
+)
+from engine.answer_log import get_answer_log
+from engine.metrics import RENDER_PHASES, get_metrics
+from engine.render_cache import RENDER_CACHE
+from game_session import get_session_state, save_state, session_id
+
+GAME = 'price'
+STATE_KEY = 'price_state'
+TRAINING_KEY = 'price_training_state'
+
+# 계측: GAME_METRICS_PATH가 없으면 아무 일도 하지 않고 엔진 함수도 그대로 씁니다.
+METRICS = get_metrics()
+start_new_question = METRICS.wrap(GAME, 'start_new_question', start_new_question)
+submit_answer = METRICS.wrap(GAME, 'grading', submit_answer)
+ANSWER_LOG = get_answer_log()  # GAME_ANSWER_LOG가 없으면 기록하지 않습니다.
+
+# 빠른 시작 모드: 예시 표를 단계마다 한 번만 마크다운 표로 만들어 두고 pandas 없이 그립니다.
+# PRICE_FAST_START=0 이면 예전처럼 pandas DataFrame + st.dataframe으로 그립니다.
+FAST_START = os.environ.get('PRICE_FAST_START', '1') != '0'
+EXAMPLE_COLUMNS = ("예시", "바구니 크기", "들어있는 것", "가격")
+
+# ----- 예시 표 -----
+def example_rows(examples):
+    return [(f"예시 {i+1}", ex['basket'], ex['item'], f"{ex['price']}원") for i, ex in enumerate(examples)]
+
+@st.cache_resource(show_spinner=False)
+def example_table_markdown(step):
+    """단계별 예시 표를 마크다운 문자열로 서버 전체에서 한 번만 만들어 둡니다."""
+    examples = generate_step_data(step)[0]
+    lines = ["| " + " | ".join(EXAMPLE_COLUMNS) + " |", "|" + " --- |" * len(EXAMPLE_COLUMNS)]
+    lines += ["| " + " | ".join(map(str, row)) + " |" for row in example_rows(examples)]
+    return "\n".join(lines)
+
+def show_example_table(step, examples):
+    if FAST_START:
+        st.markdown(example_table_markdown(step))
+    else:
+        import pandas as pd  # 필요할 때만 불러옵니다.
+        df = pd.DataFrame(example_rows(examples), columns=EXAMPLE_COLUMNS)
+        st.dataframe(df, hide_index=True)
+
+# ----- 세션 상태 -----
+def get_state():
+    """이 게임의 세션 상태 객체를 가져옵니다. (없으면 세션 저장소에서 읽거나 새로 만듭니다)"""
+    return get_session_state(STATE_KEY, PriceState)
+
+def guess_key(state):
+    """문제마다 새로 만들어지는 입력 위젯의 키"""
+    return f"price_guess_{state.input_key}"
+
+# ----- 버튼 콜백 -----
+def on_submit(state):
+    """채점과 승리 판정을 스크립트 실행 전에 끝내서 st.rerun()이 필요 없게 합니다."""
+    guess = st.session_state[guess_key(state)]
+    is_correct = submit_answer(state, guess)
+    ANSWER_LOG.record(GAME, state.step, guess, is_correct, state.shown_at)
+
+def on_reset():
+    st.session_state[STATE_KEY] = PriceState()
+
+# ----- 화면 문구 (단계와 정답 여부마다 한 번만 만들어 세션끼리 공유합니다) -----
+def order_markup(step):
+    _, problem_size, problem_items, _, _ = generate_step_data(step)
+    if problem_items is None:
+        item_text = "❌ 없음"
+    elif isinstance(problem_items, list):
+        item_text = " + ".join(problem_items)
+    else:
+        item_text = problem_items
+    return f"바구니 크기: {problem_size}", f"들어있는 것: {item_text}"
+
+def feedback_markup(step, is_correct):
+    correct_answer = generate_step_data(step)[3]
+    if is_correct:
+        return f"정답이에요! ✅ 가격은 {correct_answer}원이었어요!"
+    return f"아쉬워요 😢 정답은 {correct_answer}원이었어요."
+
+# ----- 메인 게임 -----
+def basket_game():
+    st.set_page_config(layout="centered")
+
+    # 제목
+    st.title("💰 가격 추론 훈련 AI (회귀 분석)")
+    st.markdown("#### 바구니 크기와 간식을 보고 가격의 규칙을 찾아보세요!")
+    st.markdown(f"##### 총 {TARGET_SCORE}단계를 모두 맞히면 승리합니다!")
+    mode = st.radio("모드", ["🎮 게임", "🧠 AI 훈련"], horizontal=True, label_visibility="collapsed")
+    st.markdown("---")
+
+    if mode == "🎮 게임":
+        game_area()
+    else:
+        training_area()
+
+# ----- 문제/정답 영역 -----
+@st.fragment
+def game_area():
+    """버튼은 모두 콜백으로 상태를 바꾸므로 한 번의 실행으로 채점 결과까지 그리고, 이 영역만 다시 실행됩니다."""
+    METRICS.count_run(GAME, session_id())
+
+    # 초기화
+    with METRICS.phase(GAME, 'init'):
+        state = get_state()
+        if state.game_state == 'init':
+            start_new_question(state)
+
+    with METRICS.phase(GAME, RENDER_PHASES[state.game_state]):
+        draw_game(state)
+
+    save_state(STATE_KEY)
+
+def draw_game(state):
+    """현재 게임 상태에 맞는 화면을 그립니다."""
+
+    # 승리 화면
+    if state.game_state == 'victory':
+        st.balloons()
+        st.success("🎉 모든 단계를 완성했어요!")
+        st.header("정답 요약 💡")
+        st.markdown("""
+        - 바구니 1칸은 **100원**  
+        - 🍬 사탕은 **10원 추가**  
+        - 🍫 초콜릿은 **5원 추가**
+        """)
+        st.markdown("내가 추론 능력을 기를 수 있도록 도와줘서 고마워 !👑")
+
+        # ----- 추가된 힌트 문장 팝업 -----
+        st.warning("""
+        **💡 힌트 문장: 지붕이 검은색이다.
+        """)
+        st.markdown("(이 문장을 메모장에 기록해두세요!)")
+
+        st.button("🔄 다시 하기", on_click=on_reset)
+        return
+
+    # 예시 표
+    examples, _, _, _, step_hint = generate_step_data(state.step)
+    st.subheader(f"🧩 Step {state.step} / {TARGET_SCORE}")
+    show_example_table(state.step, examples)
+    st.markdown(f"**힌트:** {step_hint}")
+    st.markdown("---")
+
+    # 문제 구간
+    if state.game_state == 'playing':
+        st.header("📦 이번 손님 주문!")
+        size_text, item_text = RENDER_CACHE.get(('price', 'question', state.step), order_markup, state.step)
+        st.info(size_text)
+        st.info(item_text)
+        st.number_input("💰 이 바구니의 가격은 얼마일까요? (원)", min_value=0, step=5, key=guess_key(state))
+
+        st.button("🚀 정답 제출", on_click=on_submit, args=(state,))
+
+    # 정답 확인 및 다음 단계
+    if state.game_state == 'finished':
+        feedback_text = RENDER_CACHE.get(('price', 'feedback', state.step, state.is_correct),
+                                         feedback_markup, state.step, state.is_correct)
+        if state.is_correct:
+            st.success(feedback_text)
+        else:
+            st.error(feedback_text)
+
+        st.button("다음 손님 계산하기", on_click=start_new_question, args=(state,))
+
+    # 현재 점수
+    st.markdown("---")
+    st.info(f"현재 계산한 손님 수: {state.score} / {TARGET_SCORE}")
+
+# ----- AI 훈련 모드 -----
+# engine.regression은 NumPy를 쓰므로 게임 모드만 하는 세션이 불러오지 않도록 훈련 모드 안에서만 불러옵니다.
+def get_training_state():
+    """AI 훈련 모드의 세션 상태 객체를 가져옵니다. (없으면 세션 저장소에서 읽거나 새로 만듭니다)"""
+    from engine.regression import TrainingState
+    return get_session_state(TRAINING_KEY, TrainingState)
+
+def on_teach(state):
+    """'가르치기' 버튼 콜백: 예시 하나로 모델 계수를 바로 고칩니다. (처음부터 다시 맞추지 않습니다)"""
+    from engine.regression import teach
+    size = st.session_state[f"train_size_{state.input_key}"]
+    items = st.session_state[f"train_items_{state.input_key}"]
+    price = st.session_state[f"train_price_{state.input_key}"]
+    if price is not None:
+        teach(state, size, items, price)
+
+def on_add_item(state):
+    from engine.regression import add_item
+    add_item(state, st.session_state.get('train_new_item', ''))
+    st.session_state['train_new_item'] = ''
+
+def on_sample(state, count):
+    import numpy as np
+    from engine.regression import sample_examples
+    sample_examples(state, count, np.random.default_rng(state.rng.seed + state.model.count))
+
+def item_label(items):
+    return " + ".join(items) if items else "❌ 없음"
+
+@st.fragment
+def training_area():
+    """
+    플레이어가 예시를 하나씩 가르치면 AI(재귀 최소제곱 회귀)가 가격 규칙을 배웁니다.
+    세션에는 계수와 작은 행렬만 있으므로 예시가 수천 개여도 다시 그리는 시간이 같습니다.
+    """
+    from engine.regression import estimates, next_order, predict_order, true_price
+    state = get_training_state()
+
+    st.subheader("🧠 AI에게 가격을 가르쳐 주세요")
+    col1, col2, col3 = st.columns([1, 2, 1])
+    col1.number_input("바구니 크기", min_value=1, max_value=99, value=3, key=f"train_size_{state.input_key}")
+    col2.multiselect("들어있는 것", state.item_names, key=f"train_items_{state.input_key}")
+    col3.number_input("가격 (원)", min_value=0, step=5, value=None, key=f"train_price_{state.input_key}")
+    st.button("📚 가르치기", on_click=on_teach, args=(state,))
+
+    with st.expander("간식 종류 더하기 / 예시 자동으로 넣기"):
+        st.text_input("새 간식 이름", key='train_new_item')
+        st.button("➕ 간식 더하기", on_click=on_add_item, args=(state,))
+        st.button("🎲 정해진 규칙으로 예시 100개 넣기", on_click=on_sample, args=(state, 100))
+
+    st.markdown("---")
+    st.subheader(f"🤖 AI가 지금까지 배운 것 (예시 {state.model.count}개)")
+    st.markdown("\n".join(f"- {name}: **{weight:,.1f}원**" for name, weight in estimates(state).items()))
+    if state.recent:
+        st.caption("최근 예시: " + " / ".join(
+            f"{size}칸, {item_label(items)} → {price}원" for size, items, price in state.recent))
+
+    st.markdown("---")
+    size, items = state.order
+    st.header("📦 이번 손님 주문!")
+    st.info(f"바구니 크기: {size}  ·  들어있는 것: {item_label(items)}")
+    st.success(f"🤖 AI의 예상 가격: **{predict_order(state):,.0f}원**  (실제 규칙으로는 {true_price(size, items)}원)")
+    st.button("다음 손님", on_click=next_order, args=(state,))
+
+    save_state(TRAINING_KEY)
+
+# 실행
+if __name__ == "__main__":
+    basket_game()
+
@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# 게임 스크립트(number-pattern.py 등)와 engine 패키지를 저장소 루트에서 불러옵니다.
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
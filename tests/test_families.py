@@ -0,0 +1,37 @@
+"""항을 미리 만들어 두지 않는 수열 가족 (engine.families)"""
+import pytest
+
+from engine.families import Alternating, Arithmetic, Geometric, LinearRecurrence, Quadratic, SequenceFamily
+
+
+def test_base_class_is_abstract():
+    with pytest.raises(TypeError):
+        SequenceFamily()
+
+    class NoRule(SequenceFamily):
+        def term(self, n):
+            return n
+
+    with pytest.raises(TypeError):
+        NoRule()
+
+
+@pytest.mark.parametrize('family, expected', [
+    (Arithmetic(3, 3), [3, 6, 9, 12, 15]),
+    (Geometric(2, 3), [2, 6, 18, 54, 162]),
+    (Quadratic(1, 1, 1), [1, 3, 7, 13, 21]),
+    (LinearRecurrence((1, 1), (2, 1)), [2, 1, 3, 4, 7]),
+    (Alternating(Arithmetic(1, 2), Arithmetic(10, 10)), [1, 10, 3, 20, 5]),
+])
+def test_terms(family, expected):
+    assert family.terms(0, 5) == expected
+    assert [family.term(n) for n in range(5)] == expected
+    assert family.rule_desc()
+
+
+def test_far_term_matches_iteration():
+    fibonacci = LinearRecurrence((1, 1), (1, 1))
+    a, b = 1, 1
+    for _ in range(500):
+        a, b = b, a + b
+    assert fibonacci.term(500) == a
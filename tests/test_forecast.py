@@ -0,0 +1,48 @@
+"""날씨 예측기 (engine.forecast)"""
+import numpy as np
+import pytest
+
+from engine.forecast import add_noise, forecast, minimal_period, periodic_history, transition_counts
+
+
+@pytest.mark.parametrize('word', [[0], [0, 1], [0, 1, 2], [2, 2, 1], [0, 1, 1, 2, 0]])
+def test_minimal_period(word):
+    history, _ = periodic_history(word, 30)
+    assert minimal_period(history) == len(word)
+
+
+def test_no_period():
+    assert minimal_period([0, 1, 2, 2, 1, 0, 0]) is None
+    assert minimal_period([1]) is None
+
+
+def test_transition_counts():
+    counts = transition_counts([0, 1, 0, 1, 2], 1)
+    assert counts.sum() == 4
+    assert counts[0, 1] == 2 and counts[1, 0] == 1 and counts[1, 2] == 1
+
+
+@pytest.mark.parametrize('word', [[0, 1], [0, 1, 2], [2, 0, 0]])
+def test_forecast_periodic_history(word):
+    history, next_weather = periodic_history(word, 6)
+    probabilities, period = forecast(history)
+    assert period == len(word)
+    assert probabilities.sum() == pytest.approx(1.0)
+    assert int(np.argmax(probabilities)) == next_weather
+    assert probabilities[next_weather] < 1.0  # 6일짜리 이력으로는 지나치게 확신하지 않습니다.
+
+
+def test_forecast_tolerates_noise():
+    rng = np.random.default_rng(3)
+    history, next_weather = periodic_history([0, 1, 2], 24)
+    noisy = add_noise(history, 0.1, rng)
+    assert minimal_period(noisy) != 3
+    probabilities, period = forecast(noisy, tolerance=0.3)
+    assert period == 3
+    assert int(np.argmax(probabilities)) == next_weather
+
+
+def test_forecast_markov_order():
+    probabilities, period = forecast([0, 1, 0, 1, 0], order=1)
+    assert period is None
+    assert int(np.argmax(probabilities)) == 1
@@ -0,0 +1,50 @@
+"""Streamlit 없이 엔진만으로 세 게임을 끝까지 진행합니다."""
+import pytest
+
+from engine import number_pattern, price, weather
+
+
+def play(game, state, answer):
+    turns = 0
+    while state.game_state != 'victory':
+        game.start_new_question(state)
+        assert state.game_state == 'playing'
+        assert game.submit_answer(state, answer(state))
+        turns += 1
+    return turns
+
+
+def test_number_pattern_victory():
+    state = number_pattern.NumberPatternState(seed=1)
+    turns = play(number_pattern, state, lambda s: number_pattern.correct_answer(number_pattern.get_question(s.question_id)))
+    assert turns == number_pattern.TARGET_SCORE
+
+
+@pytest.mark.parametrize('noisy', [False, True])
+def test_weather_victory(noisy):
+    state = weather.WeatherState(seed=1, noisy=noisy)
+    turns = play(weather, state, lambda s: weather.question_history(s)[1])
+    assert turns == weather.TARGET_SCORE
+
+
+def test_price_victory():
+    state = price.PriceState()
+    turns = play(price, state, lambda s: price.generate_step_data(s.step)[3])
+    assert turns == price.TARGET_SCORE
+    assert state.step == price.TARGET_SCORE
+
+
+def test_wrong_answer_keeps_score():
+    state = number_pattern.NumberPatternState(seed=1)
+    number_pattern.start_new_question(state)
+    answer = number_pattern.correct_answer(number_pattern.get_question(state.question_id))
+    assert not number_pattern.submit_answer(state, answer + 1)
+    assert state.score == 0 and state.game_state == 'finished'
+
+
+@pytest.mark.parametrize('game', [number_pattern, weather])
+def test_replay_questions(game):
+    first = game.replay_questions(42, 30)
+    assert first == game.replay_questions(42, 30)
+    assert first != game.replay_questions(43, 30)
+    assert len(set(first)) == len(first)
@@ -0,0 +1,45 @@
+"""답안지 채점 (engine.grading)"""
+import io
+
+from engine import number_pattern, price, weather
+from engine.grading import grade_file
+
+NAME = weather.pattern_name(0)
+ANSWER = weather.NEXT_WEATHER[0]
+
+
+def grade(text):
+    return grade_file(io.BytesIO(text.encode('utf-8')), 'answers.csv')
+
+
+def test_grade_file():
+    a1 = number_pattern.correct_answer(number_pattern.get_question('A1'))
+    step1 = price.generate_step_data(1)[3]
+    rows, scores = grade(
+        "학생,게임,문제,답\n"
+        f"kim,number-pattern,A1,{a1}\n"
+        f"kim,Number-Pattern ,A1,{a1 + 1}\n"
+        f"kim,price,1,\"{step1:,}\"\n"
+        f"lee,weather,{NAME},{weather.WEATHER_EMOJIS[ANSWER]}\n"
+        f"lee,WEATHER,{NAME},{weather.WEATHER_NAMES[ANSWER]}\n"
+        f"lee,weather,{NAME},{(ANSWER + 1) % 3}\n"
+    )
+    assert rows['is_correct'].tolist() == [True, False, True, True, True, False]
+    # 대소문자와 공백이 다른 게임 이름도 한 게임으로 묶입니다.
+    assert scores[['student', 'game', 'attempts', 'correct']].values.tolist() == [
+        ['kim', 'number-pattern', 2, 1],
+        ['kim', 'price', 1, 1],
+        ['lee', 'weather', 3, 2],
+    ]
+
+
+def test_unknown_questions_are_wrong():
+    rows, _ = grade(
+        "student,game,question,answer\n"
+        "kim,price,0,0\n"
+        f"kim,price,{price.TARGET_SCORE + 1},0\n"
+        "kim,number-pattern,N999999999,0\n"
+        "kim,chess,1,0\n"
+    )
+    assert not rows['is_correct'].any()
+    assert rows['correct_answer'].isna().all()
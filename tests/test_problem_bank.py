@@ -0,0 +1,51 @@
+"""이진 문제 은행 (engine.problem_bank) 만들기와 다시 읽기"""
+import numpy as np
+import pytest
+
+from engine import weather
+from engine.price import FIXED_STEPS, generate_step_data, make_generated_step
+from engine.problem_bank import BANK_HISTORY_LENGTH, BANK_MAX_PERIOD, ProblemBank, build
+from engine.sequences import generate_problem_batch
+
+CANDIDATES = 2000
+SEED = 5
+PRICE_STEPS = FIXED_STEPS + 2
+
+
+@pytest.fixture(scope='module')
+def bank(tmp_path_factory):
+    path = tmp_path_factory.mktemp('bank') / 'problems.bank'
+    build(str(path), CANDIDATES, SEED, PRICE_STEPS)
+    return ProblemBank(str(path))
+
+
+def test_sequence_batch_round_trip(bank):
+    expected = generate_problem_batch(CANDIDATES, seed=SEED)
+    stored = bank.sequence_batch()
+    assert stored.keys() == expected.keys()
+    for name, values in expected.items():
+        np.testing.assert_array_equal(stored[name], values)
+
+
+def test_weather_index_round_trip(bank):
+    expected = weather.build_pattern_index(BANK_HISTORY_LENGTH, BANK_MAX_PERIOD)
+    for name, values in bank.weather_index().items():
+        np.testing.assert_array_equal(values, expected[name])
+    names, descriptions = bank.weather_strings()
+    assert names == list(weather.PATTERN_NAMES)
+    assert descriptions == list(weather.PATTERN_DESCRIPTIONS)
+
+
+def test_price_steps_round_trip(bank):
+    for step in range(1, PRICE_STEPS + 1):
+        expected = generate_step_data(step) if step <= FIXED_STEPS else make_generated_step(step)
+        assert bank.price_step(step) == expected
+    assert bank.price_step(0) is None
+    assert bank.price_step(PRICE_STEPS + 1) is None
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'not.bank'
+    path.write_bytes(b'\0' * 64)
+    with pytest.raises(ValueError):
+        ProblemBank(str(path))
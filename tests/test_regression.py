@@ -0,0 +1,51 @@
+"""가격 추론 AI 훈련 모드의 온라인 회귀 (engine.regression)"""
+import numpy as np
+
+from engine.price import ITEM_PRICE
+from engine.regression import (RecursiveLeastSquares, TrainingState, add_item, estimates, sample_examples, teach,
+                               true_price)
+
+
+def test_rls_matches_least_squares():
+    rng = np.random.default_rng(0)
+    features = rng.normal(size=(200, 4))
+    targets = features @ np.array([3.0, -1.0, 0.5, 2.0]) + rng.normal(scale=0.1, size=200)
+    model = RecursiveLeastSquares(4)
+    for x, y in zip(features, targets):
+        model.update(x, y)
+    expected = np.linalg.lstsq(features, targets, rcond=None)[0]
+    np.testing.assert_allclose(model.weights, expected, atol=1e-4)
+    assert model.count == 200
+
+
+def test_add_feature_keeps_learned_weights():
+    model = RecursiveLeastSquares(1)
+    for size in range(1, 10):
+        model.update([size], size * 100)
+    learned = model.weights[0]
+    model.add_feature()
+    assert model.weights.tolist() == [learned, 0.0]
+    assert model.covariance.shape == (2, 2)
+    for size in range(1, 10):
+        model.update([size, size % 2], size * 100 + 30 * (size % 2))
+    np.testing.assert_allclose(model.weights, [100, 30], atol=1e-3)
+
+
+def test_sample_examples_learns_price_rule():
+    state = TrainingState(seed=1)
+    sample_examples(state, 50, np.random.default_rng(1))
+    learned = estimates(state)
+    assert abs(learned['바구니 1칸'] - 100) < 1e-3
+    for name, price in ITEM_PRICE.items():
+        assert abs(learned[name] - price) < 1e-3
+    assert len(state.recent) == 5
+
+
+def test_added_item_is_worth_nothing():
+    state = TrainingState(seed=2)
+    assert add_item(state, ' 🍪 쿠키 ')
+    assert not add_item(state, '🍪 쿠키')
+    for size in range(1, 10):
+        for items in ((), ('🍪 쿠키',), ('🍬 사탕', '🍪 쿠키')):
+            teach(state, size, list(items), true_price(size, items))
+    assert abs(estimates(state)['🍪 쿠키']) < 1e-3
@@ -0,0 +1,38 @@
+"""겹치지 않는 문제 순서 (engine.scheduler)"""
+import pytest
+
+from engine.scheduler import QuestionOrder, permute
+
+
+@pytest.mark.parametrize('size', [1, 2, 3, 10, 17, 64, 1000, 58_045])
+@pytest.mark.parametrize('key', [0, 1, 12345, (1 << 64) - 1])
+def test_permute_is_bijection(size, key):
+    assert sorted(permute(i, size, key) for i in range(size)) == list(range(size))
+
+
+def test_permute_depends_on_key():
+    size = 1000
+    orders = {tuple(permute(i, size, key) for i in range(size)) for key in range(5)}
+    assert len(orders) == 5
+
+
+@pytest.mark.parametrize('index, size', [(-1, 10), (10, 10), (0, 0)])
+def test_permute_out_of_range(index, size):
+    with pytest.raises(IndexError):
+        permute(index, size, 0)
+
+
+def test_question_order_runs_out():
+    order = QuestionOrder(7)
+    drawn = [order.next(5) for _ in range(5)]
+    assert sorted(drawn) == list(range(5))
+    assert order.remaining(5) == 0
+    assert order.next(5) is None
+
+
+def test_question_order_cycles_with_new_order():
+    order = QuestionOrder(7)
+    first = [order.next(50, cycle=True) for _ in range(50)]
+    second = [order.next(50, cycle=True) for _ in range(50)]
+    assert sorted(first) == sorted(second) == list(range(50))
+    assert first != second
@@ -0,0 +1,45 @@
+"""세 게임을 AppTest로 풀면서 정답 한 문제당 스크립트 실행 횟수가 한도를 넘지 않는지 확인합니다."""
+import pytest
+from streamlit.runtime.scriptrunner import script_runner
+from streamlit.testing.v1 import AppTest
+
+from conftest import ROOT
+
+APPS = ['number-pattern.py', 'weather.py', 'price.py']
+QUESTIONS = 2  # 목표 점수에 닿지 않도록 승리 전까지만 풉니다.
+MAX_INIT_RUNS = 1  # 첫 화면
+MAX_RUNS_PER_ANSWER = 2  # 정답 제출 1번 + 다음 문제 1번
+
+
+@pytest.fixture
+def script_runs(monkeypatch):
+    """이 테스트 동안 시작된 스크립트 실행 목록"""
+    runs = []
+    original_init = script_runner.ScriptRunner.__init__
+
+    def on_event(sender, event, **kwargs):
+        if event == script_runner.ScriptRunnerEvent.SCRIPT_STARTED:
+            runs.append(event)
+
+    def init(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        self.on_event.connect(on_event, weak=False)
+
+    monkeypatch.setattr(script_runner.ScriptRunner, '__init__', init)
+    return runs
+
+
+@pytest.mark.parametrize('filename', APPS)
+def test_runs_per_answer(filename, script_runs):
+    at = AppTest.from_file(str(ROOT / filename), default_timeout=60).run()
+    assert len(script_runs) <= MAX_INIT_RUNS
+
+    start = len(script_runs)
+    for _ in range(QUESTIONS):
+        submitted = len(script_runs)
+        at.button[0].click().run()  # 🚀 정답 제출
+        # 채점은 콜백에서 끝나므로 st.rerun() 없이 한 번만 실행됩니다.
+        assert len(script_runs) - submitted == 1
+        at.button[-1].click().run()  # 다음 문제
+    assert not at.exception
+    assert (len(script_runs) - start) / QUESTIONS <= MAX_RUNS_PER_ANSWER
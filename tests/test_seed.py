@@ -0,0 +1,39 @@
+"""주소의 ?seed= 게임 번호가 다시 시작한 게임에도 이어지는지 확인합니다."""
+from streamlit.testing.v1 import AppTest
+
+from conftest import ROOT
+from engine import number_pattern
+
+SEED = 42
+
+
+def open_app(filename):
+    at = AppTest.from_file(str(ROOT / filename), default_timeout=60)
+    at.query_params['seed'] = str(SEED)
+    return at.run()
+
+
+def test_number_pattern_reset_keeps_seed():
+    at = open_app('number-pattern.py')
+    first = at.session_state['number_pattern_state'].question_id
+    assert [first] == number_pattern.replay_questions(SEED, 1)
+    while at.session_state['number_pattern_state'].game_state != 'victory':
+        state = at.session_state['number_pattern_state']
+        at.number_input[0].set_value(number_pattern.correct_answer(number_pattern.get_question(state.question_id)))
+        at.button[0].click().run()  # 🚀 정답 제출
+        if at.session_state['number_pattern_state'].game_state == 'finished':
+            at.button[-1].click().run()  # 다음 문제
+    at.button(key='reset_game').click().run()
+    state = at.session_state['number_pattern_state']
+    assert state.order.key == SEED
+    assert state.question_id == first
+
+
+def test_weather_mode_change_keeps_seed():
+    at = open_app('weather.py')
+    first = at.session_state['weather_state'].pattern_id
+    at.toggle(key='weather_noisy').set_value(True).run()
+    state = at.session_state['weather_state']
+    assert state.noisy
+    assert state.rng.seed == SEED
+    assert state.pattern_id == first
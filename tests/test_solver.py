@@ -0,0 +1,9 @@
+"""출제된 문제를 모두 풀 수 있는지 (engine.solver)"""
+from engine import solver
+
+
+def test_all_problems_solvable():
+    report = solver.run(1000, 20)
+    for section in report['sections']:
+        assert section['counts'] == {'ok': section['checked']}, section
+    assert report['symbol_problems'] == []
@@ -1,215 +1,216 @@
-import streamlit as st
-import random
-
-# 전역 상수 설정
-WEATHER_EMOJIS = ['☀️', '🌧️', '☁️']
-HISTORY_LENGTH = 6  # 과거 6일
-TARGET_SCORE = 3
-
-# 6가지 명확한 시퀀스 규칙 정의
-# 키(Key): 패턴 이름, 값(Value): [시퀀스 리스트, 다음 예측 날씨, 규칙 설명]
-RULES = {
-    "R1_비비맑음반복": [['🌧️', '🌧️', '☀️'], '🌧️', "비(2회) - 맑음(1회) 패턴이 반복됩니다."],
-    "R2_구비맑음반복": [['☁️', '🌧️️', '☀️'], '☁️', "구름 - 비 - 맑음 패턴이 반복됩니다."],
-    "R3_맑구름반복": [['☀️', '☁️'], '☀️', "맑음 - 구름 패턴이 반복됩니다."],
-    "R4_비구름반복": [['🌧️', '☁️', '☁️'], '🌧️', "비(1회) - 구름(2회) 패턴이 반복됩니다."],
-    "R5_역순구름": [['☁️', '☀️', '🌧️'], '☁️', "구름 - 맑음 - 비의 역순 패턴이 반복됩니다."],
-    "R6_비맑음맑음": [['🌧️', '☀️', '☀️'], '🌧️', "비(1회) - 맑음(2회) 패턴이 반복됩니다."],
-}
-
-def generate_weather_history(last_rule_name):
-    """
-    6가지 규칙 중 하나를 선택하여 과거 6일의 날씨 이력을 생성합니다.
-    (이전에 사용된 규칙은 제외하고 선택합니다.)
-    """
-    
-    # 사용 가능한 규칙 목록을 만듭니다 (이전에 사용된 규칙은 제외).
-    available_rules = list(RULES.keys())
-    
-    # 규칙이 2개 이상일 경우에만 마지막 규칙을 제외
-    if last_rule_name and len(available_rules) > 1:
-        # 안전하게 제거: last_rule_name이 실제로 available_rules에 있는지 확인
-        if last_rule_name in available_rules:
-             available_rules.remove(last_rule_name)
-    
-    # 1. 사용할 규칙 무작위 선택
-    rule_name = random.choice(available_rules)
-    sequence, _, _ = RULES[rule_name]
-    
-    sequence_len = len(sequence)
-    
-    # 2. 과거 6일 이력 생성
-    history = []
-    # 패턴을 HISTORY_LENGTH 만큼 반복하여 생성
-    for i in range(HISTORY_LENGTH):
-        history.append(sequence[i % sequence_len])
-        
-    # 3. 정답 (내일 날씨) 결정
-    # 다음 순서는 패턴의 길이(sequence_len)로 나눈 나머지 인덱스
-    correct_forecast = sequence[HISTORY_LENGTH % sequence_len] 
-    
-    return history, correct_forecast, rule_name
-
-
-def get_forecast_and_rule(correct_forecast, rule_name):
-    """결정된 규칙 정보를 반환합니다."""
-    
-    _, _, rule_description = RULES[rule_name]
-    
-    # 1. 정답 날씨의 확률을 100%로 설정
-    probabilities = {correct_forecast: 1.0}
-    
-    # 2. 나머지 날씨를 찾아 0%로 설정
-    other_emojis = [w for w in WEATHER_EMOJIS if w != correct_forecast]
-    
-    for emoji in other_emojis:
-        probabilities[emoji] = 0.0
-
-    # 3. 확률이 0보다 큰 값만 남김
-    final_probabilities = {k: v for k, v in probabilities.items() if v > 0}
-    
-    return correct_forecast, final_probabilities, rule_description
-
-
-def start_new_question():
-    """새로운 문제 생성 및 상태 저장을 위한 헬퍼 함수"""
-    
-    # 마지막으로 사용된 규칙 이름을 가져옵니다. (초기 실행 시는 None)
-    last_rule_name = st.session_state.get('last_rule_name')
-
-    weather_history, correct_forecast_raw, rule_name = generate_weather_history(last_rule_name)
-    
-    # 새로운 규칙 이름을 'last_rule_name'으로 저장 (중복 방지)
-    st.session_state.last_rule_name = rule_name
-    
-    correct_forecast, probabilities, rule_description = get_forecast_and_rule(
-        correct_forecast_raw, rule_name)
-    
-    # 상태 저장
-    st.session_state.correct_answer = correct_forecast
-    st.session_state.weather_history = weather_history
-    st.session_state.probabilities = probabilities
-    st.session_state.rule_description = rule_description
-    
-    st.session_state.game_state = 'playing'
-    st.session_state.feedback = ""
-    st.session_state.input_key = random.random()
-
-def pattern_robot_web_game():
-    st.set_page_config(layout="centered")
-    
-    # --- 제목 및 설명 ---
-    st.title("☀️ 날씨 트렌드 추론 AI ")
-    st.markdown(f"#### AI의 추론 능력을 길러주자! ")
-    
-    st.markdown(f"##### 과거 6일의 날씨를 보고 다음 날씨를 예측하세요.  {TARGET_SCORE}번 정답을 맞히면 승리합니다.")
-    st.markdown("---")
-    
-    # 1. 게임 상태 관리 및 초기화
-    if 'game_state' not in st.session_state:
-        st.session_state.game_state = 'init'
-        st.session_state.score = 0
-        st.session_state.target_score = TARGET_SCORE
-        # last_rule_name은 start_new_question에서 초기화됨
-        start_new_question() 
-        st.rerun()
-
-    # '다시 시작' 버튼 로직 (승리 후)
-    if st.session_state.game_state == 'victory' and st.button("🔄 게임 처음부터 다시 시작", key="reset_game"): 
-        st.session_state.game_state = 'init'
-        st.session_state.score = 0
-        del st.session_state['last_rule_name'] # 규칙 중복 방지 기록 초기화
-        start_new_question()
-        st.rerun()
-
-    # --- 문제 표시 ---
-    if st.session_state.game_state == 'playing':
-        st.header(f"👀 과거 {HISTORY_LENGTH}일간의 날씨 트렌드: ({st.session_state.score + 1}번째 문제)")
-        
-        # 날씨 이모지 크기를 키워서 표시 
-        history_str_large = ' '.join([f'<span style="font-size: 40px;">{emo}</span>' for emo in st.session_state.weather_history])
-        st.markdown(f"**과거 날씨 (6일 전 → 어제):**")
-        st.markdown(history_str_large, unsafe_allow_html=True)
-        
-        st.success(f"## 내일 날씨는?")
-        
-        # --- 사용자 예측 (입력) ---
-        user_guess = st.radio(
-            "내일 날씨를 선택하세요:", 
-            WEATHER_EMOJIS,
-            key=st.session_state.input_key
-        )
-        
-        # 정답 제출 버튼
-        if st.button("🚀 정답 제출"):
-            st.session_state.user_guess = user_guess
-            st.session_state.game_state = 'checking'
-            st.rerun() 
-
-    # --- 피드백 처리 및 표시 ---
-    if st.session_state.game_state == 'checking':
-        
-        user_guess = st.session_state.user_guess
-        
-        # 3. 피드백 및 결과 확인
-        is_correct = (user_guess == st.session_state.correct_answer)
-        if is_correct:
-            st.session_state.score += 1
-            st.session_state.feedback = f"🎉 **정답입니다!** 패턴을 정확히 찾았어요!"
-            st.session_state.feedback_type = 'success'
-        else:
-            st.session_state.feedback = f"❌ **틀렸어요.** 정답은 **{st.session_state.correct_answer}** 였어요."
-            st.session_state.feedback_type = 'error'
-        
-        # 피드백 내용 구성 
-        feedback_text = st.session_state.feedback
-        feedback_text += f"\n\n**✅ 규칙:** 이 문제에 숨어있던 패턴은 **{st.session_state.rule_description}** 였습니다."
-        
-        # 피드백 표시
-        if st.session_state.feedback_type == 'success':
-            st.balloons()
-            st.success(feedback_text)
-        else:
-            st.error(feedback_text)
-        
-        st.session_state.game_state = 'finished'
-    
-    # 'finished' 상태일 때 다음 문제 또는 승리 화면 표시
-    if st.session_state.game_state == 'finished':
-        
-        # 승리 조건 체크
-        if st.session_state.score >= st.session_state.target_score:
-            st.session_state.game_state = 'victory'
-            st.rerun() 
-        else:
-            # 새로운 문제 시작 버튼 표시
-            st.markdown("---")
-            if st.button("✨ 새로운 문제 시작", key="new_game_finished_button"):
-                start_new_question()
-                st.rerun()
-
-    # --- 승리 화면 ---
-    if st.session_state.game_state == 'victory':
-        st.success("🏆🏆🏆 게임 승리! 🏆🏆🏆")
-        st.header(f"🎉 축하합니다! 목표인 {st.session_state.target_score}문제를 모두 맞혔어요!")
-        
-        # 힌트 문구 출력 위치를 명확히 했습니다.
-        st.warning("""
-        **💡 힌트 문장: 용암으로 둘러져있다.
-        """)
-        
-        # 힌트 문구가 출력된 후, 안내 문구를 추가합니다.
-        st.markdown(f"""
-        (이 문장을 메모장 등에 기록해두세요!)
-        \n게임을 다시 시작하려면 위에 있는 **'게임 처음부터 다시 시작'** 버튼을 눌러주세요.
-        """)
-
-
-    # --- 점수판 표시 ---
-    st.markdown("---")
-    st.info(f"🏆 **현재 점수:** {st.session_state.score} / {st.session_state.target_score}점")
-
-if __name__ == "__main__":
-    pattern_robot_web_game()
-
-
+import streamlit as st
+
+# 문제 생성/채점/상태 전이는 engine 패키지가 맡고, 이 파일은 화면만 그립니다.
+from engine.weather import (
+    HISTORY_LENGTH, NOISY_HISTORY_LENGTH, TARGET_SCORE, WEATHER_EMOJIS, WeatherState,
+    build_weather_history, get_forecast_and_rule, pattern_description, pattern_name, question_history,
+    start_new_question, submit_answer,
+)
+from engine.answer_log import get_answer_log
+from engine.metrics import RENDER_PHASES, get_metrics
+from engine.render_cache import RENDER_CACHE
+from game_session import get_session_state, requested_seed, save_state, session_id
+
+GAME = 'weather'
+STATE_KEY = 'weather_state'
+
+# 계측: GAME_METRICS_PATH가 없으면 아무 일도 하지 않고 엔진 함수도 그대로 씁니다.
+METRICS = get_metrics()
+start_new_question = METRICS.wrap(GAME, 'start_new_question', start_new_question)
+submit_answer = METRICS.wrap(GAME, 'grading', submit_answer)
+ANSWER_LOG = get_answer_log()  # GAME_ANSWER_LOG가 없으면 기록하지 않습니다.
+
+
+def get_state():
+    """
+    이 게임의 세션 상태 객체를 가져옵니다. (없으면 세션 저장소에서 읽거나 새로 만듭니다)
+    주소에 ?seed=게임번호 를 붙이면 그 게임의 패턴 순서를 그대로 다시 풀 수 있습니다.
+    """
+    return get_session_state(STATE_KEY, lambda: WeatherState(TARGET_SCORE, seed=requested_seed()))
+
+
+def guess_key(state):
+    """문제마다 새로 만들어지는 입력 위젯의 키"""
+    return f"weather_guess_{state.input_key}"
+
+
+def on_submit(state):
+    """'정답 제출' 버튼 콜백: 채점과 승리 판정을 스크립트 실행 전에 끝냅니다."""
+    guess = st.session_state[guess_key(state)]
+    is_correct = submit_answer(state, guess)
+    # 잡음 모드는 난이도가 다르므로 문제별 통계에서 따로 셉니다.
+    question = pattern_name(state.pattern_id) + ('/noisy' if state.noisy else '')
+    ANSWER_LOG.record(GAME, question, guess, is_correct, state.shown_at)
+
+
+def on_reset():
+    """
+    점수와 규칙 중복 방지 기록을 초기화하고 첫 문제를 준비합니다.
+    모드는 그대로 두고, ?seed=가 있으면 그 게임의 패턴 순서로 다시 시작합니다.
+    """
+    state = st.session_state[STATE_KEY] = WeatherState(TARGET_SCORE, seed=requested_seed(), noisy=get_state().noisy)
+    start_new_question(state)
+
+
+def on_noisy_change():
+    """잡음 모드를 켜거나 끄면 그 모드로 새 게임을 시작합니다."""
+    state = st.session_state[STATE_KEY] = WeatherState(TARGET_SCORE, seed=requested_seed(),
+                                                       noisy=st.session_state['weather_noisy'])
+    start_new_question(state)
+
+
+def history_markup(pattern_id):
+    """과거 날씨 이모지를 크게 그리는 HTML (패턴마다 한 번만 만들어 세션끼리 공유합니다)"""
+    weather_history, _ = build_weather_history(pattern_id)
+    return ' '.join([f'<span style="font-size: 40px;">{emo}</span>' for emo in weather_history])
+
+
+def noisy_history_markup(codes):
+    """잡음 모드의 긴 이력 (세션마다 다르므로 캐시하지 않고, 한 줄에 6일씩 조금 작게 그립니다)"""
+    days = [f'<span style="font-size: 28px;">{WEATHER_EMOJIS[code]}</span>' for code in codes.tolist()]
+    return '<br>'.join(' '.join(days[i:i + HISTORY_LENGTH]) for i in range(0, len(days), HISTORY_LENGTH))
+
+
+def forecast_markup(state):
+    """예측기(engine.forecast)가 과거 이력만 보고 낸 날씨별 확률과 찾은 주기"""
+    _, probabilities, period, _ = get_forecast_and_rule(state)
+    parts = " · ".join(f"{emoji} {p:.0%}" for emoji, p in zip(WEATHER_EMOJIS, probabilities.tolist()))
+    found = f"{period}일마다 반복" if period else "반복을 찾지 못함"
+    return f"🤖 **AI 예보** (과거 이력만 보고 계산): {parts}  ({found})"
+
+
+def feedback_markup(state):
+    """
+    채점 결과 문구 (패턴, 모드, 정답 여부마다 한 번만 만듭니다)
+    정답은 채점과 같은 question_history에서 꺼냅니다. (잡음 모드는 이력이 길어서 내일 날씨가 다를 수 있습니다)
+    """
+    if state.is_correct:
+        feedback_text = f"🎉 **정답입니다!** 패턴을 정확히 찾았어요!"
+    else:
+        correct_answer = WEATHER_EMOJIS[question_history(state)[1]]
+        feedback_text = f"❌ **틀렸어요.** 정답은 **{correct_answer}** 였어요."
+
+    # 피드백 내용 구성
+    feedback_text += f"\n\n**✅ 규칙:** 이 문제에 숨어있던 패턴은 **{pattern_description(state.pattern_id)}** 였습니다."
+    return feedback_text
+
+
+def pattern_robot_web_game():
+    st.set_page_config(layout="centered")
+    
+    # --- 제목 및 설명 ---
+    st.title("☀️ 날씨 트렌드 추론 AI ")
+    st.markdown(f"#### AI의 추론 능력을 길러주자! ")
+    
+    st.markdown(f"##### 과거 날씨를 보고 다음 날씨를 예측하세요.  {TARGET_SCORE}번 정답을 맞히면 승리합니다.")
+    st.toggle(f"🌦️ 잡음 모드: {NOISY_HISTORY_LENGTH}일 이력에 가끔 규칙과 다른 날씨가 섞여요",
+              value=get_state().noisy, key='weather_noisy', on_change=on_noisy_change)
+    st.markdown("---")
+    
+    game_area()
+
+
+@st.fragment
+def game_area():
+    """
+    문제/정답 영역. 버튼은 모두 콜백으로 상태를 바꾸므로 st.rerun() 없이
+    한 번의 실행으로 채점 결과까지 그리고, 다시 그릴 때도 이 영역만 다시 실행됩니다.
+    """
+    METRICS.count_run(GAME, session_id())
+
+    # 1. 게임 상태 관리 및 초기화
+    with METRICS.phase(GAME, 'init'):
+        state = get_state()
+        if state.game_state == 'init':
+            start_new_question(state)
+
+    with METRICS.phase(GAME, RENDER_PHASES[state.game_state]):
+        draw_game(state)
+
+    save_state(STATE_KEY)
+
+
+def draw_game(state):
+    """현재 게임 상태에 맞는 화면을 그립니다."""
+
+    # '다시 시작' 버튼 로직 (승리 후)
+    if state.game_state == 'victory':
+        st.button("🔄 게임 처음부터 다시 시작", key="reset_game", on_click=on_reset)
+
+    # --- 문제 표시 ---
+    if state.game_state == 'playing':
+        days = NOISY_HISTORY_LENGTH if state.noisy else HISTORY_LENGTH
+        st.header(f"👀 과거 {days}일간의 날씨 트렌드: ({state.score + 1}번째 문제)")
+        
+        # 날씨 이모지 크기를 키워서 표시 (날씨 코드는 여기서만 이모지로 바꿉니다)
+        if state.noisy:
+            history_str_large = noisy_history_markup(question_history(state)[0])
+        else:
+            history_str_large = RENDER_CACHE.get(('weather', 'history', state.pattern_id),
+                                                 history_markup, state.pattern_id)
+        st.markdown(f"**과거 날씨 ({days}일 전 → 어제):**")
+        st.markdown(history_str_large, unsafe_allow_html=True)
+        
+        st.success(f"## 내일 날씨는?")
+        
+        # --- 사용자 예측 (입력) ---
+        st.radio(
+            "내일 날씨를 선택하세요:", 
+            range(len(WEATHER_EMOJIS)),
+            format_func=WEATHER_EMOJIS.__getitem__,
+            key=guess_key(state)
+        )
+        
+        # 정답 제출 버튼 - 채점은 콜백에서 처리되어 리런이 필요 없습니다
+        st.button("🚀 정답 제출", on_click=on_submit, args=(state,))
+
+    # --- 피드백 표시 및 다음 문제 ---
+    if state.game_state == 'finished':
+        
+        feedback_text = RENDER_CACHE.get(('weather', 'feedback', state.pattern_id, state.noisy, state.is_correct),
+                                         feedback_markup, state)
+        
+        # 피드백 표시
+        if state.is_correct:
+            st.balloons()
+            st.success(feedback_text)
+        else:
+            st.error(feedback_text)
+
+        # 잡음 모드의 이력은 세션마다 다르므로 예보는 보통 모드에서만 패턴별로 캐시합니다.
+        if state.noisy:
+            st.info(forecast_markup(state))
+        else:
+            st.info(RENDER_CACHE.get(('weather', 'forecast', state.pattern_id), forecast_markup, state))
+        
+        # 새로운 문제 시작 버튼 표시
+        st.markdown("---")
+        st.button("✨ 새로운 문제 시작", key="new_game_finished_button",
+                  on_click=start_new_question, args=(state,))
+
+    # --- 승리 화면 ---
+    if state.game_state == 'victory':
+        st.success("🏆🏆🏆 게임 승리! 🏆🏆🏆")
+        st.header(f"🎉 축하합니다! 목표인 {state.target_score}문제를 모두 맞혔어요!")
+        
+        # 힌트 문구 출력 위치를 명확히 했습니다.
+        st.warning("""
+        **💡 힌트 문장: 용암으로 둘러져있다.
+        """)
+        
+        # 힌트 문구가 출력된 후, 안내 문구를 추가합니다.
+        st.markdown(f"""
+        (이 문장을 메모장 등에 기록해두세요!)
+        \n게임을 다시 시작하려면 위에 있는 **'게임 처음부터 다시 시작'** 버튼을 눌러주세요.
+        """)
+
+
+    # --- 점수판 표시 ---
+    st.markdown("---")
+    st.info(f"🏆 **현재 점수:** {state.score} / {state.target_score}점")
+    st.caption(f"게임 번호: {state.rng.seed}")
+
+if __name__ == "__main__":
+    pattern_robot_web_game()
+
+